@@ -3,16 +3,56 @@ Celery 애플리케이션 설정
 백그라운드 작업 및 스케줄링을 담당합니다.
 """
 
-from celery import Celery
+from datetime import datetime
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+import orjson
+from celery import Celery, signals
 from celery.schedules import crontab
+from kombu.serialization import register
 
+# 설정은 워커 부모 프로세스에서 한 번만 로드되고, prefork 자식 프로세스는 fork로 상속받음
+# (worker_max_tasks_per_child로 자식이 교체되어도 .env를 다시 파싱하지 않음)
 from app.backend.core.config import settings
+from app.backend.core import database
 from app.backend.core.logging import get_logger, setup_logging
 
 # 로깅 설정
 setup_logging()
 logger = get_logger(__name__)
 
+# 스케줄 기준 시간대 (매 스케줄 계산마다 tz 조회를 하지 않도록 미리 생성)
+KST = ZoneInfo("Asia/Seoul")
+
+
+def _now_kst() -> datetime:
+    """Beat 스케줄용 현재 시각 (KST)"""
+    return datetime.now(KST)
+
+
+def _orjson_default(obj: object) -> str:
+    """orjson이 직렬화하지 못하는 타입 변환 (Decimal은 정밀도 보존을 위해 문자열로)"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _orjson_dumps(obj: object) -> bytes:
+    return orjson.dumps(obj, default=_orjson_default)
+
+
+# orjson 코덱은 별도 content type으로 등록
+# (application/json으로 등록하면 kombu 기본 json 디코더가 프로세스 전체에서 교체되어
+#  json 메시지의 datetime/Decimal 타입 정보가 복원되지 않음)
+register(
+    "orjson",
+    _orjson_dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="utf-8",
+)
+
 # Celery 앱 생성
 celery_app = Celery(
     "alpha_ai",
@@ -27,14 +67,15 @@ celery_app = Celery(
 
 # Celery 설정
 celery_app.conf.update(
-    # 작업 설정
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # 작업 설정 (msgpack: datetime은 ISO 문자열/epoch로 변환해서 전달)
+    task_serializer="msgpack",
+    accept_content=["msgpack", "orjson", "json"],  # JSON 메시지는 전환 기간 동안 허용
+    result_serializer="msgpack",
     timezone="Asia/Seoul",
     enable_utc=True,
     
     # 작업 라우팅
+    task_default_queue="default",
     task_routes={
         "app.backend.workers.bot.*": {"queue": "bot"},
         "app.backend.workers.scheduler.*": {"queue": "scheduler"},
@@ -44,17 +85,29 @@ celery_app.conf.update(
     # 작업 실행 설정
     task_acks_late=True,
     task_reject_on_worker_lost=True,
-    task_track_started=True,
-    task_time_limit=300,  # 5분
-    task_soft_time_limit=240,  # 4분
+    task_track_started=settings.debug,  # STARTED 상태는 디버깅 시에만 기록
+    task_time_limit=settings.celery_task_time_limit,  # 5분
+    task_soft_time_limit=settings.celery_task_soft_time_limit,  # 4분
     
     # 워커 설정
+    # KIS API 호출처럼 오래 걸리는 I/O 작업이 많으므로 prefetch는 1로 고정
+    # (기본값 4는 긴 작업 뒤에 예약된 작업들이 대기하는 문제 발생, 워커는 -Ofair로 실행)
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=100,
     worker_disable_rate_limits=False,
     
+    # 브로커 설정
+    # acks_late 작업이 실행 중 재전달되지 않도록 visibility_timeout을 하드 타임아웃보다 길게 설정
+    broker_transport_options={"visibility_timeout": settings.celery_task_time_limit + 60},
+    broker_pool_limit=100,
+    broker_connection_retry_on_startup=True,  # Redis 일시 장애 시 재시도 (크래시 루프 방지)
+    broker_connection_max_retries=10,
+    redis_socket_keepalive=True,
+    redis_retry_on_timeout=True,
+    result_backend_transport_options={"retry_on_timeout": True},
+    
     # 결과 백엔드 설정
-    result_expires=3600,  # 1시간
+    result_expires=300,  # 5분 (스케줄 작업은 ignore_result로 결과를 저장하지 않음)
     
     # 동기 실행 (테스트용)
     task_always_eager=settings.celery_task_always_eager,
@@ -62,43 +115,58 @@ celery_app.conf.update(
 )
 
 # Celery Beat 스케줄 설정
+# 스케줄 작업의 결과는 조회하지 않으므로 결과 백엔드에 저장하지 않음 (ignore_result)
+# 주기가 짧은 작업은 expires를 지정해 워커 재시작 등으로 밀린 작업이 쌓이지 않도록 함
 celery_app.conf.beat_schedule = {
     # 미국 장 시작 전 준비 (KST 22:00, 서머타임 21:00)
     "prepare_us_market_open": {
         "task": "app.backend.workers.scheduler.prepare_market_open",
-        "schedule": crontab(hour=22, minute=0),
+        "schedule": crontab(hour=22, minute=0, nowfun=_now_kst),
         "args": ("US",),
+        "options": {"ignore_result": True},
     },
     
     # 미국 장 종료 후 정리 (KST 06:30, 서머타임 05:30)
     "cleanup_us_market_close": {
         "task": "app.backend.workers.scheduler.cleanup_market_close",
-        "schedule": crontab(hour=6, minute=30),
+        "schedule": crontab(hour=6, minute=30, nowfun=_now_kst),
         "args": ("US",),
+        "options": {"ignore_result": True},
     },
     
     # 계좌 헬스체크 (5분마다)
     "account_health_check": {
         "task": "app.backend.workers.scheduler.check_account_health",
-        "schedule": crontab(minute="*/5"),
+        "schedule": crontab(minute="*/5", nowfun=_now_kst),
+        "options": {"ignore_result": True, "expires": 60},
     },
     
     # 토큰 갱신 체크 (30분마다)
     "token_refresh_check": {
         "task": "app.backend.workers.scheduler.refresh_tokens",
-        "schedule": crontab(minute="*/30"),
+        "schedule": crontab(minute="*/30", nowfun=_now_kst),
+        "options": {"ignore_result": True, "expires": 300},
     },
     
     # 미체결 주문 정리 (1시간마다)
     "cleanup_pending_orders": {
         "task": "app.backend.workers.scheduler.cleanup_pending_orders",
-        "schedule": crontab(minute=0),
+        "schedule": crontab(minute=0, nowfun=_now_kst),
+        "options": {"ignore_result": True},
+    },
+    
+    # 월별 파티션 생성 및 보존 기간 지난 파티션 삭제 (매일 새벽 4시)
+    "maintain_partitions": {
+        "task": "app.backend.celery_app.maintain_partitions",
+        "schedule": crontab(hour=4, minute=0, nowfun=_now_kst),
+        "options": {"ignore_result": True},
     },
     
     # 일일 리포트 생성 (매일 오전 9시)
     "daily_report": {
         "task": "app.backend.workers.scheduler.generate_daily_report",
-        "schedule": crontab(hour=9, minute=0),
+        "schedule": crontab(hour=9, minute=0, nowfun=_now_kst),
+        "options": {"ignore_result": True},
     },
 }
 
@@ -106,30 +174,49 @@ celery_app.conf.beat_schedule = {
 @celery_app.task(bind=True)
 def debug_task(self):
     """디버그 태스크"""
-    logger.info(f"Request: {self.request!r}")
+    logger.info("Request: %r", self.request)
     return "pong"
 
 
+@celery_app.task
+def maintain_partitions():
+    """월별 파티션 관리 (execution_logs, strategy_signals)"""
+    return database.maintain_partitions()
+
+
 # Celery 시그널 핸들러
-@celery_app.signals.task_failure.connect
+@signals.task_failure.connect
 def task_failure_handler(sender=None, task_id=None, exception=None, **kwargs):
     """작업 실패 핸들러"""
-    logger.error(f"Task {sender.name} ({task_id}) failed: {exception}")
+    logger.error("Task %s (%s) failed: %s", sender.name, task_id, exception)
 
 
-@celery_app.signals.task_retry.connect
+@signals.task_retry.connect
 def task_retry_handler(sender=None, task_id=None, reason=None, **kwargs):
     """작업 재시도 핸들러"""
-    logger.warning(f"Task {sender.name} ({task_id}) retrying: {reason}")
+    logger.warning("Task %s (%s) retrying: %s", sender.name, task_id, reason)
 
 
-@celery_app.signals.worker_ready.connect
+@signals.worker_ready.connect
 def worker_ready_handler(sender=None, **kwargs):
     """워커 준비 완료 핸들러"""
-    logger.info(f"Worker {sender.hostname} is ready")
+    logger.info("Worker %s is ready", sender.hostname)
 
 
-@celery_app.signals.worker_shutdown.connect
+@signals.worker_shutdown.connect
 def worker_shutdown_handler(sender=None, **kwargs):
     """워커 종료 핸들러"""
-    logger.info(f"Worker {sender.hostname} is shutting down")
+    logger.info("Worker %s is shutting down", sender.hostname)
+
+
+@signals.worker_process_init.connect
+def worker_process_init_handler(**kwargs):
+    """
+    prefork 자식 프로세스 초기화 핸들러
+    부모 프로세스에서 상속받은 커넥션 풀을 버리고 자식 프로세스에서 새로 연결하도록 합니다.
+    (close=False: 부모가 사용 중인 소켓은 닫지 않음)
+    """
+    if database.sync_engine:
+        database.sync_engine.dispose(close=False)
+    if database.async_engine:
+        database.async_engine.sync_engine.dispose(close=False)
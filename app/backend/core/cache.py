@@ -0,0 +1,38 @@
+"""
+Redis 캐시 연결 관리
+프로세스 간 공유가 필요한 값(KIS 토큰 등)을 저장하는 비동기 Redis 클라이언트를 제공합니다.
+"""
+
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from app.backend.core.config import settings
+
+# 전역 Redis 클라이언트 (첫 사용 시 생성)
+_redis: Optional[aioredis.Redis] = None
+
+
+def get_redis() -> aioredis.Redis:
+    """
+    전역 비동기 Redis 클라이언트 반환
+    
+    Returns:
+        redis.asyncio.Redis 인스턴스
+    """
+    global _redis
+    if _redis is None:
+        _redis = aioredis.from_url(
+            settings.redis_url,
+            socket_timeout=settings.redis_socket_timeout,
+            socket_connect_timeout=settings.redis_socket_connect_timeout,
+        )
+    return _redis
+
+
+async def close_redis() -> None:
+    """Redis 연결 종료"""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
@@ -4,23 +4,27 @@
 """
 
 import os
-from functools import lru_cache
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Optional
 
 from pydantic import Field, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# 프로젝트 루트의 .env 파일 경로 (import 시 한 번만 계산)
+_ENV_FILE = Path(__file__).resolve().parents[3] / ".env"
+
+# 읽을 .env 파일 목록: 프로젝트 루트, 현재 디렉토리
+# 프로젝트 루트에서 실행하면 두 경로가 같으므로 중복을 제거해 같은 파일을 두 번 파싱하지 않음
+_ENV_FILES = tuple(dict.fromkeys([_ENV_FILE, Path(".env").resolve()]))
+
 
 class Settings(BaseSettings):
     """애플리케이션 전역 설정"""
     
     model_config = SettingsConfigDict(
-        # 프로젝트 루트의 .env 파일을 명시적으로 지정
-        env_file=[
-            Path(__file__).parent.parent.parent.parent / ".env",  # 프로젝트 루트
-            ".env",  # 현재 디렉토리
-        ],
+        # 프로젝트 루트 및 현재 디렉토리의 .env 파일
+        env_file=_ENV_FILES,
         env_ignore_empty=True,
         extra="ignore",
     )
@@ -40,6 +44,11 @@ class Settings(BaseSettings):
     # CORS 설정
     cors_origins: list[str] = ["http://localhost:3000"]
     
+    @property
+    def cors_origins_set(self) -> frozenset[str]:
+        """CORS 허용 origin 집합 (미들웨어의 origin 검사를 O(1)로)"""
+        return frozenset(self.cors_origins)
+    
     # Supabase 데이터베이스 (개별 변수 방식)
     host: Optional[str] = Field(None, description="Database host")
     port: Optional[str] = Field("5432", description="Database port") 
@@ -66,12 +75,17 @@ class Settings(BaseSettings):
     
     # Redis 설정
     redis_url: str = "redis://localhost:6379/0"
+    redis_socket_timeout: float = 1.0  # 명령 응답 대기 시간 (초, Redis 장애 시 호출자가 오래 막히지 않도록)
+    redis_socket_connect_timeout: float = 1.0  # 연결 대기 시간 (초)
     
     # KIS API 설정
     kis_app_key: SecretStr = Field(..., description="KIS API App Key")
     kis_app_secret: SecretStr = Field(..., description="KIS API App Secret")
     kis_account_no: str = Field(..., description="KIS 계좌번호 (끝 2자리 상품코드 포함)")
     kis_use_sandbox: bool = True
+    # 여러 호스트의 워커가 토큰을 공유할 때만 Redis 공유 캐시/발급 펜스 사용
+    # (단일 호스트는 토큰 캐시 파일 락으로 프로세스 간 발급이 조율됨)
+    kis_shared_token_cache: bool = False
     
     # KIS API 엔드포인트
     @property
@@ -99,16 +113,24 @@ class Settings(BaseSettings):
     )
     jwt_algorithm: str = "HS256"
     jwt_expiration_minutes: int = 60 * 24 * 7  # 7일
+    bcrypt_rounds: int = 12  # bcrypt 비용 인자 (라운드)
+    bcrypt_calibrate_target_ms: Optional[int] = None  # 설정 시 시작할 때 해시 1회 지연이 이 값 이하가 되도록 라운드 보정
     
     # Celery 설정
     celery_broker_url: str = Field(default="redis://localhost:6379/0")
     celery_result_backend: str = Field(default="redis://localhost:6379/0")
     celery_task_always_eager: bool = False  # 테스트용 (True면 동기 실행)
+    celery_task_time_limit: int = 300  # 작업 하드 타임아웃 (초)
+    celery_task_soft_time_limit: int = 240  # 작업 소프트 타임아웃 (초)
     
     # 로깅 설정
     log_level: str = Field(default="INFO", pattern="^(DEBUG|INFO|WARNING|ERROR|CRITICAL)$")
     log_format: str = "json"  # "json" or "text"
     
+    # 파티션 관리 (execution_logs, strategy_signals 월별 파티션)
+    partition_months_ahead: int = 2  # 미리 생성해 둘 다음 달 파티션 수
+    partition_retention_months: int = 12  # 보존 기간 (이보다 오래된 월 파티션은 삭제)
+    
     # 트레이딩 설정
     max_daily_trades: int = 100  # 일일 최대 거래 횟수
     max_position_per_symbol: float = 10000  # 종목당 최대 포지션 금액 (USD)
@@ -136,27 +158,124 @@ class Settings(BaseSettings):
         return v
 
 
-@lru_cache
-def get_settings() -> Settings:
+@dataclass(frozen=True, slots=True)
+class RuntimeSettings:
     """
-    설정 싱글톤 인스턴스 반환
-    @lru_cache를 사용하여 한 번만 로드
+    런타임용 읽기 전용 설정
+    검증이 끝난 Settings 값과 파생 값(database_url 등)을 일반 속성으로 담아 속성 접근 시 property 호출이 없습니다.
+    필드는 Settings와 같은 이름/타입을 유지해야 합니다.
     """
+    
+    # 애플리케이션 설정
+    app_name: str
+    app_version: str
+    environment: str
+    debug: bool
+    
+    # API 서버 설정
+    backend_host: str
+    backend_port: int
+    backend_url: str
+    frontend_url: str
+    
+    # CORS 설정
+    cors_origins: list[str]
+    cors_origins_set: frozenset[str]
+    
+    # 데이터베이스
+    host: Optional[str]
+    port: Optional[str]
+    dbname: Optional[str]
+    user: Optional[str]
+    password: Optional[SecretStr]
+    supabase_db_url: Optional[str]
+    supabase_project_url: Optional[str]
+    supabase_anon_key: Optional[SecretStr]
+    supabase_service_role_key: Optional[SecretStr]
+    database_url: Optional[str]
+    
+    # Redis 설정
+    redis_url: str
+    redis_socket_timeout: float
+    redis_socket_connect_timeout: float
+    
+    # KIS API 설정
+    kis_app_key: SecretStr
+    kis_app_secret: SecretStr
+    kis_account_no: str
+    kis_use_sandbox: bool
+    kis_shared_token_cache: bool
+    kis_base_url: str
+    kis_ws_url: str
+    
+    # 보안 설정
+    encryption_key: SecretStr
+    jwt_secret_key: SecretStr
+    jwt_algorithm: str
+    jwt_expiration_minutes: int
+    bcrypt_rounds: int
+    bcrypt_calibrate_target_ms: Optional[int]
+    
+    # Celery 설정
+    celery_broker_url: str
+    celery_result_backend: str
+    celery_task_always_eager: bool
+    celery_task_time_limit: int
+    celery_task_soft_time_limit: int
+    
+    # 로깅 설정
+    log_level: str
+    log_format: str
+    
+    # 파티션 관리
+    partition_months_ahead: int
+    partition_retention_months: int
+    
+    # 트레이딩 설정
+    max_daily_trades: int
+    max_position_per_symbol: float
+    default_cooldown_seconds: int
+    order_retry_max_attempts: int
+    
+    # 미국 시장 거래 시간 (KST 기준)
+    us_market_open_kst: str
+    us_market_close_kst: str
+
+
+def _to_runtime_settings(settings_instance: Settings) -> RuntimeSettings:
+    """검증된 Settings를 RuntimeSettings로 변환 (파생 값 포함)"""
+    return RuntimeSettings(**{
+        field.name: getattr(settings_instance, field.name)
+        for field in fields(RuntimeSettings)
+    })
+
+
+def _load_settings() -> RuntimeSettings:
+    """환경 변수/.env에서 설정을 로드하고 검증합니다."""
     settings_instance = Settings()
     
-    # 디버그: .env 파일 로딩 상태 확인
-    if settings_instance.environment == "development":
-        env_file_path = Path(__file__).parent.parent.parent.parent / ".env"
-        
-        # 생성된 URL 확인
-        db_url = settings_instance.database_url
-        if db_url:
-            print(f"🔗 생성된 DB URL: {db_url}")
+    # 디버그: .env 파일 로딩 상태 확인 (ALPHA_AI_DEBUG_CONFIG 설정 시에만, 자격증명은 출력하지 않음)
+    if os.getenv("ALPHA_AI_DEBUG_CONFIG"):
+        print(f"🔧 .env 파일: {_ENV_FILE} (존재: {_ENV_FILE.exists()})")
+        if settings_instance.database_url:
+            print("🔗 데이터베이스 URL 생성됨")
         else:
             print("❌ 데이터베이스 URL 생성 실패")
     
-    return settings_instance
+    return _to_runtime_settings(settings_instance)
+
+
+# 프로세스 수명 동안 변하지 않는 설정 (import 시 한 번만 로드)
+_SETTINGS = _load_settings()
+
+
+def get_settings() -> RuntimeSettings:
+    """
+    설정 싱글톤 인스턴스 반환
+    FastAPI Depends(get_settings)에서도 캐시 조회 없이 바로 반환합니다.
+    """
+    return _SETTINGS
 
 
-# 전역 설정 인스턴스
-settings = get_settings()
+# 전역 설정 인스턴스 (RuntimeSettings; 값 검증은 로드 시 Settings에서 수행)
+settings = _SETTINGS
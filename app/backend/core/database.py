@@ -3,20 +3,94 @@
 Supabase PostgreSQL 데이터베이스와 SQLAlchemy ORM을 사용합니다.
 """
 
+import os
+import time
+import uuid
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from enum import Enum
+from typing import Any, AsyncGenerator, Mapping, Optional, Sequence
 
-from sqlalchemy import create_engine
+from sqlalchemy import SmallInteger, create_engine, text
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from app.backend.core.config import settings
+from app.backend.core.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 # SQLAlchemy Base 클래스
 class Base(DeclarativeBase):
     """모든 ORM 모델의 기본 클래스"""
-    pass
+    
+    # 서버 기본값(now())/생성 컬럼을 INSERT·UPDATE RETURNING으로 즉시 가져옴
+    # (async 세션에서 만료된 속성의 지연 로드를 막기 위함)
+    __mapper_args__ = {"eager_defaults": True}
+
+
+def uuid7() -> uuid.UUID:
+    """
+    시간 순서 UUID(v7, RFC 9562) 생성
+    상위 48비트가 밀리초 타임스탬프라 새 행이 PK/FK 인덱스 끝에 추가되어 B-Tree 페이지 분할이 줄어듭니다.
+    컬럼 타입은 기존 UUID와 동일합니다.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | (0x7 << 76)  # 버전 7
+    value = value & ~(0x3 << 62) | (0x2 << 62)  # RFC 9562 variant
+    return uuid.UUID(int=value)
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    문자열 Enum을 SMALLINT 코드로 저장하는 컬럼 타입
+    Postgres ENUM 대비 인덱스가 작고, 코드 순서를 이용한 범위 조건(level >= 40 등)이 가능합니다.
+    
+    Args:
+        enum_class: Python Enum 클래스
+        codes: Enum 멤버 → 저장 코드 매핑 (코드는 한 번 정하면 변경 금지)
+    """
+    
+    impl = SmallInteger
+    cache_ok = True
+    
+    def __init__(self, enum_class: type[Enum], codes: Mapping[Enum, int]):
+        super().__init__()
+        self.enum_class = enum_class
+        self._to_code = dict(codes)
+        self._from_code = {code: member for member, code in codes.items()}
+    
+    def process_bind_param(self, value: Optional[Enum], dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return self._to_code[self.enum_class(value)]
+    
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[Enum]:
+        if value is None:
+            return None
+        return self._from_code[value]
+    
+    @property
+    def python_type(self) -> type[Enum]:
+        return self.enum_class
+
+
+# 헬스체크용 쿼리 (매 호출마다 새로 만들지 않도록 모듈 레벨에서 생성)
+_HEALTHCHECK_STMT = text("SELECT 1")
+
+# created_at 기준 월별 RANGE 파티션 테이블
+PARTITIONED_TABLES = ("execution_logs", "strategy_signals")
+
+# 파티션 관리 함수 호출 (함수 정의는 supabase_init.sql / 마이그레이션 c7d25e9f4a18)
+_CREATE_PARTITIONS_STMT = text(
+    "SELECT create_monthly_partitions("
+    ":table, now()::date, (now() + make_interval(months => :months_ahead))::date)"
+)
+_DROP_PARTITIONS_STMT = text(
+    "SELECT drop_monthly_partitions_before("
+    ":table, (date_trunc('month', now()) - make_interval(months => :retention_months))::date)"
+)
 
 
 # 비동기 엔진 생성 (환경 변수가 있을 때만)
@@ -26,7 +100,7 @@ sync_engine = None
 try:
     database_url = settings.database_url
     if database_url and "postgresql" in database_url:
-        print(f"🔗 데이터베이스 URL 생성됨: {database_url[:50]}...")
+        logger.info("Creating database engines")
         
         async_engine = create_async_engine(
             database_url,
@@ -35,10 +109,17 @@ try:
             max_overflow=10,
             pool_pre_ping=True,  # 연결 상태 확인
             pool_recycle=3600,  # 1시간마다 연결 재생성
+            connect_args={
+                # 짧은 OLTP 쿼리에서는 JIT 컴파일 비용이 이득보다 큼
+                "server_settings": {"jit": "off"},
+                # SQLAlchemy(asyncpg dialect) / asyncpg 드라이버 prepared statement 캐시
+                "prepared_statement_cache_size": 512,
+                "statement_cache_size": 1024,
+            },
         )
 
         # 동기 엔진 생성 (마이그레이션용) - asyncpg를 psycopg2로 변경
-        sync_url = database_url.replace("postgresql+asyncpg://", "postgresql://")
+        sync_url = database_url.replace("postgresql+asyncpg://", "postgresql+psycopg2://")
         sync_engine = create_engine(
             sync_url,
             echo=settings.debug,
@@ -46,9 +127,14 @@ try:
             max_overflow=5,
             pool_pre_ping=True,
             pool_recycle=3600,
+            connect_args={"options": "-c jit=off"},
+            # 다건 INSERT는 VALUES 묶음으로, UPDATE/DELETE는 execute_batch로 전송
+            executemany_mode="values_plus_batch",
+            insertmanyvalues_page_size=1000,
+            executemany_batch_page_size=500,
         )
 except Exception as e:
-    print(f"⚠️ Database engine creation failed: {e}. Running without database.")
+    logger.warning("Database engine creation failed: %s. Running without database.", e)
 
 # 비동기 세션 팩토리
 AsyncSessionLocal = None
@@ -90,7 +176,7 @@ async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
             await session.commit()
         except Exception as e:
             await session.rollback()
-            print(f"❌ Database session error: {e}")
+            logger.error("Database session error: %s", e)
             raise
         finally:
             await session.close()
@@ -112,7 +198,7 @@ def get_sync_db() -> Session:
     except Exception as e:
         session.rollback()
         session.close()
-        print(f"❌ Database session error: {e}")
+        logger.error("Database session error: %s", e)
         raise
 
 
@@ -134,12 +220,77 @@ async def async_db_context() -> AsyncGenerator[AsyncSession, None]:
             await session.commit()
         except Exception as e:
             await session.rollback()
-            print(f"❌ Database transaction error: {e}")
+            logger.error("Database transaction error: %s", e)
             raise
         finally:
             await session.close()
 
 
+async def bulk_copy(
+    table_name: str,
+    columns: Sequence[str],
+    rows: Sequence[tuple[Any, ...]],
+) -> int:
+    """
+    asyncpg COPY 프로토콜로 대량 행을 삽입합니다.
+    ORM add_all + flush 대비 훨씬 빠르므로 시세 데이터 등 대량 적재에 사용합니다.
+    
+    Args:
+        table_name: 대상 테이블명
+        columns: 컬럼명 목록 (rows의 튜플 순서와 동일)
+        rows: 삽입할 행 목록
+    
+    Returns:
+        삽입된 행 수
+    
+    Example:
+        await bulk_copy("execution_logs", ["id", "account_id", "message"], rows)
+    """
+    if not async_engine:
+        raise RuntimeError("Database not initialized")
+    
+    if not rows:
+        return 0
+    
+    async with async_engine.begin() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            table_name,
+            records=rows,
+            columns=list(columns),
+        )
+    
+    return len(rows)
+
+
+def maintain_partitions() -> int:
+    """
+    월별 파티션을 관리합니다. (Celery beat에서 매일 실행)
+    다음 달 파티션을 미리 만들어 DEFAULT 파티션에 행이 쌓이지 않게 하고,
+    보존 기간이 지난 월 파티션은 DELETE 대신 DROP으로 제거합니다.
+    
+    Returns:
+        삭제된 파티션 수
+    """
+    if not sync_engine:
+        raise RuntimeError("Database not initialized")
+    
+    dropped = 0
+    with sync_engine.begin() as conn:
+        for table in PARTITIONED_TABLES:
+            conn.execute(
+                _CREATE_PARTITIONS_STMT,
+                {"table": table, "months_ahead": settings.partition_months_ahead},
+            )
+            dropped += conn.execute(
+                _DROP_PARTITIONS_STMT,
+                {"table": table, "retention_months": settings.partition_retention_months},
+            ).scalar_one()
+    
+    logger.info("Partition maintenance done: %d expired partitions dropped", dropped)
+    return dropped
+
+
 async def check_db_connection() -> bool:
     """
     데이터베이스 연결 상태를 확인합니다.
@@ -148,19 +299,18 @@ async def check_db_connection() -> bool:
         연결 성공 시 True, 실패 시 False
     """
     if not async_engine:
-        print("❌ Database engine not configured")
+        logger.error("Database engine not configured")
         return False
         
     try:
         async with async_engine.begin() as conn:
             # 간단한 쿼리로 연결 테스트
-            from sqlalchemy import text
-            result = await conn.execute(text("SELECT 1"))
+            result = await conn.execute(_HEALTHCHECK_STMT)
             result.scalar()
-            print("✅ Database connection successful")
+            logger.info("Database connection successful")
             return True
     except Exception as e:
-        print(f"❌ Database connection failed: {e}")
+        logger.error("Database connection failed: %s", e)
         return False
 
 
@@ -170,22 +320,22 @@ async def init_db() -> None:
     서버 시작 시 데이터베이스 연결 상태만 확인합니다.
     """
     if not async_engine:
-        print("❌ Database engine not available")
+        logger.error("Database engine not available")
         return
     
     # 데이터베이스 연결 상태 확인
     connection_ok = await check_db_connection()
     if not connection_ok:
-        print("❌ Database connection verification failed")
+        logger.error("Database connection verification failed")
         return
         
-    print("✅ Database connection verified")
+    logger.info("Database connection verified")
 
 
 async def close_db() -> None:
     """데이터베이스 연결 종료"""
     if async_engine:
         await async_engine.dispose()
-        print("✅ Database connections closed")
+        logger.info("Database connections closed")
     else:
-        print("ℹ️ No database connections to close")
+        logger.info("No database connections to close")
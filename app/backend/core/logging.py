@@ -3,17 +3,51 @@
 개발 환경에서는 사용자 친화적 포맷, 프로덕션에서는 JSON 형식의 로그를 생성합니다.
 """
 
+import atexit
+import copy
 import logging
+import logging.handlers
+import os
+import queue
+import select
 import sys
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
 import orjson
-from pythonjsonlogger import jsonlogger
 
 from app.backend.core.config import settings
 
+# setup_logging() 중복 호출 방지 플래그
+_CONFIGURED = False
 
-class ColoredFormatter(logging.Formatter):
+# 큐에 쌓인 로그를 실제 핸들러로 출력하는 백그라운드 리스너
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class CachedTimeFormatterMixin:
+    """
+    초 단위 타임스탬프 캐시 믹스인
+    같은 초에 발생한 로그는 strftime을 다시 호출하지 않고 캐시된 문자열을 사용합니다.
+    """
+    
+    _time_cache: tuple = (None, None, "")  # (초, datefmt, 포맷된 문자열)
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        # datefmt가 없으면 밀리초가 포함되므로 캐시하지 않음
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, cached_datefmt, cached_value = self._time_cache
+        if second == cached_second and datefmt == cached_datefmt:
+            return cached_value
+        
+        value = super().formatTime(record, datefmt)
+        self._time_cache = (second, datefmt, value)
+        return value
+
+
+class ColoredFormatter(CachedTimeFormatterMixin, logging.Formatter):
     """컬러 포맷터 - 개발 환경용 사용자 친화적 로그"""
     
     # ANSI 컬러 코드
@@ -26,63 +60,188 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'       # 리셋
     }
     
-    def format(self, record):
-        # 로그 레벨에 따른 색상 적용
-        color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
+    # 레벨별 이모지
+    EMOJIS = {
+        'DEBUG': '🔍',
+        'INFO': 'ℹ️',
+        'WARNING': '⚠️',
+        'ERROR': '❌',
+        'CRITICAL': '🚨'
+    }
+    
+    # INFO 메시지 내용에 따라 선택되는 이모지 (앞에 있을수록 우선)
+    INFO_EMOJIS = ('✅', '❌', '📋')
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 레벨(및 이모지)별 "] {emoji} {level}" 접미 문자열 미리 생성
         reset = self.COLORS['RESET']
+        self._level_suffix = {
+            (level, emoji): f"] {emoji} {level:<8}{reset} "
+            for level, default_emoji in self.EMOJIS.items()
+            for emoji in (default_emoji, *self.INFO_EMOJIS)
+        }
+    
+    def format(self, record):
+        levelname = record.levelname
+        msg = record.getMessage()
+        
+        # 로그 레벨에 따른 색상 / 이모지
+        color = self.COLORS.get(levelname, self.COLORS['RESET'])
+        emoji = self.EMOJIS.get(levelname, '')
+        if levelname == 'INFO':
+            emoji = next((e for e in self.INFO_EMOJIS if e in msg), emoji)
+        
+        suffix = self._level_suffix.get((levelname, emoji))
+        if suffix is None:
+            suffix = f"] {emoji} {levelname:<8}{self.COLORS['RESET']} "
         
         # 타임스탬프 (간소화)
         timestamp = self.formatTime(record, '%H:%M:%S')
         
         # 모듈명 간소화
         module = record.module
-        if len(module) > 12:
-            module = module[:12] + '...'
-            
-        # 이모지 추가
-        emoji_map = {
-            'DEBUG': '🔍',
-            'INFO': '✅' if '✅' in record.getMessage() else ('❌' if '❌' in record.getMessage() else '📋' if '📋' in record.getMessage() else 'ℹ️'),
-            'WARNING': '⚠️',
-            'ERROR': '❌',
-            'CRITICAL': '🚨'
-        }
-        emoji = emoji_map.get(record.levelname, '')
+        module = module[:12] + '...' if len(module) > 12 else module
         
         # 포맷된 로그 메시지
-        formatted = f"{color}[{timestamp}] {emoji} {record.levelname:<8}{reset} {module:<15} {record.getMessage()}"
-        
-        return formatted
+        return f"{color}[{timestamp}{suffix}{module:<15} {msg}"
+
+
+# LogRecord 기본 속성 (extra로 전달된 사용자 필드만 골라내기 위해 사용)
+_RESERVED_RECORD_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__
+) | {"message", "asctime"}
 
 
-class CustomJsonFormatter(jsonlogger.JsonFormatter):
-    """커스텀 JSON 로그 포매터"""
+class CustomJsonFormatter(CachedTimeFormatterMixin, logging.Formatter):
+    """
+    커스텀 JSON 로그 포매터
+    로그 레코드를 dict로 구성한 뒤 orjson으로 한 번에 직렬화합니다.
+    """
     
-    def add_fields(
-        self,
-        log_record: Dict[str, Any],
-        record: logging.LogRecord,
-        message_dict: Dict[str, Any]
-    ) -> None:
-        """로그 레코드에 추가 필드 삽입"""
-        super().add_fields(log_record, record, message_dict)
-        
-        # 타임스탬프 추가
-        log_record["timestamp"] = self.formatTime(record, self.datefmt)
-        
-        # 로그 레벨 이름 추가
-        log_record["level"] = record.levelname
-        
-        # 모듈 및 함수 정보 추가
-        log_record["module"] = record.module
-        log_record["function"] = record.funcName
+    def format(self, record: logging.LogRecord) -> str:
+        log_record: Dict[str, Any] = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "name": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "environment": settings.environment,
+        }
         
-        # 환경 정보 추가
-        log_record["environment"] = settings.environment
+        # extra로 전달된 필드 추가 (log_context 등)
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_RECORD_ATTRS:
+                log_record[key] = value
         
         # 예외 정보가 있으면 추가
         if record.exc_info:
             log_record["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_record["exc_info"] = record.exc_text
+        if record.stack_info:
+            log_record["stack_info"] = self.formatStack(record.stack_info)
+        
+        return orjson.dumps(log_record, default=str).decode()
+
+
+class _DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """
+    포맷을 리스너 스레드로 미루는 QueueHandler
+    기본 QueueHandler.prepare는 호출 스레드에서 format()을 수행하고 exc_info를 지우므로,
+    메시지 인자만 합친 레코드를 그대로 큐에 넣습니다.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        # 인자는 호출 시점 값으로 고정 (이후 변경되는 가변 객체 방지)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BatchedStreamHandler(logging.Handler):
+    """
+    여러 로그 레코드를 모아 한 번의 write 시스템 콜로 출력하는 핸들러
+    QueueListener 스레드에서 사용하며, 큐가 비었거나 버퍼가 가득 찼을 때 출력합니다.
+    """
+    
+    # 버퍼 최대 크기 (바이트)
+    MAX_BUFFER_BYTES = 64 * 1024
+    
+    def __init__(self, stream=None, drained: Optional[Callable[[], bool]] = None):
+        """
+        Args:
+            stream: 출력 스트림 (기본: sys.stdout)
+            drained: 입력 큐가 비었는지 확인하는 함수 (None이면 레코드마다 출력)
+        """
+        super().__init__()
+        self.stream = stream or sys.stdout
+        self._drained = drained
+        self._buffer = bytearray()
+        
+        # 파일 디스크립터가 있으면 os.write로 직접 출력
+        try:
+            self._fd: Optional[int] = self.stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            self._fd = None
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._buffer += self.format(record).encode("utf-8", "replace")
+            self._buffer += b"\n"
+        except Exception:
+            self.handleError(record)
+            return
+        
+        if len(self._buffer) >= self.MAX_BUFFER_BYTES or self._drained is None or self._drained():
+            self.flush()
+    
+    def flush(self) -> None:
+        """버퍼에 모인 로그를 한 번에 출력"""
+        with self.lock:
+            if not self._buffer:
+                return
+            data, self._buffer = self._buffer, bytearray()
+            view = memoryview(data)
+            try:
+                # print() 등으로 스트림 버퍼에 남은 내용을 먼저 내보내 순서 유지
+                self.stream.flush()
+                if self._fd is None:
+                    self.stream.write(data.decode("utf-8", "replace"))
+                    self.stream.flush()
+                    return
+                while view:
+                    try:
+                        written = os.write(self._fd, view)
+                    except BlockingIOError:
+                        # 논블로킹 fd의 버퍼가 가득 찬 경우 쓸 수 있을 때까지 대기 후 재시도
+                        select.select([], [self._fd], [])
+                        continue
+                    view = view[written:]
+            except Exception as e:
+                self._handle_write_error(e, len(view))
+    
+    def _handle_write_error(self, error: Exception, lost_bytes: int) -> None:
+        """
+        출력 실패를 stderr에 알림 (레코드 단위가 아니므로 handleError 대신 같은 형식으로 직접 출력)
+        
+        Args:
+            error: 발생한 예외
+            lost_bytes: 출력하지 못한 바이트 수
+        """
+        if not logging.raiseExceptions or sys.__stderr__ is None:
+            return
+        try:
+            sys.__stderr__.write(
+                f"--- Logging error ---\n"
+                f"{type(error).__name__}: {error} "
+                f"({lost_bytes} bytes of log output dropped by {self!r})\n"
+            )
+            sys.__stderr__.flush()
+        except Exception:
+            pass
 
 
 def setup_logging(
@@ -96,6 +255,11 @@ def setup_logging(
         log_level: 로그 레벨 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_format: 로그 형식 ("json" or "text")
     """
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    _CONFIGURED = True
+    
     log_level = log_level or settings.log_level
     log_format = log_format or settings.log_format
     
@@ -107,15 +271,15 @@ def setup_logging(
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
-    # 콘솔 핸들러 생성
-    console_handler = logging.StreamHandler(sys.stdout)
+    # 로그 호출 스레드는 큐에 넣기만 하고, 포맷/출력은 리스너 스레드에서 처리
+    log_queue = queue.SimpleQueue()
+    
+    # 콘솔 핸들러 생성 (큐가 빌 때까지 모은 로그를 한 번에 출력)
+    console_handler = BatchedStreamHandler(sys.stdout, drained=log_queue.empty)
     
     if log_format == "json":
         # JSON 포매터 설정 (프로덕션)
-        formatter = CustomJsonFormatter(
-            "%(timestamp)s %(level)s %(name)s %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
+        formatter = CustomJsonFormatter(datefmt="%Y-%m-%d %H:%M:%S")
     elif settings.environment == "development":
         # 개발 환경: 컬러 포매터 설정
         formatter = ColoredFormatter()
@@ -127,7 +291,18 @@ def setup_logging(
         )
     
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    
+    root_logger.addHandler(_DeferredFormatQueueHandler(log_queue))
+    _start_listener(log_queue, console_handler)
+    atexit.register(_stop_listener)
+    
+    # fork 시 (Celery prefork 등) 큐를 비운 뒤 부모/자식 프로세스에서 리스너를 각각 다시 시작
+    # (자식에는 리스너 스레드가 복제되지 않고, 남은 로그가 중복 출력되지 않도록 함)
+    os.register_at_fork(
+        before=_stop_listener,
+        after_in_parent=lambda: _start_listener(log_queue, console_handler),
+        after_in_child=lambda: _start_listener(log_queue, console_handler),
+    )
     
     # 외부 라이브러리 로그 레벨 조정
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -140,6 +315,21 @@ def setup_logging(
     logging.getLogger("celery.beat").setLevel(logging.INFO)
 
 
+def _start_listener(log_queue: queue.SimpleQueue, *handlers: logging.Handler) -> None:
+    """큐 리스너 시작"""
+    global _listener
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def _stop_listener() -> None:
+    """큐 리스너 종료 (남은 로그를 모두 출력한 뒤 종료)"""
+    if _listener:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.flush()
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     모듈별 로거 인스턴스 생성
@@ -166,7 +356,3 @@ def log_context(**kwargs) -> Dict[str, Any]:
         ))
     """
     return {"extra": kwargs}
-
-
-# 초기 로깅 설정
-setup_logging()
@@ -3,24 +3,55 @@
 비밀번호 해싱, JWT 토큰 생성/검증, 암호화 등을 처리합니다.
 """
 
-import secrets
+import asyncio
+import base64
+import binascii
+import os
+import re
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 import bcrypt
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import jwt
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 from .config import settings
+from .logging import get_logger
 
+logger = get_logger(__name__)
 
-# 비밀번호 해싱을 위한 컨텍스트 (bcrypt 호환성 문제 해결)
-pwd_context = CryptContext(
-    schemes=["bcrypt"], 
-    deprecated="auto",
-    bcrypt__rounds=12,  # bcrypt 라운드 설정
-    bcrypt__ident="2b"  # bcrypt 식별자 명시적 설정
-)
+
+# JWT 서명 키/알고리즘 (요청마다 SecretStr을 풀지 않도록 import 시 한 번만 읽음)
+_JWT_SECRET = settings.jwt_secret_key.get_secret_value()
+_JWT_ALG = settings.jwt_algorithm
+_JWT_ALGORITHMS = [_JWT_ALG]
+
+
+def refresh_jwt_secret(secret: Optional[str] = None, algorithm: Optional[str] = None) -> None:
+    """
+    캐시된 JWT 서명 키/알고리즘을 갱신합니다 (키 교체, 테스트용).
+    
+    Args:
+        secret: 새 서명 키 (기본: settings 값)
+        algorithm: 새 알고리즘 (기본: settings 값)
+    """
+    global _JWT_SECRET, _JWT_ALG, _JWT_ALGORITHMS
+    _JWT_SECRET = secret or settings.jwt_secret_key.get_secret_value()
+    _JWT_ALG = algorithm or settings.jwt_algorithm
+    _JWT_ALGORITHMS = [_JWT_ALG]
+
+
+# bcrypt 비용 인자 (calibrate_bcrypt_rounds로 시작 시 보정 가능)
+_bcrypt_rounds = settings.bcrypt_rounds
+
+# bcrypt는 앞 72바이트만 사용하므로 그 이상은 잘라서 전달
+_BCRYPT_MAX_BYTES = 72
+
+
+def _encode_password(password: str) -> bytes:
+    """비밀번호를 bcrypt 입력용 바이트로 변환"""
+    return password.encode("utf-8")[:_BCRYPT_MAX_BYTES]
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -34,7 +65,11 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         비밀번호 일치 여부
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(_encode_password(plain_password), hashed_password.encode("ascii"))
+    except ValueError:
+        # 잘못된 형식의 해시
+        return False
 
 
 def get_password_hash(password: str) -> str:
@@ -47,7 +82,57 @@ def get_password_hash(password: str) -> str:
     Returns:
         해시된 비밀번호
     """
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(_encode_password(password), bcrypt.gensalt(rounds=_bcrypt_rounds)).decode("ascii")
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    verify_password의 비동기 버전
+    bcrypt 검증은 CPU 바운드 작업이므로 스레드에서 실행해 이벤트 루프를 막지 않습니다.
+    """
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
+async def aget_password_hash(password: str) -> str:
+    """
+    get_password_hash의 비동기 버전 (스레드에서 해시 계산)
+    """
+    return await asyncio.to_thread(get_password_hash, password)
+
+
+def calibrate_bcrypt_rounds(target_ms: int = 250, min_rounds: int = 10, max_rounds: int = 16) -> int:
+    """
+    해시 1회 지연이 목표 시간 이하인 최대 bcrypt 라운드를 찾아 적용합니다.
+    시작 시 한 번만 호출하세요. 기존 해시는 해시에 기록된 라운드로 검증되므로 영향이 없습니다.
+    
+    Args:
+        target_ms: 해시 1회 목표 지연 (밀리초)
+        min_rounds: 최소 라운드 (측정 결과와 관계없이 이 값 이상 사용)
+        max_rounds: 최대 라운드
+        
+    Returns:
+        선택된 라운드
+    """
+    rounds = min_rounds
+    sample = b"calibrate-bcrypt-rounds"
+    
+    for cost in range(min_rounds, max_rounds + 1):
+        started = time.perf_counter()
+        bcrypt.hashpw(sample, bcrypt.gensalt(rounds=cost))
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        if elapsed_ms > target_ms:
+            break
+        rounds = cost
+        
+        # 라운드가 1 증가하면 비용이 2배가 되므로 다음 단계가 목표를 넘으면 측정 생략
+        if elapsed_ms * 2 > target_ms:
+            break
+    
+    global _bcrypt_rounds
+    _bcrypt_rounds = rounds
+    logger.info(f"bcrypt rounds calibrated: {rounds} (target {target_ms}ms)")
+    return rounds
 
 
 def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None) -> str:
@@ -63,17 +148,15 @@ def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None
     """
     to_encode = data.copy()
     
+    # iat/exp가 같은 기준 시각을 사용하도록 now()는 한 번만 호출
+    now = datetime.now(timezone.utc)
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.jwt_expiration_minutes)
-    
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, 
-        settings.jwt_secret_key.get_secret_value(), 
-        algorithm=settings.jwt_algorithm
-    )
+        expire = now + timedelta(minutes=settings.jwt_expiration_minutes)
+    
+    to_encode.update({"iat": now, "exp": expire})
+    encoded_jwt = jwt.encode(to_encode, _JWT_SECRET, algorithm=_JWT_ALG)
     return encoded_jwt
 
 
@@ -88,16 +171,16 @@ def verify_token(token: str) -> Union[dict, None]:
         토큰 페이로드 또는 None (검증 실패 시)
     """
     try:
-        payload = jwt.decode(
-            token, 
-            settings.jwt_secret_key.get_secret_value(), 
-            algorithms=[settings.jwt_algorithm]
-        )
+        payload = jwt.decode(token, _JWT_SECRET, algorithms=_JWT_ALGORITHMS)
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
 
+# 다른 모듈에서 사용하는 이름과 호환되도록 별칭 제공
+decode_token = verify_token
+
+
 def generate_reset_token() -> str:
     """
     비밀번호 재설정용 랜덤 토큰을 생성합니다.
@@ -105,7 +188,22 @@ def generate_reset_token() -> str:
     Returns:
         32바이트 랜덤 토큰 (hex 문자열)
     """
-    return secrets.token_hex(32)
+    return binascii.hexlify(os.urandom(32)).decode("ascii")
+
+
+# 비밀번호 강도 검사용 정규식 (문자 단위 Python 루프 대신 C 정규식 엔진으로 검사)
+_LOWERCASE_RE = re.compile(r"[a-z]")
+_DIGIT_RE = re.compile(r"\d")
+
+
+def _has_lowercase(password: str) -> bool:
+    """
+    소문자 포함 여부 (str.islower 기준, 비ASCII 소문자 포함)
+    ASCII 소문자는 정규식으로 먼저 찾고, 없을 때만 비ASCII 문자를 검사합니다.
+    """
+    if _LOWERCASE_RE.search(password):
+        return True
+    return not password.isascii() and any(c.islower() for c in password)
 
 
 def validate_password_strength(password: str) -> dict[str, Any]:
@@ -126,11 +224,11 @@ def validate_password_strength(password: str) -> dict[str, Any]:
     
 
     # 소문자 포함 검사
-    if not any(c.islower() for c in password):
+    if not _has_lowercase(password):
         errors.append("비밀번호에 소문자가 포함되어야 합니다.")
     
     # 숫자 포함 검사
-    if not any(c.isdigit() for c in password):
+    if not _DIGIT_RE.search(password):
         errors.append("비밀번호에 숫자가 포함되어야 합니다.")
     
 
@@ -148,7 +246,27 @@ def generate_api_key() -> str:
     Returns:
         64바이트 랜덤 API 키 (hex 문자열)
     """
-    return secrets.token_hex(64)
+    return binascii.hexlify(os.urandom(64)).decode("ascii")
+
+
+def mask_sensitive_data(data: str, visible_chars: int = 4) -> str:
+    """
+    민감한 문자열을 앞 일부만 남기고 마스킹합니다 (로그 출력용).
+    
+    Args:
+        data: 마스킹할 문자열 (계좌번호, API 키 등)
+        visible_chars: 앞에서부터 보여줄 글자 수
+        
+    Returns:
+        마스킹된 문자열 (예: "1234****")
+    """
+    if not data:
+        return ""
+    
+    n = len(data)
+    if n <= visible_chars:
+        return "*" * n
+    return data[:visible_chars].ljust(n, "*")
 
 
 class TokenData:
@@ -156,4 +274,75 @@ class TokenData:
     
     def __init__(self, user_id: str = None, email: str = None):
         self.user_id = user_id
-        self.email = email
\ No newline at end of file
+        self.email = email
+
+
+class EncryptionService:
+    """
+    AES-256-GCM 암호화 서비스
+    API 자격증명, 계좌번호 등 민감 정보를 DB에 암호화하여 저장할 때 사용합니다.
+    암호문 형식: base64(nonce(12) + ciphertext + tag(16))
+    """
+    
+    NONCE_SIZE = 12
+    
+    def __init__(self, key: Union[str, bytes, None] = None):
+        """
+        Args:
+            key: 32바이트 암호화 키 (기본: settings.encryption_key)
+        """
+        if key is None:
+            key = settings.encryption_key.get_secret_value()
+        if isinstance(key, str):
+            key = key.encode("utf-8")
+        
+        # 암호화 객체는 한 번만 생성해 재사용
+        self.cipher = AESGCM(key)
+    
+    def encrypt(self, plaintext: str) -> str:
+        """
+        문자열을 암호화합니다.
+        
+        Args:
+            plaintext: 평문
+            
+        Returns:
+            base64 인코딩된 암호문
+        """
+        # nonce는 매번 커널 난수로 생성 (프로세스 메모리에 미리 받아둔 난수는
+        # fork된 워커끼리 공유되어 같은 키로 nonce가 재사용될 수 있음)
+        nonce = os.urandom(self.NONCE_SIZE)
+        ciphertext = self.cipher.encrypt(nonce, plaintext.encode("utf-8"), None)
+        return base64.b64encode(nonce + ciphertext).decode("ascii")
+    
+    def decrypt(self, token: str) -> str:
+        """
+        암호문을 복호화합니다.
+        
+        Args:
+            token: encrypt()가 반환한 base64 암호문
+            
+        Returns:
+            평문
+        """
+        data = base64.b64decode(token)
+        nonce = data[:self.NONCE_SIZE]
+        plaintext = self.cipher.decrypt(nonce, data[self.NONCE_SIZE:], None)
+        return plaintext.decode("utf-8")
+
+
+# 전역 암호화 서비스 인스턴스
+_encryption_service: Optional[EncryptionService] = None
+
+
+def get_encryption_service() -> EncryptionService:
+    """
+    전역 암호화 서비스 인스턴스 반환
+    
+    Returns:
+        EncryptionService 인스턴스
+    """
+    global _encryption_service
+    if _encryption_service is None:
+        _encryption_service = EncryptionService()
+    return _encryption_service
@@ -2,10 +2,22 @@
 한국투자증권(KIS) Open API 클라이언트
 """
 
-from .auth import KISAuthService
-from .hashkey import HashKeyService
-from .overseas_orders import OverseasOrderApi
-from .realtime import RealtimeClient
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .auth import KISAuthService
+    from .hashkey import HashKeyService
+    from .overseas_orders import OverseasOrderApi
+    from .realtime import RealtimeClient
+
+# 공개 클래스 -> 정의된 서브모듈 (첫 접근 시에만 import, PEP 562)
+_LAZY_IMPORTS = {
+    "KISAuthService": "auth",
+    "HashKeyService": "hashkey",
+    "OverseasOrderApi": "overseas_orders",
+    "RealtimeClient": "realtime",
+}
 
 __all__ = [
     "KISAuthService",
@@ -13,3 +25,19 @@ __all__ = [
     "OverseasOrderApi",
     "RealtimeClient",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """서브모듈 지연 로딩"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # 이후 접근은 모듈 속성에서 바로 조회
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,41 +4,51 @@ Access Token 발급 및 갱신을 담당합니다.
 """
 
 import asyncio
-import json
+import fcntl
+import hashlib
+import logging
 import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional, Tuple
 
 import httpx
-from pydantic import BaseModel, Field
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import orjson
 
+from app.backend.core.cache import get_redis
 from app.backend.core.config import settings
 from app.backend.core.logging import get_logger, log_context
 
 logger = get_logger(__name__)
 
 
-class AccessToken(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class AccessToken:
     """KIS Access Token 모델"""
     
-    access_token: str = Field(..., description="액세스 토큰")
-    token_type: str = Field(default="Bearer", description="토큰 타입")
-    expires_in: int = Field(..., description="만료 시간(초)")
-    expires_at: datetime = Field(..., description="만료 시각")
+    access_token: str  # 액세스 토큰
+    token_type: str = "Bearer"  # 토큰 타입
+    expires_in: int  # 만료 시간(초)
+    expires_at: datetime  # 만료 시각
+    
+    # 생성 시 미리 계산되는 값 (요청마다 문자열 포맷/datetime 연산을 하지 않도록)
+    authorization_header: str = field(init=False, repr=False, compare=False)  # Authorization 헤더 값
+    _expiry_ts: float = field(init=False, repr=False, compare=False)  # 만료 판정 시각 (epoch 초)
+    
+    # 만료 판정 여유 시간 (초, 만료 5분 전부터 만료로 간주)
+    _EXPIRY_BUFFER_SEC = 300.0
+    
+    def __post_init__(self) -> None:
+        self.authorization_header = f"{self.token_type} {self.access_token}"
+        self._expiry_ts = self.expires_at.timestamp() - self._EXPIRY_BUFFER_SEC
     
     @property
     def is_expired(self) -> bool:
         """토큰 만료 여부 확인"""
-        # 5분 여유를 두고 만료 체크
-        buffer = timedelta(minutes=5)
-        return datetime.now(timezone.utc) >= (self.expires_at - buffer)
-    
-    @property
-    def authorization_header(self) -> str:
-        """Authorization 헤더 값"""
-        return f"{self.token_type} {self.access_token}"
+        return time.time() >= self._expiry_ts
     
     def to_dict(self) -> dict:
         """딕셔너리로 변환 (파일 저장용)"""
@@ -60,33 +70,122 @@ class AccessToken(BaseModel):
         )
 
 
+def create_kis_http_client(base_url: Optional[str] = None) -> httpx.AsyncClient:
+    """
+    KIS API용 HTTP 클라이언트 생성
+    HTTP/2 협상 시 단일 연결에서 동시 요청을 처리하고, keep-alive 연결을 재사용합니다.
+    
+    Args:
+        base_url: API 기본 URL (기본: settings.kis_base_url)
+    
+    Returns:
+        httpx.AsyncClient 인스턴스
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=0,  # 재시도는 호출부에서 처리 (주문 중복 방지)
+        limits=httpx.Limits(
+            max_keepalive_connections=32,
+            max_connections=64,
+            keepalive_expiry=60.0
+        )
+    )
+    return httpx.AsyncClient(
+        base_url=base_url or settings.kis_base_url,
+        transport=transport,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        headers={
+            "content-type": "application/json; charset=utf-8",
+            "User-Agent": "AlphaAI/1.0"
+        }
+    )
+
+
+# 프로세스 전역 KIS HTTP 클라이언트 (인증/주문 서비스가 같은 연결 풀 공유)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_kis_http_client() -> httpx.AsyncClient:
+    """
+    전역 KIS HTTP 클라이언트 반환 (첫 호출 시 생성)
+    
+    Returns:
+        httpx.AsyncClient 인스턴스
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = create_kis_http_client()
+    return _http_client
+
+
+async def close_kis_http_client() -> None:
+    """전역 KIS HTTP 클라이언트 종료 (프로세스 종료 시에만 호출)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# 프로세스 내 인스턴스 간 공유 토큰 캐시: (App Key, 모의투자 여부) -> 토큰
+_MEM_TOKEN_CACHE: Dict[Tuple[str, bool], AccessToken] = {}
+
+
 class KISAuthService:
     """
     KIS API 인증 서비스
     토큰 발급, 갱신, 관리를 담당합니다.
     """
     
+    # 백그라운드 갱신 시점 (만료 10분 전, 즉 is_expired 판정 5분 전)
+    PRE_REFRESH_BEFORE = timedelta(minutes=10)
+    # 백그라운드 갱신 실패 시 재시도 간격 (초)
+    REFRESH_RETRY_SECONDS = 60
+    # 토큰 발급 펜스 유지 시간 (초, 발급 워커가 죽어도 이 시간 후 해제)
+    REFRESH_FENCE_SECONDS = 30
+    # 다른 워커의 발급 결과를 기다리는 최대 시간 (초, 초과 시 직접 발급)
+    # 토큰 락을 잡은 채 기다리므로 HTTP 타임아웃(30초)보다 훨씬 짧게 유지
+    SHARED_TOKEN_WAIT_SECONDS = 3
+    
     def __init__(
         self,
         app_key: Optional[str] = None,
         app_secret: Optional[str] = None,
-        use_sandbox: Optional[bool] = None
+        use_sandbox: Optional[bool] = None,
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         """
         Args:
             app_key: KIS API App Key
             app_secret: KIS API App Secret  
             use_sandbox: 모의투자 사용 여부
+            http_client: 공유 HTTP 클라이언트 (None이면 전용 클라이언트 생성)
         """
         self.app_key = app_key or settings.kis_app_key.get_secret_value()
         self.app_secret = app_secret or settings.kis_app_secret.get_secret_value()
         self.use_sandbox = use_sandbox if use_sandbox is not None else settings.kis_use_sandbox
         self.base_url = settings.kis_base_url
         
+        # 토큰 발급 요청 바디 (자격증명은 바뀌지 않으므로 한 번만 직렬화)
+        self._token_request_body = orjson.dumps({
+            "grant_type": "client_credentials",
+            "appkey": self.app_key,
+            "appsecret": self.app_secret
+        })
+        
+        # API 요청 공통 헤더 (요청마다 authorization만 추가)
+        self._base_headers = {
+            "appkey": self.app_key,
+            "appsecret": self.app_secret,
+            "content-type": "application/json; charset=utf-8"
+        }
+        
         # 현재 토큰 캐시
         self._current_token: Optional[AccessToken] = None
         self._token_lock = asyncio.Lock()
         
+        # 백그라운드 토큰 사전 갱신 태스크
+        self._refresh_task: Optional[asyncio.Task] = None
+        
         # 토큰 캐시 파일 경로 설정
         self._cache_dir = Path.home() / ".alpha-ai" / "cache"
         self._cache_dir.mkdir(parents=True, exist_ok=True)
@@ -94,16 +193,26 @@ class KISAuthService:
         # 환경별 캐시 파일 (sandbox/real 구분)
         env_suffix = "sandbox" if self.use_sandbox else "real"
         self._token_cache_file = self._cache_dir / f"kis_token_{env_suffix}.json"
+        self._token_lock_file = self._cache_dir / f"kis_token_{env_suffix}.lock"
+        self._token_tmp_file = self._token_cache_file.with_suffix(".json.tmp")
+        self._cache_file_mtime: Optional[int] = None  # 마지막으로 읽거나 쓴 캐시 파일의 mtime
         
-        # HTTP 클라이언트
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=httpx.Timeout(30.0),
-            headers={
-                "content-type": "application/json; charset=utf-8",
-                "User-Agent": "AlphaAI/1.0"
-            }
-        )
+        # 프로세스 메모리 캐시 키
+        self._mem_cache_key = (self.app_key, bool(self.use_sandbox))
+        
+        # 프로세스 간 공유 토큰 캐시 키 (Redis, App Key별로 구분, 설정으로 켠 경우에만 사용)
+        self._use_shared_cache = settings.kis_shared_token_cache
+        key_id = hashlib.sha256(self.app_key.encode()).hexdigest()[:12]
+        self._shared_token_key = f"kis:token:{env_suffix}:{key_id}"
+        self._refresh_fence_key = f"{self._shared_token_key}:refresh"
+        self._fence_held = False
+        
+        # HTTP 클라이언트 (주입된 공유 클라이언트가 없으면 직접 생성하고 close()에서 종료)
+        self._owns_client = http_client is None
+        self._client = http_client or create_kis_http_client(self.base_url)
+        
+        # 협상된 HTTP 버전 로그 여부 (최초 1회만)
+        self._http_version_logged = False
         
         # 시작 시 캐시된 토큰 로드
         self._load_cached_token()
@@ -117,25 +226,53 @@ class KISAuthService:
         await self.close()
     
     async def close(self):
-        """HTTP 클라이언트 종료"""
-        await self._client.aclose()
+        """백그라운드 갱신 태스크 및 HTTP 클라이언트 종료 (공유 클라이언트는 종료하지 않음)"""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._owns_client:
+            await self._client.aclose()
+    
+    @contextmanager
+    def _cache_file_lock(self) -> Iterator[None]:
+        """토큰 캐시 파일 잠금 (프로세스 간 동시 쓰기 방지)"""
+        with open(self._token_lock_file, "a+b") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _read_token_file(self) -> Optional[AccessToken]:
+        """
+        캐시 파일에서 토큰 읽기 (읽은 파일의 mtime 기록)
+        파일은 항상 원자적으로 교체되므로 잠금 없이 읽어도 부분 기록된 내용을 보지 않습니다.
+        """
+        with open(self._token_cache_file, "rb") as f:
+            self._cache_file_mtime = os.fstat(f.fileno()).st_mtime_ns
+            data = orjson.loads(f.read())
+        return AccessToken.from_dict(data)
     
     def _load_cached_token(self) -> None:
-        """캐시된 토큰 로드"""
+        """캐시된 토큰 로드 (같은 프로세스의 메모리 캐시 우선, 없으면 파일)"""
+        token = _MEM_TOKEN_CACHE.get(self._mem_cache_key)
+        if token and not token.is_expired:
+            self._current_token = token
+            return
+        
         try:
             if self._token_cache_file.exists():
-                with open(self._token_cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                token = AccessToken.from_dict(data)
+                token = self._read_token_file()
                 
                 # 토큰이 만료되지 않았으면 사용
                 if not token.is_expired:
                     self._current_token = token
-                    logger.info("Loaded cached token successfully", extra=log_context(
-                        expires_at=token.expires_at.isoformat(),
-                        cache_file=str(self._token_cache_file)
-                    ))
+                    _MEM_TOKEN_CACHE[self._mem_cache_key] = token
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Loaded cached token successfully", extra=log_context(
+                            expires_at=token.expires_at.isoformat(),
+                            cache_file=str(self._token_cache_file)
+                        ))
                 else:
                     logger.info("Cached token expired, will request new token")
                     # 만료된 캐시 파일 삭제
@@ -145,15 +282,56 @@ class KISAuthService:
             # 손상된 캐시 파일 삭제
             self._token_cache_file.unlink(missing_ok=True)
     
-    def _save_token_to_cache(self, token: AccessToken) -> None:
-        """토큰을 캐시 파일에 저장"""
+    def _load_peer_token(
+        self,
+        stale: Optional[AccessToken],
+        force_refresh: bool
+    ) -> Optional[AccessToken]:
+        """
+        다른 인스턴스/프로세스가 갱신한 토큰 확인
+        프로세스 메모리 캐시를 먼저 보고, 캐시 파일은 mtime이 바뀐 경우에만 다시 읽습니다.
+        """
+        token = _MEM_TOKEN_CACHE.get(self._mem_cache_key)
+        if self._is_usable(token, stale, force_refresh):
+            return token
+        
+        try:
+            mtime = self._token_cache_file.stat().st_mtime_ns
+            if mtime == self._cache_file_mtime:
+                return None
+            token = self._read_token_file()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read token cache file: {e}")
+            return None
+        
+        if self._is_usable(token, stale, force_refresh):
+            _MEM_TOKEN_CACHE[self._mem_cache_key] = token
+            return token
+        return None
+    
+    def _write_token_file(self, token: AccessToken) -> None:
+        """
+        토큰 캐시 파일 기록 (파일 잠금 대기가 있으므로 이벤트 루프 밖에서 호출)
+        임시 파일에 기록 후 교체하므로 쓰기 도중 중단돼도 기존 캐시가 손상되지 않습니다.
+        """
+        with self._cache_file_lock():
+            self._token_tmp_file.write_bytes(orjson.dumps(token.to_dict()))
+            os.replace(self._token_tmp_file, self._token_cache_file)
+            self._cache_file_mtime = self._token_cache_file.stat().st_mtime_ns
+    
+    async def _save_token_to_cache(self, token: AccessToken) -> None:
+        """토큰을 캐시(프로세스 메모리 + 파일)에 저장"""
+        _MEM_TOKEN_CACHE[self._mem_cache_key] = token
         try:
-            with open(self._token_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(token.to_dict(), f, indent=2, ensure_ascii=False)
+            # 다른 프로세스가 파일 잠금을 잡고 있어도 이벤트 루프가 멈추지 않도록 스레드에서 기록
+            await asyncio.to_thread(self._write_token_file, token)
             
-            logger.debug("Token saved to cache", extra=log_context(
-                cache_file=str(self._token_cache_file)
-            ))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Token saved to cache", extra=log_context(
+                    cache_file=str(self._token_cache_file)
+                ))
         except Exception as e:
             logger.warning(f"Failed to save token to cache: {e}")
     
@@ -170,39 +348,68 @@ class KISAuthService:
         Raises:
             httpx.HTTPError: API 요청 실패
         """
+        # 캐시된 토큰이 유효하면 락 없이 바로 반환 (빠른 경로)
+        token = self._current_token
+        if not force_refresh and token and not token.is_expired:
+            return token
+        
         async with self._token_lock:
-            # 캐시된 토큰이 유효하면 반환
-            if not force_refresh and self._current_token and not self._current_token.is_expired:
+            # 락 대기 중 다른 요청이 이미 갱신했으면 그 토큰 사용 (강제 갱신도 중복 발급하지 않음)
+            current = self._current_token
+            if self._is_usable(current, token, force_refresh):
                 logger.debug("Using cached access token")
-                return self._current_token
+                return current
+            
+            # 같은 프로세스의 다른 인스턴스 또는 다른 프로세스가 캐시 파일에 저장한 토큰 확인
+            peer = self._load_peer_token(token, force_refresh)
+            if peer:
+                logger.debug("Using access token refreshed by another instance")
+                self._current_token = peer
+                return peer
+            
+            if self._use_shared_cache:
+                # 다른 호스트의 워커가 공유 캐시(Redis)에 저장한 토큰 확인
+                shared = await self._load_shared_token()
+                if self._is_usable(shared, token, force_refresh):
+                    logger.debug("Using shared access token")
+                    self._current_token = shared
+                    return shared
+                
+                # 발급 펜스 획득 실패 시 다른 워커가 발급 중이므로 잠시 결과를 기다림
+                if not await self._acquire_refresh_fence():
+                    shared = await self._wait_for_shared_token(token, force_refresh)
+                    if shared:
+                        self._current_token = shared
+                        return shared
             
-            logger.info("Requesting new access token", extra=log_context(
-                sandbox=self.use_sandbox
-            ))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Requesting new access token", extra=log_context(
+                    sandbox=self.use_sandbox
+                ))
             
             # 토큰 발급 요청
             endpoint = "/oauth2/tokenP"
-            request_body = {
-                "grant_type": "client_credentials",
-                "appkey": self.app_key,
-                "appsecret": self.app_secret
-            }
             
             try:
+                # 요청 본문은 생성 시 직렬화해 둔 바이트 사용 (content-type은 클라이언트 기본 헤더 사용)
                 response = await self._client.post(
                     endpoint,
-                    json=request_body
+                    content=self._token_request_body
                 )
                 response.raise_for_status()
                 
-                data = response.json()
+                if not self._http_version_logged and logger.isEnabledFor(logging.DEBUG):
+                    self._http_version_logged = True
+                    logger.debug("KIS auth negotiated %s", response.http_version)
+                
+                data = orjson.loads(response.content)
                 
                 # 응답 검증
                 if "access_token" not in data:
                     raise ValueError(f"Invalid token response: {data}")
                 
                 # AccessToken 객체 생성
-                expires_in = data.get("expires_in", 86400)  # 기본 24시간
+                expires_in = int(data.get("expires_in", 86400))  # 기본 24시간
                 expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
                 
                 token = AccessToken(
@@ -212,21 +419,24 @@ class KISAuthService:
                     expires_at=expires_at
                 )
                 
-                # 캐시 업데이트 (메모리 + 파일)
+                # 캐시 업데이트 (메모리 + 파일 + 설정 시 공유 캐시)
                 self._current_token = token
-                self._save_token_to_cache(token)
+                await self._save_token_to_cache(token)
+                if self._use_shared_cache:
+                    await self._store_shared_token(token)
                 
-                logger.info("Access token obtained successfully", extra=log_context(
-                    expires_in=expires_in,
-                    expires_at=expires_at.isoformat()
-                ))
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Access token obtained successfully", extra=log_context(
+                        expires_in=expires_in,
+                        expires_at=expires_at.isoformat()
+                    ))
                 
                 return token
                 
             except httpx.HTTPStatusError as e:
                 response_data = {}
                 try:
-                    response_data = e.response.json()
+                    response_data = orjson.loads(e.response.content)
                 except:
                     pass
                 
@@ -248,6 +458,84 @@ class KISAuthService:
             except Exception as e:
                 logger.error(f"Unexpected error during token request: {e}")
                 raise
+            finally:
+                await self._release_refresh_fence()
+    
+    @staticmethod
+    def _is_usable(
+        candidate: Optional[AccessToken],
+        stale: Optional[AccessToken],
+        force_refresh: bool
+    ) -> bool:
+        """
+        후보 토큰 사용 가능 여부
+        강제 갱신 시에는 갱신을 요청한 시점의 토큰(stale)과 다른 새 토큰이어야 합니다.
+        """
+        if candidate is None or candidate.is_expired:
+            return False
+        if force_refresh and stale is not None:
+            return candidate.access_token != stale.access_token
+        return True
+    
+    async def _load_shared_token(self) -> Optional[AccessToken]:
+        """공유 캐시(Redis)에서 토큰 로드"""
+        try:
+            raw = await get_redis().get(self._shared_token_key)
+            if raw:
+                return AccessToken.from_dict(orjson.loads(raw))
+        except Exception as e:
+            logger.warning(f"Failed to load shared token: {e}")
+        return None
+    
+    async def _store_shared_token(self, token: AccessToken) -> None:
+        """공유 캐시(Redis)에 토큰 저장 (만료 판정 시점까지만 유지)"""
+        ttl = int(token._expiry_ts - time.time())
+        if ttl <= 0:
+            return
+        try:
+            await get_redis().set(self._shared_token_key, orjson.dumps(token.to_dict()), ex=ttl)
+        except Exception as e:
+            logger.warning(f"Failed to store shared token: {e}")
+    
+    async def _acquire_refresh_fence(self) -> bool:
+        """
+        토큰 발급 펜스 획득 (SET NX EX)
+        Redis를 사용할 수 없으면 각자 발급하도록 True를 반환합니다.
+        """
+        try:
+            acquired = await get_redis().set(
+                self._refresh_fence_key, "1", nx=True, ex=self.REFRESH_FENCE_SECONDS
+            )
+            self._fence_held = bool(acquired)
+            return self._fence_held
+        except Exception as e:
+            logger.warning(f"Failed to acquire token refresh fence: {e}")
+            return True
+    
+    async def _release_refresh_fence(self) -> None:
+        """토큰 발급 펜스 해제"""
+        if not self._fence_held:
+            return
+        self._fence_held = False
+        try:
+            await get_redis().delete(self._refresh_fence_key)
+        except Exception as e:
+            logger.warning(f"Failed to release token refresh fence: {e}")
+    
+    async def _wait_for_shared_token(
+        self,
+        stale: Optional[AccessToken],
+        force_refresh: bool
+    ) -> Optional[AccessToken]:
+        """다른 워커가 발급한 토큰이 공유 캐시에 저장될 때까지 대기 (SHARED_TOKEN_WAIT_SECONDS까지)"""
+        deadline = asyncio.get_running_loop().time() + self.SHARED_TOKEN_WAIT_SECONDS
+        while asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(0.2)
+            shared = await self._load_shared_token()
+            if self._is_usable(shared, stale, force_refresh):
+                return shared
+        logger.warning("Timed out waiting for shared token, requesting directly")
+        return None
     
     async def ensure_token(self) -> AccessToken:
         """
@@ -257,7 +545,35 @@ class KISAuthService:
         Returns:
             유효한 AccessToken 객체
         """
-        return await self.get_access_token(force_refresh=False)
+        token = await self.get_access_token(force_refresh=False)
+        
+        # 최초 호출 시 백그라운드 사전 갱신 시작
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+        
+        return token
+    
+    async def _refresh_loop(self) -> None:
+        """
+        토큰 사전 갱신 루프
+        만료 판정 시점(만료 5분 전)보다 앞서 토큰을 갱신해 요청 경로에서 토큰 발급을 기다리지 않도록 합니다.
+        """
+        while True:
+            try:
+                token = self._current_token
+                if token:
+                    refresh_at = token.expires_at - self.PRE_REFRESH_BEFORE
+                    delay = (refresh_at - datetime.now(timezone.utc)).total_seconds()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                
+                await self.get_access_token(force_refresh=True)
+                
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Background token refresh failed: {e}")
+                await asyncio.sleep(self.REFRESH_RETRY_SECONDS)
     
     async def revoke_token(self, token: Optional[str] = None) -> bool:
         """
@@ -284,7 +600,7 @@ class KISAuthService:
         }
         
         try:
-            response = await self._client.post(endpoint, json=request_body)
+            response = await self._client.post(endpoint, content=orjson.dumps(request_body))
             response.raise_for_status()
             
             # 캐시 초기화
@@ -307,12 +623,9 @@ class KISAuthService:
         Returns:
             HTTP 헤더 딕셔너리
         """
-        return {
-            "authorization": token.authorization_header,
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-            "content-type": "application/json; charset=utf-8"
-        }
+        headers = self._base_headers.copy()
+        headers["authorization"] = token.authorization_header
+        return headers
 
 
 # 전역 인증 서비스 인스턴스 (선택적 사용)
@@ -328,5 +641,5 @@ async def get_auth_service() -> KISAuthService:
     """
     global _auth_service
     if _auth_service is None:
-        _auth_service = KISAuthService()
+        _auth_service = KISAuthService(http_client=get_kis_http_client())
     return _auth_service
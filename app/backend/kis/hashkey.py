@@ -3,10 +3,12 @@ KIS API HashKey 서비스
 주문 요청에 필요한 HashKey(서명) 생성을 담당합니다.
 """
 
-import hashlib
+import base64
+import functools
 import hmac
 import json
-from typing import Any, Dict, Optional
+import logging
+from typing import Any, Dict, Optional, Tuple
 
 from app.backend.core.config import settings
 from app.backend.core.logging import get_logger
@@ -20,6 +22,9 @@ class HashKeyService:
     주문/정정/취소 등 중요 요청에 필요한 서명을 생성합니다.
     """
     
+    # HashKey 캐시 최대 항목 수
+    HASHKEY_CACHE_SIZE = 1024
+    
     def __init__(
         self,
         app_key: Optional[str] = None,
@@ -32,43 +37,56 @@ class HashKeyService:
         """
         self.app_key = app_key or settings.kis_app_key.get_secret_value()
         self.app_secret = app_secret or settings.kis_app_secret.get_secret_value()
+        self._secret_bytes = self.app_secret.encode('utf-8')
+        
+        # 직렬화된 바디 -> HashKey 캐시 (재시도 등 동일 요청의 재서명 생략)
+        self._hashkey_for_body = functools.lru_cache(maxsize=self.HASHKEY_CACHE_SIZE)(self._compute_hashkey)
+    
+    @staticmethod
+    def _serialize(data: Dict[str, Any]) -> bytes:
+        """요청 바디를 서명용 JSON 바이트로 직렬화 (공백 없이)"""
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
     
-    def generate_hashkey(self, data: Dict[str, Any]) -> str:
+    def _compute_hashkey(self, body: bytes) -> str:
+        """직렬화된 바디의 HMAC-SHA256 서명을 Base64로 인코딩"""
+        # hmac.digest는 OpenSSL HMAC을 바로 호출하는 C 경로 (HMAC 객체 생성 없음)
+        signature = hmac.digest(self._secret_bytes, body, 'sha256')
+        return base64.b64encode(signature).decode('utf-8')
+    
+    def generate_hashkey(self, data: Dict[str, Any]) -> Tuple[str, bytes]:
         """
         HashKey 생성
         
         KIS API 명세에 따라 요청 바디를 HMAC-SHA256으로 서명합니다.
+        서명한 바이트를 그대로 요청 바디로 전송할 수 있도록 함께 반환합니다.
         
         Args:
             data: 요청 바디 데이터 (딕셔너리)
         
         Returns:
-            Base64 인코딩된 HashKey 문자열
+            (Base64 인코딩된 HashKey 문자열, 서명된 JSON 바디 바이트)
         """
         try:
-            # JSON 문자열로 변환 (공백 없이, 키 정렬)
-            json_data = json.dumps(data, separators=(',', ':'), ensure_ascii=False)
-            
-            # HMAC-SHA256 서명 생성
-            signature = hmac.new(
-                self.app_secret.encode('utf-8'),
-                json_data.encode('utf-8'),
-                hashlib.sha256
-            ).digest()
-            
-            # Base64 인코딩
-            import base64
-            hashkey = base64.b64encode(signature).decode('utf-8')
+            body = self._serialize(data)
+            hashkey = self._hashkey_for_body(body)
             
-            logger.debug(f"HashKey generated for data: {len(json_data)} bytes")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("HashKey generated for data: %d bytes", len(body))
             
-            return hashkey
+            return hashkey, body
             
         except Exception as e:
             logger.error(f"HashKey generation failed: {e}")
             raise
     
-    def sign_order(self, order_data: Dict[str, Any]) -> str:
+    @staticmethod
+    def _require_fields(data: Dict[str, Any], required_fields: list[str], action: str) -> None:
+        """서명 전 필수 필드 검증 (캐시 조회 전에 수행)"""
+        for field in required_fields:
+            if field not in data:
+                raise ValueError(f"Missing required field for {action}: {field}")
+    
+    def sign_order(self, order_data: Dict[str, Any]) -> Tuple[str, bytes]:
         """
         주문 데이터 서명
         
@@ -76,22 +94,19 @@ class HashKeyService:
             order_data: 주문 요청 데이터
         
         Returns:
-            HashKey 문자열
+            (HashKey 문자열, 서명된 JSON 바디 바이트)
         """
-        # 주문 데이터 검증
-        required_fields = ["CANO", "ACNT_PRDT_CD", "PDNO"]
-        for field in required_fields:
-            if field not in order_data:
-                raise ValueError(f"Missing required field for order: {field}")
+        # 필수 필드 검증
+        self._require_fields(order_data, ["CANO", "ACNT_PRDT_CD", "PDNO"], "order")
         
         # HashKey 생성
-        hashkey = self.generate_hashkey(order_data)
+        hashkey, body = self.generate_hashkey(order_data)
         
-        logger.info(f"Order signed - Symbol: {order_data.get('PDNO')}")
+        logger.info("Order signed - Symbol: %s", order_data.get('PDNO'))
         
-        return hashkey
+        return hashkey, body
     
-    def sign_cancel(self, cancel_data: Dict[str, Any]) -> str:
+    def sign_cancel(self, cancel_data: Dict[str, Any]) -> Tuple[str, bytes]:
         """
         주문 취소 데이터 서명
         
@@ -99,22 +114,19 @@ class HashKeyService:
             cancel_data: 취소 요청 데이터
         
         Returns:
-            HashKey 문자열
+            (HashKey 문자열, 서명된 JSON 바디 바이트)
         """
-        # 취소 데이터 검증
-        required_fields = ["CANO", "ACNT_PRDT_CD", "ORGN_ODNO"]
-        for field in required_fields:
-            if field not in cancel_data:
-                raise ValueError(f"Missing required field for cancel: {field}")
+        # 필수 필드 검증
+        self._require_fields(cancel_data, ["CANO", "ACNT_PRDT_CD", "ORGN_ODNO"], "cancel")
         
         # HashKey 생성
-        hashkey = self.generate_hashkey(cancel_data)
+        hashkey, body = self.generate_hashkey(cancel_data)
         
-        logger.info(f"Cancel order signed - Order ID: {cancel_data.get('ORGN_ODNO')}")
+        logger.info("Cancel order signed - Order ID: %s", cancel_data.get('ORGN_ODNO'))
         
-        return hashkey
+        return hashkey, body
     
-    def sign_modify(self, modify_data: Dict[str, Any]) -> str:
+    def sign_modify(self, modify_data: Dict[str, Any]) -> Tuple[str, bytes]:
         """
         주문 정정 데이터 서명
         
@@ -122,20 +134,17 @@ class HashKeyService:
             modify_data: 정정 요청 데이터
         
         Returns:
-            HashKey 문자열
+            (HashKey 문자열, 서명된 JSON 바디 바이트)
         """
-        # 정정 데이터 검증
-        required_fields = ["CANO", "ACNT_PRDT_CD", "ORGN_ODNO"]
-        for field in required_fields:
-            if field not in modify_data:
-                raise ValueError(f"Missing required field for modify: {field}")
+        # 필수 필드 검증
+        self._require_fields(modify_data, ["CANO", "ACNT_PRDT_CD", "ORGN_ODNO"], "modify")
         
         # HashKey 생성
-        hashkey = self.generate_hashkey(modify_data)
+        hashkey, body = self.generate_hashkey(modify_data)
         
-        logger.info(f"Modify order signed - Order ID: {modify_data.get('ORGN_ODNO')}")
+        logger.info("Modify order signed - Order ID: %s", modify_data.get('ORGN_ODNO'))
         
-        return hashkey
+        return hashkey, body
 
 
 # 전역 HashKey 서비스 인스턴스
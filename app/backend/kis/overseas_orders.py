@@ -3,18 +3,22 @@ KIS API 해외주식 주문 서비스
 미국 주식 매수/매도/정정/취소 및 잔고 조회를 담당합니다.
 """
 
+import asyncio
+import logging
+import math
+from collections import OrderedDict
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type
 
 import httpx
-from pydantic import BaseModel, Field
-from tenacity import retry, stop_after_attempt, wait_exponential
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
 
 from app.backend.core.config import settings
 from app.backend.core.logging import get_logger, log_context
-from app.backend.kis.auth import KISAuthService, get_auth_service
+from app.backend.kis.auth import AccessToken, KISAuthService, get_auth_service, get_kis_http_client
 from app.backend.kis.hashkey import HashKeyService, get_hashkey_service
 
 logger = get_logger(__name__)
@@ -35,6 +39,8 @@ class OrderType(str, Enum):
 class OrderResponse(BaseModel):
     """주문 응답 모델"""
     
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     rt_cd: str = Field(..., description="응답코드")
     msg_cd: str = Field(..., description="메시지코드")
     msg1: str = Field(..., description="메시지")
@@ -54,21 +60,87 @@ class OrderResponse(BaseModel):
         return self.msg1 if not self.is_success else ""
 
 
+# 주문 재시도 대상 오류: 요청이 서버에 전달되기 전에 실패한 경우만 (중복 주문 방지)
+RETRYABLE_ERRORS: Tuple[Type[Exception], ...] = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+)
+
+# 시장가 주문 단가 (시장가는 가격 없이 "0"으로 전송)
+_ZERO = "0"
+
+
+def _has_quantity(item: Dict[str, Any]) -> bool:
+    """잔고 항목의 보유수량이 0보다 큰지 ("00", "0.0000" 같은 0 표기도 숫자로 비교)"""
+    qty = item.get("ovrs_cblc_qty")
+    return bool(qty) and Decimal(qty) > 0
+
+
+# 종목별 주문 락 (LRU로 개수 제한; TTL 만료로 보유 중인 락이 사라지지 않도록 시간 기반 만료는 쓰지 않음)
+SYMBOL_LOCKS_MAXSIZE = 1024
+_symbol_locks: "OrderedDict[str, asyncio.Lock]" = OrderedDict()
+
+
+def _symbol_lock(symbol: str) -> asyncio.Lock:
+    """
+    종목별 주문 락 반환
+    이벤트 루프 안에서만 호출되므로 조회/생성 사이에 경합이 없습니다.
+    한도를 넘으면 가장 오래 사용되지 않은 락부터 제거하되, 사용 중인 락은 남겨둡니다.
+    """
+    lock = _symbol_locks.get(symbol)
+    if lock is not None:
+        _symbol_locks.move_to_end(symbol)
+        return lock
+    
+    lock = _symbol_locks[symbol] = asyncio.Lock()
+    if len(_symbol_locks) > SYMBOL_LOCKS_MAXSIZE:
+        for key in list(_symbol_locks):
+            if len(_symbol_locks) <= SYMBOL_LOCKS_MAXSIZE:
+                break
+            if not _symbol_locks[key].locked():
+                del _symbol_locks[key]
+    return lock
+
+
+@lru_cache(maxsize=4096)
+def _parse_exec_dt(date: str, tmd: str) -> datetime:
+    """
+    체결일자(YYYYMMDD) + 체결시각(HHMMSS) 파싱
+    같은 초에 체결된 건이 많으므로 결과를 캐시하고, strptime 대신 슬라이싱으로 파싱합니다.
+    """
+    return datetime(
+        int(date[0:4]), int(date[4:6]), int(date[6:8]),
+        int(tmd[0:2]), int(tmd[2:4]), int(tmd[4:6])
+    )
+
+
 class Position(BaseModel):
-    """포지션(잔고) 모델"""
+    """
+    포지션(잔고) 모델
+    KIS 잔고 응답 항목(output1)을 별칭으로 그대로 검증합니다.
+    금액 문자열은 pydantic-core에서 Decimal로 변환되므로 형식이 잘못된 값은 파싱 시점에 실패합니다.
+    """
     
-    symbol: str = Field(..., description="종목코드")
-    name: str = Field(..., description="종목명")
-    quantity: int = Field(..., description="보유수량")
-    avg_price: Decimal = Field(..., description="평균단가")
-    current_price: Decimal = Field(..., description="현재가")
-    eval_amount: Decimal = Field(..., description="평가금액")
-    profit_loss: Decimal = Field(..., description="평가손익")
-    profit_loss_rate: Decimal = Field(..., description="손익률")
+    model_config = ConfigDict(populate_by_name=True, frozen=True, extra="ignore")
+    
+    symbol: str = Field(..., alias="ovrs_pdno", description="종목코드")
+    name: str = Field(..., alias="ovrs_item_name", description="종목명")
+    quantity: int = Field(..., alias="ovrs_cblc_qty", description="보유수량")
+    avg_price: Decimal = Field(..., alias="pchs_avg_pric", description="평균단가")
+    current_price: Decimal = Field(..., alias="now_pric2", description="현재가")
+    eval_amount: Decimal = Field(..., alias="ovrs_stck_evlu_amt", description="평가금액")
+    profit_loss: Decimal = Field(..., alias="frcr_evlu_pfls_amt", description="평가손익")
+    profit_loss_rate: Decimal = Field(..., alias="evlu_pfls_rt", description="손익률")
 
 
 class Execution(BaseModel):
-    """체결 내역 모델"""
+    """
+    체결 내역 모델
+    KIS 체결 응답 항목(output)을 받으면 필드명을 변환해 검증합니다.
+    """
+    
+    model_config = ConfigDict(frozen=True, extra="ignore")
     
     order_id: str = Field(..., description="주문번호")
     symbol: str = Field(..., description="종목코드")
@@ -77,6 +149,26 @@ class Execution(BaseModel):
     executed_price: Decimal = Field(..., description="체결가격")
     executed_time: datetime = Field(..., description="체결시각")
     
+    @model_validator(mode="before")
+    @classmethod
+    def _from_kis_item(cls, data: Any) -> Any:
+        """KIS 응답 항목을 모델 필드로 변환"""
+        if isinstance(data, dict) and "odno" in data:
+            return {
+                "order_id": data["odno"],
+                "symbol": data["pdno"],
+                "side": OrderSide.BUY if data["sll_buy_dvsn_cd"] == "02" else OrderSide.SELL,
+                "executed_qty": data["ft_ccld_qty"],
+                "executed_price": data["ft_ccld_unpr3"],
+                "executed_time": _parse_exec_dt(data["dmst_ord_dt"], data["ft_ccld_tmd"]),
+            }
+        return data
+
+
+# 목록 응답 일괄 검증용 어댑터 (행 단위 루프 대신 pydantic-core에서 한 번에 검증)
+_POSITIONS_ADAPTER = TypeAdapter(List[Position])
+_EXECUTIONS_ADAPTER = TypeAdapter(List[Execution])
+
 
 class OverseasOrderApi:
     """
@@ -84,12 +176,36 @@ class OverseasOrderApi:
     미국 주식 거래를 위한 주문/조회 기능을 제공합니다.
     """
     
+    # 주문 요청 최대 시도 횟수 (연결 오류 재시도 포함)
+    ORDER_MAX_ATTEMPTS = 3
+    
+    # 거래ID (tr_id) 테이블: 모의투자 여부 -> 요청 종류 -> tr_id
+    TR_IDS = {
+        True: {  # 모의투자
+            "BUY": "VTTT1002U",
+            "SELL": "VTTT1001U",
+            "CANCEL": "VTTT1004U",
+            "POSITIONS": "VTTC8001R",
+            "EXECUTIONS": "VTTS3012R",
+            "BALANCE": "VTRP6504R",
+        },
+        False: {  # 실거래
+            "BUY": "TTTT1002U",
+            "SELL": "TTTT1001U",
+            "CANCEL": "TTTT1004U",
+            "POSITIONS": "TTTC8001R",
+            "EXECUTIONS": "TTTS3012R",
+            "BALANCE": "TTRP6504R",
+        },
+    }
+    
     def __init__(
         self,
         auth_service: Optional[KISAuthService] = None,
         hashkey_service: Optional[HashKeyService] = None,
         account_no: Optional[str] = None,
-        use_sandbox: Optional[bool] = None
+        use_sandbox: Optional[bool] = None,
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         """
         Args:
@@ -97,6 +213,7 @@ class OverseasOrderApi:
             hashkey_service: HashKey 서비스
             account_no: 계좌번호
             use_sandbox: 모의투자 사용 여부
+            http_client: HTTP 클라이언트 (기본: 전역 공유 클라이언트)
         """
         self.auth_service = auth_service
         self.hashkey_service = hashkey_service or get_hashkey_service()
@@ -104,31 +221,95 @@ class OverseasOrderApi:
         self.use_sandbox = use_sandbox if use_sandbox is not None else settings.kis_use_sandbox
         self.base_url = settings.kis_base_url
         
+        # 모의/실거래 구분은 생성 시 한 번만 결정
+        self._tr_ids = self.TR_IDS[bool(self.use_sandbox)]
+        
         # 계좌번호 분리 (계좌번호-상품코드)
         parts = self.account_no.split("-")
         self.cano = parts[0] if len(parts) > 0 else ""  # 종합계좌번호
         self.acnt_prdt_cd = parts[1] if len(parts) > 1 else "01"  # 계좌상품코드
         
-        # HTTP 클라이언트
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=httpx.Timeout(30.0)
-        )
+        # 미리 시작한 토큰 확보 / 연결 예열 태스크 (__aenter__에서 생성)
+        self._token_task: Optional[asyncio.Task] = None
+        self._prewarm_task: Optional[asyncio.Task] = None
+        
+        # HTTP 클라이언트 (기본: 인증 서비스와 공유하는 전역 클라이언트, 연결/TLS 세션 재사용)
+        self._client = http_client or get_kis_http_client()
     
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
         if not self.auth_service:
             self.auth_service = await get_auth_service()
+        
+        # 첫 요청이 토큰 발급을 기다리지 않도록 미리 토큰 확보 시작
+        self._token_task = asyncio.create_task(self.auth_service.ensure_token())
+        
+        # 첫 주문이 TCP/TLS 핸드셰이크를 기다리지 않도록 연결 예열
+        self._prewarm_task = asyncio.create_task(self._prewarm())
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """비동기 컨텍스트 매니저 종료"""
-        await self._client.aclose()
+        """
+        비동기 컨텍스트 매니저 종료
+        HTTP 클라이언트는 공유 자원이므로 여기서 닫지 않습니다 (전역 클라이언트는 프로세스 종료 시 정리).
+        """
+        for task in (self._token_task, self._prewarm_task):
+            if task is None:
+                continue
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled() and task.exception() is not None:
+                # 소비되지 않은 채 실패한 태스크의 예외를 회수 ("exception was never retrieved" 방지)
+                logger.debug("Discarding unused background task error: %r", task.exception())
+        self._token_task = None
+        self._prewarm_task = None
+    
+    async def _prewarm(self) -> None:
+        """
+        KIS 서버와의 keep-alive 연결 확보 (best-effort)
+        응답 내용과 무관하게 연결만 풀에 남기면 되므로 오류는 무시합니다.
+        """
+        try:
+            await self._client.head("/", timeout=5.0)
+        except httpx.HTTPError as e:
+            logger.debug("KIS connection prewarm failed: %s", e)
+    
+    async def _get_token(self) -> AccessToken:
+        """
+        유효한 토큰 반환
+        __aenter__에서 미리 시작한 토큰 확보 결과가 있으면 사용하고, 이후에는 ensure_token의 캐시 경로를 사용합니다.
+        """
+        task, self._token_task = self._token_task, None
+        if task is not None:
+            try:
+                return await task
+            except Exception as e:
+                logger.warning(f"Prefetched token unavailable, retrying: {e}")
+        return await self.auth_service.ensure_token()
+    
+    async def _post_with_retry(
+        self,
+        endpoint: str,
+        headers: Dict[str, str],
+        content: bytes,
+        retryable: Tuple[Type[Exception], ...] = RETRYABLE_ERRORS
+    ) -> httpx.Response:
+        """
+        POST 요청 (연결 단계 오류만 재시도)
+        요청이 서버에 도달했을 수 있는 오류(응답 타임아웃, HTTP 에러 응답)는 주문 중복을 막기 위해
+        재시도하지 않고 그대로 전파합니다.
+        """
+        for attempt in range(self.ORDER_MAX_ATTEMPTS):
+            try:
+                return await self._client.post(endpoint, headers=headers, content=content)
+            except retryable as e:
+                if attempt + 1 >= self.ORDER_MAX_ATTEMPTS:
+                    raise
+                delay = min(2 ** (attempt + 1), 10)
+                logger.warning("Request to %s failed (%r), retrying in %ss", endpoint, e, delay)
+                await asyncio.sleep(delay)
+        raise RuntimeError("unreachable")
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
     async def place_order(
         self,
         symbol: str,
@@ -151,9 +332,17 @@ class OverseasOrderApi:
         
         Returns:
             OrderResponse 객체
+        
+        Raises:
+            ValueError: 지정가 주문의 가격이 없거나 유한한 양수가 아닌 경우
         """
-        # 토큰 확인
-        token = await self.auth_service.ensure_token()
+        # 주문단가 (지정가는 소수점 4자리 고정, 시장가는 가격을 무시하고 _ZERO)
+        if order_type == OrderType.MARKET:
+            unit_price = _ZERO
+        elif price is None or not math.isfinite(price) or price <= 0:
+            raise ValueError(f"Limit order requires a finite positive price: {price!r}")
+        else:
+            unit_price = format(price, ".4f")
         
         # 주문 요청 바디 구성
         order_data = {
@@ -161,68 +350,71 @@ class OverseasOrderApi:
             "ACNT_PRDT_CD": self.acnt_prdt_cd,
             "OVRS_EXCG_CD": "NASD",  # 거래소코드 (NASD: 나스닥, NYSE: 뉴욕증권거래소)
             "PDNO": symbol,  # 종목코드
-            "ORD_QTY": str(qty),  # 주문수량
-            "OVRS_ORD_UNPR": str(price) if price else "0",  # 주문단가
+            "ORD_QTY": f"{qty:d}",  # 주문수량
+            "OVRS_ORD_UNPR": unit_price,  # 주문단가
             "ORD_SVR_DVSN_CD": "0",  # 주문서버구분 (0: 기본)
             "ORD_DVSN": order_type.value,  # 주문구분
         }
         
-        # HashKey 생성
-        hashkey = self.hashkey_service.sign_order(order_data)
+        # HashKey 생성 (직렬화된 바디도 함께 받아 재직렬화 생략)
+        hashkey, body = self.hashkey_service.sign_order(order_data)
+        
+        # 토큰 확인 (서명은 토큰과 무관하므로 먼저 계산)
+        token = await self._get_token()
         
         # 헤더 구성
         headers = self.auth_service.get_headers(token)
         headers["hashkey"] = hashkey
         
-        # 거래ID 설정 (모의/실거래 구분)
-        if self.use_sandbox:
-            headers["tr_id"] = "VTTT1002U" if side == "BUY" else "VTTT1001U"  # 모의투자
-        else:
-            headers["tr_id"] = "TTTT1002U" if side == "BUY" else "TTTT1001U"  # 실거래
+        # 거래ID 설정 (매수/매도)
+        headers["tr_id"] = self._tr_ids[side]
         
-        logger.info(f"Placing {side} order", extra=log_context(
-            symbol=symbol,
-            qty=qty,
-            price=price,
-            order_type=order_type.value
-        ))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Placing %s order", side, extra=log_context(
+                symbol=symbol,
+                qty=qty,
+                price=price,
+                order_type=order_type.value
+            ))
         
-        try:
-            # API 요청
-            endpoint = "/uapi/overseas-stock/v1/trading/order"
-            response = await self._client.post(
-                endpoint,
-                headers=headers,
-                json=order_data
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            order_response = OrderResponse(**data)
-            
-            if order_response.is_success:
-                logger.info(f"Order placed successfully", extra=log_context(
-                    order_id=order_response.odno,
-                    symbol=symbol,
-                    side=side
-                ))
-            else:
-                logger.error(f"Order failed", extra=log_context(
-                    error=order_response.error_message,
-                    symbol=symbol
+        # 같은 종목 동시 주문 직렬화 (중복 주문으로 인한 거부/호출 한도 소모 방지)
+        async with _symbol_lock(symbol):
+            try:
+                # API 요청
+                endpoint = "/uapi/overseas-stock/v1/trading/order"
+                response = await self._post_with_retry(
+                    endpoint,
+                    headers=headers,
+                    content=body  # 서명한 바이트 그대로 전송
+                )
+                response.raise_for_status()
+                
+                data = response.json()
+                order_response = OrderResponse(**data)
+                
+                if order_response.is_success:
+                    logger.info("Order placed successfully", extra=log_context(
+                        order_id=order_response.odno,
+                        symbol=symbol,
+                        side=side
+                    ))
+                else:
+                    logger.error("Order failed", extra=log_context(
+                        error=order_response.error_message,
+                        symbol=symbol
+                    ))
+                
+                return order_response
+                
+            except httpx.HTTPStatusError as e:
+                logger.error(f"Order request failed: {e.response.status_code}", extra=log_context(
+                    status_code=e.response.status_code,
+                    response_body=e.response.text
                 ))
-            
-            return order_response
-            
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Order request failed: {e.response.status_code}", extra=log_context(
-                status_code=e.response.status_code,
-                response_body=e.response.text
-            ))
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error during order placement: {e}")
-            raise
+                raise
+            except Exception as e:
+                logger.error(f"Unexpected error during order placement: {e}")
+                raise
     
     async def cancel_order(
         self,
@@ -241,9 +433,6 @@ class OverseasOrderApi:
         Returns:
             OrderResponse 객체
         """
-        # 토큰 확인
-        token = await self.auth_service.ensure_token()
-        
         # 취소 요청 바디
         cancel_data = {
             "CANO": self.cano,
@@ -255,25 +444,29 @@ class OverseasOrderApi:
             "ORD_QTY": str(qty),
         }
         
-        # HashKey 생성
-        hashkey = self.hashkey_service.sign_cancel(cancel_data)
+        # HashKey 생성 (직렬화된 바디도 함께 받아 재직렬화 생략)
+        hashkey, body = self.hashkey_service.sign_cancel(cancel_data)
+        
+        # 토큰 확인 (서명은 토큰과 무관하므로 먼저 계산)
+        token = await self._get_token()
         
         # 헤더 구성
         headers = self.auth_service.get_headers(token)
         headers["hashkey"] = hashkey
-        headers["tr_id"] = "VTTT1004U" if self.use_sandbox else "TTTT1004U"
+        headers["tr_id"] = self._tr_ids["CANCEL"]
         
-        logger.info(f"Canceling order", extra=log_context(
-            order_id=order_id,
-            symbol=symbol
-        ))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Canceling order", extra=log_context(
+                order_id=order_id,
+                symbol=symbol
+            ))
         
         try:
             endpoint = "/uapi/overseas-stock/v1/trading/order-rvsecncl"
             response = await self._client.post(
                 endpoint,
                 headers=headers,
-                json=cancel_data
+                content=body  # 서명한 바이트 그대로 전송
             )
             response.raise_for_status()
             
@@ -292,11 +485,11 @@ class OverseasOrderApi:
             Position 리스트
         """
         # 토큰 확인
-        token = await self.auth_service.ensure_token()
+        token = await self._get_token()
         
         # 헤더 구성
         headers = self.auth_service.get_headers(token)
-        headers["tr_id"] = "VTTC8001R" if self.use_sandbox else "TTTC8001R"
+        headers["tr_id"] = self._tr_ids["POSITIONS"]
         
         # 쿼리 파라미터
         params = {
@@ -320,23 +513,14 @@ class OverseasOrderApi:
             data = response.json()
             
             # 잔고 데이터 파싱
-            positions = []
-            if "output1" in data:
-                for item in data["output1"]:
-                    if int(item.get("ovrs_cblc_qty", 0)) > 0:  # 보유수량이 있는 경우만
-                        position = Position(
-                            symbol=item["ovrs_pdno"],
-                            name=item["ovrs_item_name"],
-                            quantity=int(item["ovrs_cblc_qty"]),
-                            avg_price=Decimal(item["pchs_avg_pric"]),
-                            current_price=Decimal(item["now_pric2"]),
-                            eval_amount=Decimal(item["ovrs_stck_evlu_amt"]),
-                            profit_loss=Decimal(item["frcr_evlu_pfls_amt"]),
-                            profit_loss_rate=Decimal(item["evlu_pfls_rt"])
-                        )
-                        positions.append(position)
+            # 보유수량이 있는 경우만
+            positions = _POSITIONS_ADAPTER.validate_python([
+                item
+                for item in data.get("output1", ())
+                if _has_quantity(item)
+            ])
             
-            logger.info(f"Found {len(positions)} positions")
+            logger.info("Found %d positions", len(positions))
             return positions
             
         except Exception as e:
@@ -361,7 +545,7 @@ class OverseasOrderApi:
             Execution 리스트
         """
         # 토큰 확인
-        token = await self.auth_service.ensure_token()
+        token = await self._get_token()
         
         # 날짜 기본값 설정
         if not end_date:
@@ -371,7 +555,7 @@ class OverseasOrderApi:
         
         # 헤더 구성
         headers = self.auth_service.get_headers(token)
-        headers["tr_id"] = "VTTS3012R" if self.use_sandbox else "TTTS3012R"
+        headers["tr_id"] = self._tr_ids["EXECUTIONS"]
         
         # 쿼리 파라미터
         params = {
@@ -386,7 +570,7 @@ class OverseasOrderApi:
         if symbol:
             params["PDNO"] = symbol
         
-        logger.info(f"Fetching executions from {start_date} to {end_date}")
+        logger.info("Fetching executions from %s to %s", start_date, end_date)
         
         try:
             endpoint = "/uapi/overseas-stock/v1/trading/inquire-ccnl"
@@ -400,23 +584,9 @@ class OverseasOrderApi:
             data = response.json()
             
             # 체결 데이터 파싱
-            executions = []
-            if "output" in data:
-                for item in data["output"]:
-                    execution = Execution(
-                        order_id=item["odno"],
-                        symbol=item["pdno"],
-                        side=OrderSide.BUY if item["sll_buy_dvsn_cd"] == "02" else OrderSide.SELL,
-                        executed_qty=int(item["ft_ccld_qty"]),
-                        executed_price=Decimal(item["ft_ccld_unpr3"]),
-                        executed_time=datetime.strptime(
-                            f"{item['dmst_ord_dt']} {item['ft_ccld_tmd']}",
-                            "%Y%m%d %H%M%S"
-                        )
-                    )
-                    executions.append(execution)
+            executions = _EXECUTIONS_ADAPTER.validate_python(data.get("output", []))
             
-            logger.info(f"Found {len(executions)} executions")
+            logger.info("Found %d executions", len(executions))
             return executions
             
         except Exception as e:
@@ -431,11 +601,11 @@ class OverseasOrderApi:
             계좌 잔고 정보
         """
         # 토큰 확인
-        token = await self.auth_service.ensure_token()
+        token = await self._get_token()
         
         # 헤더 구성
         headers = self.auth_service.get_headers(token)
-        headers["tr_id"] = "VTRP6504R" if self.use_sandbox else "TTRP6504R"
+        headers["tr_id"] = self._tr_ids["BALANCE"]
         
         # 쿼리 파라미터
         params = {
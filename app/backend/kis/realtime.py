@@ -4,14 +4,17 @@ KIS API 실시간 WebSocket 클라이언트
 """
 
 import asyncio
-import json
+import logging
+from collections import defaultdict
 from datetime import datetime
-from decimal import Decimal
 from enum import Enum
-from typing import Any, Callable, Dict, Optional, Set
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
+import msgspec
+import orjson
+import simdjson
 import websockets
-from pydantic import BaseModel, Field
+from websockets.asyncio.client import ClientConnection, connect as ws_connect
 
 from app.backend.core.config import settings
 from app.backend.core.logging import get_logger, log_context
@@ -19,6 +22,36 @@ from app.backend.kis.auth import KISAuthService, get_auth_service
 
 logger = get_logger(__name__)
 
+# 수신 프레임 파서 (재사용; 문서 전체를 dict로 변환하지 않고 필요한 필드만 읽음)
+# 파싱 결과 객체가 살아 있으면 다음 parse가 실패하므로 결과는 _handle_message 밖으로 내보내지 않습니다.
+_frame_parser = simdjson.Parser()
+
+# 송신 프레임 템플릿 (매번 dict를 만들어 직렬화하지 않도록 미리 구성)
+_PING_FRAME = orjson.dumps({"header": {"tr_id": "PINGPONG"}}).decode()
+_SUBSCRIPTION_FRAME = (
+    '{"header":{"approval_key":%s,"custtype":"P","tr_type":"%s","content-type":"utf-8"},'
+    '"body":{"input":{"tr_id":%s,"tr_key":%s}}}'
+)
+
+
+def _json_str(value: str) -> str:
+    """문자열을 JSON 문자열 리터럴로 변환 (따옴표/이스케이프 포함)"""
+    return orjson.dumps(value).decode()
+
+
+def _resolve_waiters(
+    items: List[Tuple[str, Optional[asyncio.Future]]],
+    results: List[Optional[BaseException]]
+) -> None:
+    """송신 프레임별 전송 결과를 대기 중인 future에 전달 (None은 성공)"""
+    for (_, waiter), result in zip(items, results):
+        if waiter is None or waiter.done():
+            continue
+        if result is None:
+            waiter.set_result(None)
+        else:
+            waiter.set_exception(result)
+
 
 class MessageType(str, Enum):
     """WebSocket 메시지 타입"""
@@ -29,27 +62,67 @@ class MessageType(str, Enum):
     REALTIME = "REALTIME"
 
 
-class RealtimeData(BaseModel):
-    """실시간 데이터 모델"""
+class RealtimeData(msgspec.Struct, frozen=True, gc=False):
+    """
+    실시간 데이터 모델
+    틱마다 생성되므로 검증 없는 msgspec Struct를 사용합니다 (값 변환은 파서에서 수행).
+    가격은 float로 보관합니다 (정밀 계산이 필요한 곳에서 Decimal로 변환).
+    """
     
-    symbol: str = Field(..., description="종목코드")
-    timestamp: datetime = Field(..., description="수신시각")
-    data_type: str = Field(..., description="데이터 타입")
+    symbol: str  # 종목코드
+    timestamp: datetime  # 수신시각
+    data_type: str  # 데이터 타입
     
     # 호가 데이터
-    bid_price: Optional[Decimal] = Field(None, description="매수호가")
-    bid_size: Optional[int] = Field(None, description="매수호가수량")
-    ask_price: Optional[Decimal] = Field(None, description="매도호가")
-    ask_size: Optional[int] = Field(None, description="매도호가수량")
+    bid_price: Optional[float] = None  # 매수호가
+    bid_size: Optional[int] = None  # 매수호가수량
+    ask_price: Optional[float] = None  # 매도호가
+    ask_size: Optional[int] = None  # 매도호가수량
     
     # 체결 데이터
-    last_price: Optional[Decimal] = Field(None, description="현재가")
-    last_size: Optional[int] = Field(None, description="체결수량")
-    volume: Optional[int] = Field(None, description="거래량")
+    last_price: Optional[float] = None  # 현재가
+    last_size: Optional[int] = None  # 체결수량
+    volume: Optional[int] = None  # 거래량
     
     # 추가 정보
-    change: Optional[Decimal] = Field(None, description="전일대비")
-    change_rate: Optional[Decimal] = Field(None, description="등락률")
+    change: Optional[float] = None  # 전일대비
+    change_rate: Optional[float] = None  # 등락률
+
+
+def _parse_quote(output: simdjson.Object) -> RealtimeData:
+    """호가 데이터(H0STCNT0) 파싱"""
+    get = output.get
+    return RealtimeData(
+        symbol=get("symb", ""),
+        timestamp=datetime.now(),
+        data_type="H0STCNT0",
+        bid_price=float(get("bidp") or 0.0),
+        bid_size=int(get("bidv") or 0),
+        ask_price=float(get("askp") or 0.0),
+        ask_size=int(get("askv") or 0)
+    )
+
+
+def _parse_trade(output: simdjson.Object) -> RealtimeData:
+    """체결 데이터(H0STCNI0) 파싱"""
+    get = output.get
+    return RealtimeData(
+        symbol=get("symb", ""),
+        timestamp=datetime.now(),
+        data_type="H0STCNI0",
+        last_price=float(get("last") or 0.0),
+        last_size=int(get("tvol") or 0),
+        volume=int(get("cvol") or 0),
+        change=float(get("diff") or 0.0),
+        change_rate=float(get("rate") or 0.0)
+    )
+
+
+# 실시간 데이터 거래ID -> 파서 (호가, 체결)
+_REALTIME_PARSERS: Dict[str, Callable[[simdjson.Object], RealtimeData]] = {
+    "H0STCNT0": _parse_quote,
+    "H0STCNI0": _parse_trade,
+}
 
 
 class RealtimeClient:
@@ -58,12 +131,22 @@ class RealtimeClient:
     호가/체결 데이터를 실시간으로 수신하고 처리합니다.
     """
     
+    # 수신 데이터 전달 큐 최대 크기 (가득 차면 가장 오래된 데이터부터 버림)
+    DISPATCH_QUEUE_MAXSIZE = 10_000
+    
+    # 재연결 시 동시에 복원할 종목 수
+    RESUBSCRIBE_CONCURRENCY = 20
+    
+    # 구독/해제 프레임 전송 완료 대기 시간 (초)
+    SEND_TIMEOUT = 10.0
+    
     def __init__(
         self,
         auth_service: Optional[KISAuthService] = None,
         use_sandbox: Optional[bool] = None,
         on_data: Optional[Callable[[RealtimeData], None]] = None,
-        on_error: Optional[Callable[[str], None]] = None
+        on_error: Optional[Callable[[str], None]] = None,
+        on_data_batch: Optional[Callable[[List[RealtimeData]], None]] = None
     ):
         """
         Args:
@@ -71,22 +154,28 @@ class RealtimeClient:
             use_sandbox: 모의투자 사용 여부
             on_data: 데이터 수신 콜백
             on_error: 에러 발생 콜백
+            on_data_batch: 데이터 일괄 수신 콜백 (지정 시 on_data 대신 쌓인 데이터를 한 번에 전달)
         """
         self.auth_service = auth_service
         self.use_sandbox = use_sandbox if use_sandbox is not None else settings.kis_use_sandbox
         self.ws_url = settings.kis_ws_url
         
         # WebSocket 연결
-        self._websocket: Optional[websockets.WebSocketClientProtocol] = None
+        self._websocket: Optional[ClientConnection] = None
         self._connection_key: Optional[str] = None
+        self._connection_key_json: str = "null"  # 프레임 템플릿용 JSON 리터럴
         
-        # 구독 관리
+        # 구독 관리 (송신 순서는 송신 큐가 보장하므로 별도 락 불필요)
         self._subscriptions: Set[str] = set()
-        self._subscription_lock = asyncio.Lock()
         
         # 콜백 함수
         self.on_data = on_data
         self.on_error = on_error
+        self.on_data_batch = on_data_batch
+        
+        # 수신/콜백 분리: 수신 루프는 큐에 넣기만 하고 전달 태스크가 콜백 호출
+        self._dispatch_queue: asyncio.Queue[RealtimeData] = asyncio.Queue(maxsize=self.DISPATCH_QUEUE_MAXSIZE)
+        self._dispatch_task: Optional[asyncio.Task] = None
         
         # 연결 상태
         self._connected = False
@@ -96,6 +185,11 @@ class RealtimeClient:
         # 핑퐁 관리
         self._last_ping_time: Optional[datetime] = None
         self._ping_task: Optional[asyncio.Task] = None
+        
+        # 송신 큐 (구독/해제/핑 프레임을 단일 송신 태스크가 전송)
+        # (프레임, 전송 완료 future) 쌍이며, 재연결 중 쌓인 프레임이 유지되도록 큐는 한 번만 생성
+        self._send_queue: asyncio.Queue[Tuple[str, Optional[asyncio.Future]]] = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
     
     async def connect(self) -> bool:
         """
@@ -113,8 +207,8 @@ class RealtimeClient:
             await self._get_connection_key()
             
             # WebSocket 연결
-            logger.info(f"Connecting to WebSocket: {self.ws_url}")
-            self._websocket = await websockets.connect(
+            logger.info("Connecting to WebSocket: %s", self.ws_url)
+            self._websocket = await ws_connect(
                 self.ws_url,
                 ping_interval=20,
                 ping_timeout=10
@@ -126,14 +220,23 @@ class RealtimeClient:
             # 수신 태스크 시작
             asyncio.create_task(self._receive_loop())
             
+            # 송신 태스크 시작 (이전 연결에서 보내지 못한 프레임은 큐에 남아 새 연결로 전송)
+            if self._writer_task:
+                self._writer_task.cancel()
+            self._writer_task = asyncio.create_task(self._writer_loop())
+            
             # 핑퐁 태스크 시작
             self._ping_task = asyncio.create_task(self._ping_loop())
             
+            # 콜백 전달 태스크 시작 (재연결 시에는 기존 태스크 유지)
+            if self._dispatch_task is None or self._dispatch_task.done():
+                self._dispatch_task = asyncio.create_task(self._dispatch_loop())
+            
             logger.info("WebSocket connected successfully")
             return True
             
         except Exception as e:
-            logger.error(f"WebSocket connection failed: {e}")
+            logger.error("WebSocket connection failed: %s", e)
             self._connected = False
             return False
     
@@ -141,14 +244,22 @@ class RealtimeClient:
         """WebSocket 연결 종료"""
         self._running = False
         
-        # 핑퐁 태스크 취소
+        # 핑퐁/송신 태스크 취소
         if self._ping_task:
             self._ping_task.cancel()
+        if self._writer_task:
+            self._writer_task.cancel()
+            self._writer_task = None
         
         # 재연결 태스크 취소
         if self._reconnect_task:
             self._reconnect_task.cancel()
         
+        # 콜백 전달 태스크 취소
+        if self._dispatch_task:
+            self._dispatch_task.cancel()
+            self._dispatch_task = None
+        
         # WebSocket 연결 종료
         if self._websocket:
             await self._websocket.close()
@@ -157,6 +268,12 @@ class RealtimeClient:
         self._connected = False
         self._subscriptions.clear()
         
+        # 전송되지 못한 프레임은 버리고 대기 중인 호출에 실패를 알림
+        while not self._send_queue.empty():
+            _, waiter = self._send_queue.get_nowait()
+            if waiter is not None and not waiter.done():
+                waiter.set_exception(ConnectionError("WebSocket disconnected"))
+        
         logger.info("WebSocket disconnected")
     
     async def subscribe(self, symbol: str, data_types: list[str] = None) -> bool:
@@ -168,7 +285,7 @@ class RealtimeClient:
             data_types: 구독할 데이터 타입 리스트 (기본: 호가, 체결)
         
         Returns:
-            구독 성공 여부
+            구독 성공 여부 (구독 프레임이 소켓으로 전송된 경우 True)
         """
         if not self._connected:
             logger.error("WebSocket not connected")
@@ -177,38 +294,22 @@ class RealtimeClient:
         if data_types is None:
             data_types = ["H0STCNT0", "H0STCNI0"]  # 호가, 체결
         
-        async with self._subscription_lock:
-            for data_type in data_types:
-                try:
-                    # 구독 메시지 생성
-                    subscribe_msg = {
-                        "header": {
-                            "approval_key": self._connection_key,
-                            "custtype": "P",
-                            "tr_type": "1",  # 1: 구독
-                            "content-type": "utf-8"
-                        },
-                        "body": {
-                            "input": {
-                                "tr_id": data_type,
-                                "tr_key": symbol
-                            }
-                        }
-                    }
-                    
-                    # 구독 요청 전송
-                    await self._websocket.send(json.dumps(subscribe_msg))
-                    
-                    # 구독 목록에 추가
-                    subscription_key = f"{data_type}:{symbol}"
-                    self._subscriptions.add(subscription_key)
-                    
-                    logger.info(f"Subscribed to {symbol} - {data_type}")
-                    
-                except Exception as e:
-                    logger.error(f"Subscribe failed for {symbol}: {e}")
-                    return False
+        try:
+            # 구독 요청 전송 (1: 구독)
+            await self._send_frames([
+                self._subscription_frame("1", data_type, symbol)
+                for data_type in data_types
+            ])
+        except Exception as e:
+            logger.error("Subscribe failed for %s: %s", symbol, e)
+            return False
+        
+        # 구독 목록에 추가
+        for data_type in data_types:
+            self._subscriptions.add(f"{data_type}:{symbol}")
         
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Subscribed to %s - %s", symbol, ", ".join(data_types))
         return True
     
     async def unsubscribe(self, symbol: str, data_types: list[str] = None) -> bool:
@@ -220,7 +321,7 @@ class RealtimeClient:
             data_types: 구독 해제할 데이터 타입 리스트
         
         Returns:
-            구독 해제 성공 여부
+            구독 해제 성공 여부 (구독 해제 프레임이 소켓으로 전송된 경우 True)
         """
         if not self._connected:
             return False
@@ -228,40 +329,76 @@ class RealtimeClient:
         if data_types is None:
             data_types = ["H0STCNT0", "H0STCNI0"]
         
-        async with self._subscription_lock:
-            for data_type in data_types:
-                try:
-                    # 구독 해제 메시지 생성
-                    unsubscribe_msg = {
-                        "header": {
-                            "approval_key": self._connection_key,
-                            "custtype": "P",
-                            "tr_type": "2",  # 2: 구독 해제
-                            "content-type": "utf-8"
-                        },
-                        "body": {
-                            "input": {
-                                "tr_id": data_type,
-                                "tr_key": symbol
-                            }
-                        }
-                    }
-                    
-                    # 구독 해제 요청 전송
-                    await self._websocket.send(json.dumps(unsubscribe_msg))
-                    
-                    # 구독 목록에서 제거
-                    subscription_key = f"{data_type}:{symbol}"
-                    self._subscriptions.discard(subscription_key)
-                    
-                    logger.info(f"Unsubscribed from {symbol} - {data_type}")
-                    
-                except Exception as e:
-                    logger.error(f"Unsubscribe failed for {symbol}: {e}")
-                    return False
+        try:
+            # 구독 해제 요청 전송 (2: 구독 해제)
+            await self._send_frames([
+                self._subscription_frame("2", data_type, symbol)
+                for data_type in data_types
+            ])
+        except Exception as e:
+            logger.error("Unsubscribe failed for %s: %s", symbol, e)
+            return False
         
+        # 구독 목록에서 제거
+        for data_type in data_types:
+            self._subscriptions.discard(f"{data_type}:{symbol}")
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Unsubscribed from %s - %s", symbol, ", ".join(data_types))
         return True
     
+    async def _send_frames(self, frames: List[str]) -> None:
+        """
+        송신 큐에 프레임을 넣고 _writer_loop가 전송을 마칠 때까지 대기
+        
+        Raises:
+            Exception: 프레임 전송 실패 (send 예외, 연결 종료)
+            asyncio.TimeoutError: SEND_TIMEOUT 내에 전송되지 않은 경우
+        """
+        loop = asyncio.get_running_loop()
+        waiters = []
+        for frame in frames:
+            waiter = loop.create_future()
+            self._send_queue.put_nowait((frame, waiter))
+            waiters.append(waiter)
+        
+        await asyncio.wait_for(asyncio.gather(*waiters), self.SEND_TIMEOUT)
+    
+    async def _writer_loop(self) -> None:
+        """
+        프레임 송신 루프
+        모든 송신을 한 태스크로 모으고, 쌓인 프레임은 동시에 send 합니다.
+        각 send는 프레임을 전송 버퍼에 즉시 기록하므로 쓰기가 합쳐지고 drain 대기는 한 번으로 끝납니다.
+        전송 결과는 프레임별 future로 호출 측에 전달합니다.
+        """
+        queue = self._send_queue
+        while self._running and self._websocket:
+            items = [await queue.get()]
+            while not queue.empty():
+                items.append(queue.get_nowait())
+            
+            try:
+                if len(items) == 1:
+                    try:
+                        await self._websocket.send(items[0][0])
+                        results = [None]
+                    except Exception as e:
+                        results = [e]
+                else:
+                    results = await asyncio.gather(
+                        *(self._websocket.send(frame) for frame, _ in items),
+                        return_exceptions=True
+                    )
+            except asyncio.CancelledError:
+                # 재연결/종료로 전송 도중 취소되면 전송 여부를 알 수 없으므로 실패로 알림
+                _resolve_waiters(items, [ConnectionError("Send cancelled")] * len(items))
+                raise
+            
+            _resolve_waiters(items, results)
+            failed = [result for result in results if result is not None]
+            if failed:
+                logger.error("Failed to send %d/%d frame(s): %s", len(failed), len(items), failed[0])
+    
     async def _get_connection_key(self) -> None:
         """WebSocket 접속키 발급"""
         token = await self.auth_service.ensure_token()
@@ -272,23 +409,30 @@ class RealtimeClient:
         # TODO: 실제 접속키 발급 API 구현
         # 여기서는 임시로 토큰을 접속키로 사용
         self._connection_key = token.access_token
+        self._connection_key_json = _json_str(self._connection_key)
+    
+    def _subscription_frame(self, tr_type: str, tr_id: str, symbol: str) -> str:
+        """
+        구독/구독 해제 프레임 생성
+        
+        Args:
+            tr_type: 1(구독) / 2(구독 해제)
+            tr_id: 데이터 타입 거래ID
+            symbol: 종목코드
+        """
+        return _SUBSCRIPTION_FRAME % (
+            self._connection_key_json, tr_type, _json_str(tr_id), _json_str(symbol)
+        )
     
     async def _receive_loop(self) -> None:
         """메시지 수신 루프"""
         while self._running and self._websocket:
             try:
-                message = await self._websocket.recv()
+                # 텍스트 프레임도 디코딩(UTF-8 검증) 없이 바이트로 받아 바로 파싱
+                message = await self._websocket.recv(decode=False)
                 
-                # 메시지 파싱
-                if isinstance(message, str):
-                    data = json.loads(message)
-                elif isinstance(message, bytes):
-                    data = json.loads(message.decode('utf-8'))
-                else:
-                    continue
-                
-                # 메시지 타입별 처리
-                await self._handle_message(data)
+                # 메시지 파싱 후 타입별 처리 (파싱 결과는 처리 중에만 참조)
+                await self._handle_message(_frame_parser.parse(message))
                 
             except websockets.ConnectionClosed:
                 logger.warning("WebSocket connection closed")
@@ -297,11 +441,11 @@ class RealtimeClient:
                 break
                 
             except Exception as e:
-                logger.error(f"Error in receive loop: {e}")
+                logger.error("Error in receive loop: %s", e)
                 if self.on_error:
                     self.on_error(str(e))
     
-    async def _handle_message(self, data: Dict[str, Any]) -> None:
+    async def _handle_message(self, data: simdjson.Object) -> None:
         """
         메시지 처리
         
@@ -310,10 +454,8 @@ class RealtimeClient:
         """
         try:
             # 메시지 타입 확인
-            header = data.get("header", {})
-            body = data.get("body", {})
-            
-            tr_id = header.get("tr_id", "")
+            header_get = data.get("header", {}).get
+            tr_id = header_get("tr_id", "")
             
             # 핑퐁 응답
             if tr_id == "PINGPONG":
@@ -321,81 +463,70 @@ class RealtimeClient:
                 return
             
             # 에러 메시지
-            if header.get("rsp_cd") != "0000":
-                error_msg = header.get("rsp_msg", "Unknown error")
-                logger.error(f"Server error: {error_msg}")
+            if header_get("rsp_cd") != "0000":
+                error_msg = header_get("rsp_msg", "Unknown error")
+                logger.error("Server error: %s", error_msg)
                 if self.on_error:
                     self.on_error(error_msg)
                 return
             
-            # 실시간 데이터 처리
-            if tr_id in ["H0STCNT0", "H0STCNI0"]:  # 호가, 체결
-                realtime_data = self._parse_realtime_data(tr_id, body)
-                if realtime_data and self.on_data:
-                    self.on_data(realtime_data)
+            # 실시간 데이터 처리 (거래ID별 파서 조회)
+            parser = _REALTIME_PARSERS.get(tr_id)
+            if parser is None:
+                return
+            
+            try:
+                realtime_data = parser(data.get("body", {}).get("output", {}))
+            except Exception as e:
+                logger.error("Failed to parse realtime data: %s", e)
+                return
+            
+            self._enqueue(realtime_data)
                     
         except Exception as e:
-            logger.error(f"Error handling message: {e}")
+            logger.error("Error handling message: %s", e)
+    
+    def _enqueue(self, realtime_data: RealtimeData) -> None:
+        """전달 큐에 데이터 추가 (가득 차면 가장 오래된 데이터를 버림)"""
+        queue = self._dispatch_queue
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(realtime_data)
     
-    def _parse_realtime_data(self, tr_id: str, body: Dict[str, Any]) -> Optional[RealtimeData]:
+    async def _dispatch_loop(self) -> None:
         """
-        실시간 데이터 파싱
-        
-        Args:
-            tr_id: 거래ID
-            body: 메시지 바디
-        
-        Returns:
-            RealtimeData 객체
+        콜백 전달 루프
+        느린 콜백이 소켓 수신을 막지 않도록 수신 루프와 분리해 실행하며, 쌓인 데이터는 한 번에 꺼냅니다.
         """
-        try:
-            output = body.get("output", {})
-            
-            # 기본 정보
-            realtime_data = RealtimeData(
-                symbol=output.get("symb", ""),
-                timestamp=datetime.now(),
-                data_type=tr_id
-            )
-            
-            # 호가 데이터
-            if tr_id == "H0STCNT0":
-                realtime_data.bid_price = Decimal(output.get("bidp", 0))
-                realtime_data.bid_size = int(output.get("bidv", 0))
-                realtime_data.ask_price = Decimal(output.get("askp", 0))
-                realtime_data.ask_size = int(output.get("askv", 0))
-            
-            # 체결 데이터
-            elif tr_id == "H0STCNI0":
-                realtime_data.last_price = Decimal(output.get("last", 0))
-                realtime_data.last_size = int(output.get("tvol", 0))
-                realtime_data.volume = int(output.get("cvol", 0))
-                realtime_data.change = Decimal(output.get("diff", 0))
-                realtime_data.change_rate = Decimal(output.get("rate", 0))
-            
-            return realtime_data
+        queue = self._dispatch_queue
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
             
-        except Exception as e:
-            logger.error(f"Failed to parse realtime data: {e}")
-            return None
+            if self.on_data_batch:
+                try:
+                    self.on_data_batch(batch)
+                except Exception as e:
+                    logger.error("Error in data batch callback (%d items): %s", len(batch), e)
+            elif self.on_data:
+                # 한 건의 콜백 오류가 같은 배치의 나머지 데이터 전달을 막지 않도록 건별로 처리
+                for realtime_data in batch:
+                    try:
+                        self.on_data(realtime_data)
+                    except Exception as e:
+                        logger.error("Error in data callback for %s: %s", realtime_data.symbol, e)
     
     async def _ping_loop(self) -> None:
         """핑퐁 메시지 전송 루프"""
         while self._running and self._websocket:
             try:
-                # 30초마다 핑 전송
+                # 30초마다 핑 전송 (항상 같은 프레임)
                 await asyncio.sleep(30)
-                
-                ping_msg = {
-                    "header": {
-                        "tr_id": "PINGPONG"
-                    }
-                }
-                
-                await self._websocket.send(json.dumps(ping_msg))
+                self._send_queue.put_nowait((_PING_FRAME, None))
                 
             except Exception as e:
-                logger.error(f"Ping failed: {e}")
+                logger.error("Ping failed: %s", e)
                 break
     
     async def _handle_reconnect(self) -> None:
@@ -414,9 +545,7 @@ class RealtimeClient:
             
             if await self.connect():
                 # 기존 구독 복원
-                for subscription in list(self._subscriptions):
-                    data_type, symbol = subscription.split(":")
-                    await self.subscribe(symbol, [data_type])
+                await self._restore_subscriptions()
                 
                 logger.info("Reconnection successful")
                 return
@@ -424,3 +553,26 @@ class RealtimeClient:
         logger.error("Failed to reconnect after multiple attempts")
         if self.on_error:
             self.on_error("Connection lost and unable to reconnect")
+    
+    async def _restore_subscriptions(self) -> None:
+        """
+        재연결 후 구독 복원
+        종목별로 데이터 타입을 묶어 한 번씩만 구독하고, 종목 간에는 동시에 진행합니다.
+        """
+        by_symbol: Dict[str, List[str]] = defaultdict(list)
+        for subscription in self._subscriptions:
+            data_type, symbol = subscription.split(":", 1)
+            by_symbol[symbol].append(data_type)
+        
+        semaphore = asyncio.Semaphore(self.RESUBSCRIBE_CONCURRENCY)
+        
+        async def restore(symbol: str, data_types: List[str]) -> bool:
+            async with semaphore:
+                return await self.subscribe(symbol, data_types)
+        
+        results = await asyncio.gather(
+            *(restore(symbol, data_types) for symbol, data_types in by_symbol.items())
+        )
+        failed = results.count(False)
+        if failed:
+            logger.warning("Failed to restore %d/%d subscriptions", failed, len(results))
@@ -2,6 +2,8 @@
 FastAPI 메인 애플리케이션
 """
 
+import asyncio
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
@@ -9,30 +11,200 @@ from pathlib import Path
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
 # .env 파일을 명시적으로 로드
 env_file = Path(__file__).parent.parent.parent / ".env"
 load_dotenv(env_file)
-print(f"🔧 .env 파일 로드: {env_file} (존재: {env_file.exists()})")
 
 from app.backend.core.config import settings
+from app.backend.core.logging import get_logger, setup_logging
+
+# 로깅 설정 (다른 모듈 import 전에 수행)
+setup_logging()
+
+logger = get_logger(__name__)
+logger.info(".env 파일 로드: %s (존재: %s)", env_file, env_file.exists())
+
+from app.backend.core.cache import close_redis
 from app.backend.core.database import close_db, check_db_connection
+from app.backend.core.security import calibrate_bcrypt_rounds
 
 # KIS API 관련 import
 import os
-from typing import Optional
+import time
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
 import httpx
-from app.backend.kis.auth import KISAuthService
+import orjson
+from app.backend.kis.auth import KISAuthService, close_kis_http_client, create_kis_http_client
 
 # 전역 KIS 인증 서비스
 kis_auth: Optional[KISAuthService] = None
 kis_token_cache = {}
 
+# 응답용 현재 시각 문자열 (lifespan 동안 백그라운드 태스크가 주기적으로 갱신)
+NOW_REFRESH_SECONDS = 0.25
+_now_iso: str = datetime.now(timezone.utc).isoformat()
+_now_ticker_task: Optional[asyncio.Task] = None
+
+
+async def _now_ticker() -> None:
+    """현재 시각 문자열 주기적 갱신"""
+    global _now_iso
+    while True:
+        _now_iso = datetime.now(timezone.utc).isoformat()
+        await asyncio.sleep(NOW_REFRESH_SECONDS)
+
+
+def _current_timestamp() -> str:
+    """
+    응답용 현재 시각 (ISO 8601, UTC)
+    갱신 태스크가 실행 중이면 캐시된 문자열을 쓰고, 아니면 직접 계산합니다.
+    """
+    if _now_ticker_task is None:
+        return datetime.now(timezone.utc).isoformat()
+    return _now_iso
+
+
+# 상태 응답 템플릿: 정적 필드는 미리 직렬화하고 요청 시 시각(%s)만 채움
+_TIMESTAMP_PLACEHOLDER = "__timestamp__"
+
+
+def _json_template(data: dict) -> bytes:
+    """_TIMESTAMP_PLACEHOLDER 자리를 %s로 바꾼 JSON 바이트 템플릿 생성"""
+    return orjson.dumps(data).replace(b"%", b"%%").replace(_TIMESTAMP_PLACEHOLDER.encode(), b"%s")
+
+
+def _json_response(template: bytes, timestamp: str) -> Response:
+    """템플릿의 모든 시각 자리에 timestamp를 채워 JSON 응답 생성"""
+    value = timestamp.encode()
+    return Response(
+        content=template % ((value,) * template.count(b"%s")),
+        media_type="application/json"
+    )
+
+
+# /health 템플릿 (DB 연결 여부별)
+_HEALTH_TEMPLATES = MappingProxyType({
+    db_connected: _json_template({
+        "status": "healthy" if db_connected else "degraded",
+        "app": settings.app_name,
+        "version": settings.app_version,
+        "environment": settings.environment,
+        "database_connected": db_connected,
+        "timestamp": _TIMESTAMP_PLACEHOLDER
+    })
+    for db_connected in (True, False)
+})
+
+# /api/kis/status 템플릿 ((연결 여부, 토큰 유효 여부)별)
+_KIS_STATUS_TEMPLATES = MappingProxyType({
+    (connected, token_valid): _json_template({
+        "connected": connected,
+        "sandbox_mode": os.getenv("KIS_USE_SANDBOX", "true").lower() == "true",
+        "token_valid": token_valid,
+        "last_check": _TIMESTAMP_PLACEHOLDER,
+        "rate_limit": {
+            "remaining": 95,  # TODO: 실제 API 호출 수 추적
+            "total": 100,
+            "reset_at": _TIMESTAMP_PLACEHOLDER
+        }
+    })
+    for connected in (True, False)
+    for token_valid in (True, False)
+})
+
+# /api/system/status 템플릿 ((KIS 연결 여부, DB 연결 여부)별)
+_SYSTEM_STATUS_TEMPLATES = MappingProxyType({
+    (kis_connected, db_connected): _json_template({
+        "api_server": "connected",
+        "kis_api": "connected" if kis_connected else "disconnected",
+        "database": "connected" if db_connected else "disconnected",
+        "websocket": "ready",
+        "trading_bot": "ready" if kis_connected else "standby",
+        "data_sync": "synced" if kis_connected else "mock_mode",
+        "last_update": _TIMESTAMP_PLACEHOLDER
+    })
+    for kis_connected in (True, False)
+    for db_connected in (True, False)
+})
+
+# 시세 캐시 (종목 -> (저장 시각, 응답)) 및 진행 중인 조회 (동시 요청 합치기)
+# 종목은 요청 경로에서 오므로 개수를 제한 (한도를 넘으면 가장 오래 전에 저장된 항목부터 제거)
+MARKET_CACHE_TTL_SECONDS = 0.5
+MARKET_CACHE_MAXSIZE = 1024
+_market_cache: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+_market_inflight: Dict[str, "asyncio.Future[Optional[dict]]"] = {}
+
+# 시세 조회용 KIS HTTP 클라이언트 (initialize_kis에서 생성, 연결/TLS 세션 재사용)
+_kis_http: Optional[httpx.AsyncClient] = None
+
+# 시세 조회 공통 헤더 (initialize_kis에서 한 번 구성, 요청 시 authorization만 추가)
+_kis_quote_headers: Dict[str, str] = {}
+
+# 종목 메타데이터 (요청마다 만들지 않도록 모듈 상수로 보관)
+_COMPANY_NAMES = MappingProxyType({
+    "AAPL": "Apple Inc.",
+    "TSLA": "Tesla Inc.",
+    "NVDA": "NVIDIA Corporation",
+    "MSFT": "Microsoft Corporation",
+    "GOOGL": "Alphabet Inc."
+})
+
+# 시가총액 (간단한 추정)
+_MARKET_CAPS = MappingProxyType({
+    "AAPL": "2.7T",
+    "TSLA": "792B",
+    "NVDA": "2.2T",
+    "MSFT": "2.8T",
+    "GOOGL": "1.7T"
+})
+
+# KIS API 실패 시 사용하는 목업 시세
+_MOCK_DATA = MappingProxyType({
+    "AAPL": {
+        "symbol": "AAPL",
+        "name": "Apple Inc.",
+        "price": 174.50,
+        "change": 2.30,
+        "change_percent": 1.33,
+        "volume": 52040000,
+        "market_cap": "2.7T"
+    },
+    "TSLA": {
+        "symbol": "TSLA",
+        "name": "Tesla Inc.",
+        "price": 248.87,
+        "change": -5.23,
+        "change_percent": -2.06,
+        "volume": 89420000,
+        "market_cap": "792B"
+    },
+    "NVDA": {
+        "symbol": "NVDA",
+        "name": "NVIDIA Corporation",
+        "price": 875.30,
+        "change": 15.67,
+        "change_percent": 1.82,
+        "volume": 42100000,
+        "market_cap": "2.2T"
+    }
+})
+
+# 대시보드용 가상의 보유 수량
+_MOCK_HOLDINGS = MappingProxyType({"AAPL": 50, "TSLA": 20, "NVDA": 15})
+
+# 목업 응답 본문 (닫는 중괄호 제외; 요청 시 timestamp만 덧붙임)
+_MOCK_DATA_JSON_PREFIX = MappingProxyType({
+    symbol: orjson.dumps({**data, "source": "mock_data"})[:-1]
+    for symbol, data in _MOCK_DATA.items()
+})
+
 
 async def initialize_kis():
     """KIS API 초기화"""
-    global kis_auth
+    global kis_auth, _kis_http, _kis_quote_headers
     
     try:
         app_key = os.getenv("KIS_APP_KEY")
@@ -40,17 +212,27 @@ async def initialize_kis():
         use_sandbox = os.getenv("KIS_USE_SANDBOX", "true").lower() == "true"
         
         if not app_key or not app_secret:
-            print("⚠️  KIS API credentials not found. Running in mock mode.")
+            logger.warning("KIS API credentials not found. Running in mock mode.")
             return False
         
         if app_key.startswith("your_") or app_secret.startswith("your_"):
-            print("⚠️  KIS API credentials are placeholder values. Running in mock mode.")
+            logger.warning("KIS API credentials are placeholder values. Running in mock mode.")
             return False
         
+        base_url = "https://openapivts.koreainvestment.com:29443" if use_sandbox else "https://openapi.koreainvestment.com:9443"
+        _kis_http = create_kis_http_client(base_url)
+        _kis_quote_headers = {
+            "content-type": "application/json; charset=utf-8",
+            "appkey": app_key,
+            "appsecret": app_secret,
+            "tr_id": "HHDFS00000300"  # 해외주식 현재가
+        }
+        
         kis_auth = KISAuthService(
             app_key=app_key,
             app_secret=app_secret,
-            use_sandbox=use_sandbox
+            use_sandbox=use_sandbox,
+            http_client=_kis_http
         )
         
         # 토큰 발급 테스트
@@ -58,47 +240,62 @@ async def initialize_kis():
         kis_token_cache["token"] = token
         kis_token_cache["timestamp"] = datetime.now(timezone.utc)
         
-        print("✅ KIS API initialized successfully")
+        logger.info("KIS API initialized successfully")
         return True
         
     except ValueError as e:
         if "rate limit" in str(e).lower():
-            print(f"⚠️  KIS API rate limit exceeded: {e}")
-            print("⏰ Please wait at least 1 minute before restarting the server")
+            logger.warning("KIS API rate limit exceeded: %s", e)
+            logger.warning("Please wait at least 1 minute before restarting the server")
             return False
         else:
-            print(f"❌ KIS API initialization failed: {e}")
+            logger.error("KIS API initialization failed: %s", e)
             return False
     except Exception as e:
-        print(f"❌ KIS API initialization failed: {e}")
+        logger.error("KIS API initialization failed: %s", e)
         return False
 
 
 async def get_market_data_from_kis(symbol: str) -> Optional[dict]:
-    """KIS API에서 실시간 시세 조회"""
+    """
+    KIS API에서 실시간 시세 조회
+    짧은 시간 안의 중복 요청은 캐시로 응답하고, 동시에 들어온 같은 종목 요청은 한 번의 호출로 합칩니다.
+    """
+    now = time.monotonic()
+    cached = _market_cache.get(symbol)
+    if cached and now - cached[0] < MARKET_CACHE_TTL_SECONDS:
+        return cached[1]
+    
+    task = _market_inflight.get(symbol)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_market_data_from_kis(symbol))
+        _market_inflight[symbol] = task
+        task.add_done_callback(lambda _: _market_inflight.pop(symbol, None))
+    
+    # 한 요청이 취소되어도 같은 호출을 기다리는 다른 요청에는 영향이 없도록 shield
+    result = await asyncio.shield(task)
+    if result is not None:
+        _market_cache[symbol] = (time.monotonic(), result)
+        _market_cache.move_to_end(symbol)
+        if len(_market_cache) > MARKET_CACHE_MAXSIZE:
+            _market_cache.popitem(last=False)
+    return result
+
+
+async def _fetch_market_data_from_kis(symbol: str) -> Optional[dict]:
+    """KIS API 시세 조회 (캐시 없이 직접 호출)"""
     global kis_auth, kis_token_cache
     
-    if not kis_auth:
+    if not kis_auth or not _kis_http:
         return None
     
     try:
         # 캐시된 토큰 사용
         token = kis_token_cache.get("token")
         if not token or token.is_expired:
-            print(f"⚠️  Token expired for {symbol}, using cached token anyway")
+            logger.warning("Token expired for %s, using cached token anyway", symbol)
         
-        app_key = os.getenv("KIS_APP_KEY")
-        app_secret = os.getenv("KIS_APP_SECRET")
-        use_sandbox = os.getenv("KIS_USE_SANDBOX", "true").lower() == "true"
-        base_url = "https://openapivts.koreainvestment.com:29443" if use_sandbox else "https://openapi.koreainvestment.com:9443"
-        
-        headers = {
-            "content-type": "application/json; charset=utf-8",
-            "authorization": token.authorization_header,
-            "appkey": app_key,
-            "appsecret": app_secret,
-            "tr_id": "HHDFS00000300"  # 해외주식 현재가
-        }
+        headers = {**_kis_quote_headers, "authorization": token.authorization_header}
         
         params = {
             "AUTH": "",
@@ -106,56 +303,39 @@ async def get_market_data_from_kis(symbol: str) -> Optional[dict]:
             "SYMB": symbol
         }
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{base_url}/uapi/overseas-price/v1/quotations/price",
-                headers=headers,
-                params=params
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("rt_cd") == "0":
-                    output = data.get("output", {})
-                    # 회사명 매핑
-                    company_names = {
-                        "AAPL": "Apple Inc.",
-                        "TSLA": "Tesla Inc.",
-                        "NVDA": "NVIDIA Corporation",
-                        "MSFT": "Microsoft Corporation",
-                        "GOOGL": "Alphabet Inc."
-                    }
-                    
-                    price = float(output.get("last", 0)) if output.get("last") else 0
-                    prev_close = float(output.get("base", 0)) if output.get("base") else 0
-                    change = price - prev_close if price and prev_close else 0
-                    change_percent = (change / prev_close * 100) if prev_close else 0
-                    
-                    # 시가총액 계산 (간단한 추정)
-                    market_caps = {
-                        "AAPL": "2.7T",
-                        "TSLA": "792B", 
-                        "NVDA": "2.2T",
-                        "MSFT": "2.8T",
-                        "GOOGL": "1.7T"
-                    }
-                    
-                    return {
-                        "symbol": symbol,
-                        "name": company_names.get(symbol, symbol),
-                        "price": price,
-                        "change": change,
-                        "change_percent": change_percent,
-                        "volume": int(output.get("tvol", 0)) if output.get("tvol") else 0,
-                        "market_cap": market_caps.get(symbol, "N/A"),
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "source": "KIS_API"
-                    }
+        response = await _kis_http.get(
+            "/uapi/overseas-price/v1/quotations/price",
+            headers=headers,
+            params=params,
+            timeout=10.0
+        )
+        
+        if response.status_code == 200:
+            data = response.json()
+            if data.get("rt_cd") == "0":
+                output = data.get("output", {})
+                
+                price = float(output.get("last", 0)) if output.get("last") else 0
+                prev_close = float(output.get("base", 0)) if output.get("base") else 0
+                change = price - prev_close if price and prev_close else 0
+                change_percent = (change / prev_close * 100) if prev_close else 0
+                
+                return {
+                    "symbol": symbol,
+                    "name": _COMPANY_NAMES.get(symbol, symbol),
+                    "price": price,
+                    "change": change,
+                    "change_percent": change_percent,
+                    "volume": int(output.get("tvol", 0)) if output.get("tvol") else 0,
+                    "market_cap": _MARKET_CAPS.get(symbol, "N/A"),
+                    "timestamp": _current_timestamp(),
+                    "source": "KIS_API"
+                }
         
         return None
         
     except Exception as e:
-        print(f"❌ Failed to get market data for {symbol}: {e}")
+        logger.error("Failed to get market data for %s: %s", symbol, e)
         return None
 
 
@@ -166,44 +346,57 @@ async def lifespan(app: FastAPI):
     시작 시 DB 및 KIS API 초기화, 종료 시 정리 작업을 수행합니다.
     """
     # 시작 시
-    print("🚀 Starting Alpha AI Trading System...")
+    logger.info("Starting Alpha AI Trading System...")
     
     # 데이터베이스 연결 확인
     db_connected = await check_db_connection()
     
     if not db_connected:
-        print("❌ 데이터베이스 연결 실패 - 서버를 종료합니다")
-        print("💡 .env 파일의 데이터베이스 설정을 확인해주세요")
+        logger.error("데이터베이스 연결 실패 - 서버를 종료합니다 (.env 파일의 데이터베이스 설정을 확인해주세요)")
         raise RuntimeError("Database connection failed. Cannot start server without database.")
     
-    print("✅ Database connection successful")
+    logger.info("Database connection successful")
+    
+    # bcrypt 라운드 보정 (설정된 경우에만, CPU 작업이므로 스레드에서 실행)
+    if settings.bcrypt_calibrate_target_ms:
+        rounds = await asyncio.to_thread(calibrate_bcrypt_rounds, settings.bcrypt_calibrate_target_ms)
+        logger.info("bcrypt 라운드 보정: %d", rounds)
     
     # KIS API 초기화
-    print("🔗 KIS API 연결 시도...")
+    logger.info("KIS API 연결 시도...")
     kis_success = await initialize_kis()
     
     if kis_success:
-        print("✅ KIS API 연결 성공!")
-        print("📊 실시간 데이터 사용 가능")
-        print("💾 토큰 캐싱 활성화 - 서버 재시작 후에도 토큰 재사용")
+        logger.info("KIS API 연결 성공 - 실시간 데이터 사용 가능, 토큰 캐싱 활성화")
     else:
-        print("⚠️  KIS API 연결 실패")
-        print("🔄 모의 데이터 모드로 실행")
+        logger.warning("KIS API 연결 실패 - 모의 데이터 모드로 실행")
+    
+    # 응답 시각 갱신 태스크 시작
+    global _now_ticker_task
+    _now_ticker_task = asyncio.create_task(_now_ticker())
     
-    print("✅ Server ready to start")
+    logger.info("Server ready to start")
     
     yield
     
+    _now_ticker_task.cancel()
+    _now_ticker_task = None
+    
     # 종료 시
-    print("🔄 Shutting down Alpha AI Trading System...")
+    logger.info("Shutting down Alpha AI Trading System...")
     
-    global kis_auth
+    global kis_auth, _kis_http
     if kis_auth:
         await kis_auth.close()
-        print("✅ KIS API connection closed")
+        logger.info("KIS API connection closed")
+    if _kis_http:
+        await _kis_http.aclose()
+        _kis_http = None
     
+    await close_kis_http_client()
     await close_db()
-    print("✅ Application shutdown complete")
+    await close_redis()
+    logger.info("Application shutdown complete")
 
 
 # FastAPI 앱 생성
@@ -212,13 +405,14 @@ app = FastAPI(
     version=settings.app_version,
     docs_url="/api/docs" if settings.debug else None,
     redoc_url="/api/redoc" if settings.debug else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # CORS 미들웨어 설정
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    allow_origins=settings.cors_origins_set,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -235,14 +429,7 @@ async def health_check():
     
     db_connected = await check_db_connection()
     
-    return {
-        "status": "healthy" if db_connected else "degraded",
-        "app": settings.app_name,
-        "version": settings.app_version,
-        "environment": settings.environment,
-        "database_connected": db_connected,
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    }
+    return _json_response(_HEALTH_TEMPLATES[bool(db_connected)], _current_timestamp())
 
 
 # KIS API 통합 엔드포인트들
@@ -254,17 +441,12 @@ async def get_kis_status():
     token = kis_token_cache.get("token")
     is_connected = bool(kis_auth and token)
     
-    return {
-        "connected": is_connected,
-        "sandbox_mode": os.getenv("KIS_USE_SANDBOX", "true").lower() == "true",
-        "token_valid": bool(token and not token.is_expired) if token else False,
-        "last_check": datetime.now(timezone.utc).isoformat(),
-        "rate_limit": {
-            "remaining": 95,  # TODO: 실제 API 호출 수 추적
-            "total": 100,
-            "reset_at": datetime.now(timezone.utc).isoformat()
-        }
-    }
+    token_valid = bool(token and not token.is_expired) if token else False
+    
+    return _json_response(
+        _KIS_STATUS_TEMPLATES[(is_connected, token_valid)],
+        _current_timestamp()
+    )
 
 @app.get("/api/market/{symbol}")
 async def get_market_data(symbol: str):
@@ -276,45 +458,17 @@ async def get_market_data(symbol: str):
         return market_data
     
     # KIS API 실패 시 목업 데이터 반환
-    print(f"⚠️  KIS API failed for {symbol}, using mock data")
-    
-    mock_data = {
-        "AAPL": {
-            "symbol": "AAPL",
-            "name": "Apple Inc.",
-            "price": 174.50,
-            "change": 2.30,
-            "change_percent": 1.33,
-            "volume": 52040000,
-            "market_cap": "2.7T"
-        },
-        "TSLA": {
-            "symbol": "TSLA", 
-            "name": "Tesla Inc.",
-            "price": 248.87,
-            "change": -5.23,
-            "change_percent": -2.06,
-            "volume": 89420000,
-            "market_cap": "792B"
-        },
-        "NVDA": {
-            "symbol": "NVDA",
-            "name": "NVIDIA Corporation", 
-            "price": 875.30,
-            "change": 15.67,
-            "change_percent": 1.82,
-            "volume": 42100000,
-            "market_cap": "2.2T"
-        }
-    }
+    logger.warning("KIS API failed for %s, using mock data", symbol)
     
-    if symbol.upper() in mock_data:
-        data = mock_data[symbol.upper()]
-        data["timestamp"] = datetime.now(timezone.utc).isoformat()
-        data["source"] = "mock_data"
-        return data
+    prefix = _MOCK_DATA_JSON_PREFIX.get(symbol.upper())
+    if prefix is not None:
+        timestamp = _current_timestamp()
+        return Response(
+            content=b"%s,\"timestamp\":\"%s\"}" % (prefix, timestamp.encode()),
+            media_type="application/json"
+        )
     else:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={"error": f"Symbol {symbol} not found"}
         )
@@ -326,16 +480,17 @@ async def get_dashboard_stats():
     
     kis_connected = bool(kis_auth and kis_token_cache.get("token"))
     
-    # 주요 종목들의 실시간 가격 조회
+    # 주요 종목들의 실시간 가격 동시 조회
     symbols = ["AAPL", "TSLA", "NVDA"]
     total_value = 0
     
-    for symbol in symbols:
-        market_data = await get_market_data_from_kis(symbol)
-        if market_data and market_data.get("price"):
-            # 가상의 보유 수량
-            holdings = {"AAPL": 50, "TSLA": 20, "NVDA": 15}
-            total_value += market_data["price"] * holdings.get(symbol, 0)
+    results = await asyncio.gather(
+        *(get_market_data_from_kis(symbol) for symbol in symbols),
+        return_exceptions=True
+    )
+    for symbol, market_data in zip(symbols, results):
+        if isinstance(market_data, dict) and market_data.get("price"):
+            total_value += market_data["price"] * _MOCK_HOLDINGS.get(symbol, 0)
     
     # 모의 데이터로 보완
     if total_value == 0:
@@ -350,7 +505,7 @@ async def get_dashboard_stats():
         "total_value_usd": total_value,
         "daily_pnl": 1250.75,
         "daily_pnl_percent": 2.81,
-        "last_updated": datetime.now(timezone.utc).isoformat()
+        "last_updated": _current_timestamp()
     }
 
 @app.get("/api/system/status")
@@ -361,15 +516,10 @@ async def get_system_status():
     kis_connected = bool(kis_auth and kis_token_cache.get("token"))
     db_connected = await check_db_connection()
     
-    return {
-        "api_server": "connected",
-        "kis_api": "connected" if kis_connected else "disconnected", 
-        "database": "connected" if db_connected else "disconnected",
-        "websocket": "ready",
-        "trading_bot": "ready" if kis_connected else "standby",
-        "data_sync": "synced" if kis_connected else "mock_mode",
-        "last_update": datetime.now(timezone.utc).isoformat()
-    }
+    return _json_response(
+        _SYSTEM_STATUS_TEMPLATES[(kis_connected, bool(db_connected))],
+        _current_timestamp()
+    )
 
 # API 라우터 등록
 from app.backend.routes.auth import router as auth_router
@@ -391,8 +541,8 @@ async def global_exception_handler(request, exc):
     """
     전역 예외 처리
     """
-    print(f"❌ Unhandled exception: {exc}")
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=exc)
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -409,5 +559,6 @@ if __name__ == "__main__":
         host=settings.backend_host,
         port=settings.backend_port,
         reload=settings.debug,
-        log_level=settings.log_level.lower()
+        log_level=settings.log_level.lower(),
+        loop="uvloop"
     )
@@ -3,15 +3,15 @@
 """
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, String, Boolean, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, String, Boolean, Text, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.backend.core.database import Base
+from app.backend.core.database import Base, uuid7
 
 if TYPE_CHECKING:
     from .user import User
@@ -50,7 +50,7 @@ class BrokerageAccount(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         nullable=False
     )
     
@@ -95,8 +95,8 @@ class BrokerageAccount(Base):
     )
     
     # 설정
-    config: Mapped[Optional[str]] = mapped_column(
-        Text,
+    config: Mapped[Optional[dict]] = mapped_column(
+        JSONB,
         nullable=True,
         comment="JSON 형식의 추가 설정"
     )
@@ -104,13 +104,13 @@ class BrokerageAccount(Base):
     # 타임스탬프
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
     
@@ -122,7 +122,8 @@ class BrokerageAccount(Base):
     api_credentials: Mapped[List["ApiCredential"]] = relationship(
         "ApiCredential",
         back_populates="account",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="selectin"
     )
     trade_rules: Mapped[List["TradeRule"]] = relationship(
         "TradeRule",
@@ -171,7 +172,7 @@ class ApiCredential(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         nullable=False
     )
     
@@ -223,13 +224,13 @@ class ApiCredential(Base):
     # 타임스탬프
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
     
@@ -247,4 +248,4 @@ class ApiCredential(Base):
         """토큰 유효성 확인"""
         if not self.access_token_encrypted or not self.token_expire_at:
             return False
-        return datetime.utcnow() < self.token_expire_at
+        return datetime.now(timezone.utc) < self.token_expire_at
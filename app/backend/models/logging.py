@@ -7,11 +7,11 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, String, Text, Numeric, Boolean
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import DDL, DateTime, ForeignKey, Index, String, Text, Numeric, Boolean, event, text, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.backend.core.database import Base
+from app.backend.core.database import Base, SmallIntEnum, uuid7
 
 if TYPE_CHECKING:
     from .account import BrokerageAccount
@@ -27,6 +27,16 @@ class LogLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+# DB 저장 코드 (Python logging 레벨 값과 동일)
+LOG_LEVEL_CODES = {
+    LogLevel.DEBUG: 10,
+    LogLevel.INFO: 20,
+    LogLevel.WARNING: 30,
+    LogLevel.ERROR: 40,
+    LogLevel.CRITICAL: 50,
+}
+
+
 class SignalType(str, Enum):
     """시그널 타입"""
     ENTRY = "ENTRY"  # 진입 시그널
@@ -35,28 +45,49 @@ class SignalType(str, Enum):
     NEUTRAL = "NEUTRAL"  # 중립
 
 
+# DB 저장 코드
+SIGNAL_TYPE_CODES = {
+    SignalType.ENTRY: 1,
+    SignalType.EXIT: 2,
+    SignalType.HOLD: 3,
+    SignalType.NEUTRAL: 4,
+}
+
+
 class ExecutionLog(Base):
     """
     실행 로그 모델
     시스템 실행 중 발생하는 모든 로그를 기록합니다.
+    created_at 기준 월별 파티션 테이블이라 PK가 (id, created_at)입니다.
+    (session.get(ExecutionLog, (id, created_at))처럼 두 값을 모두 넘겨야 함)
     """
     
     __tablename__ = "execution_logs"
+    __table_args__ = (
+        # 계좌별 최신 로그 조회 (level/category 포함으로 인덱스만으로 처리)
+        Index(
+            "ix_exec_log_acct_created",
+            "account_id",
+            text("created_at DESC"),
+            postgresql_include=["level", "category"]
+        ),
+        # 월 단위 RANGE 파티션 (파티션 키는 PK에 포함되어야 함)
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
     
     # 기본 키
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         nullable=False
     )
     
-    # 외래 키
+    # 외래 키 (account_id 단독 조회는 ix_exec_log_acct_created가 처리)
     account_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("brokerage_accounts.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     rule_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
@@ -67,7 +98,7 @@ class ExecutionLog(Base):
     
     # 로그 정보
     level: Mapped[LogLevel] = mapped_column(
-        SQLEnum(LogLevel),
+        SmallIntEnum(LogLevel, LOG_LEVEL_CODES),
         default=LogLevel.INFO,
         nullable=False,
         index=True
@@ -84,8 +115,8 @@ class ExecutionLog(Base):
     )
     
     # 컨텍스트 데이터
-    context: Mapped[Optional[str]] = mapped_column(
-        Text,
+    context: Mapped[Optional[dict]] = mapped_column(
+        JSONB,
         nullable=True,
         comment="추가 컨텍스트 데이터 (JSON)"
     )
@@ -96,26 +127,28 @@ class ExecutionLog(Base):
         nullable=True,
         index=True
     )
-    error_details: Mapped[Optional[str]] = mapped_column(
-        Text,
+    error_details: Mapped[Optional[dict]] = mapped_column(
+        JSONB,
         nullable=True
     )
     
-    # 타임스탬프
+    # 타임스탬프 (계좌별 시간순 조회는 ix_exec_log_acct_created 사용, 파티션 키)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        nullable=False,
-        index=True
+        primary_key=True,
+        server_default=func.now(),
+        nullable=False
     )
     
     # 관계
     account: Mapped["BrokerageAccount"] = relationship(
         "BrokerageAccount",
-        back_populates="execution_logs"
+        back_populates="execution_logs",
+        lazy="selectin"
     )
     rule: Mapped[Optional["TradeRule"]] = relationship(
-        "TradeRule"
+        "TradeRule",
+        lazy="selectin"
     )
     
     def __repr__(self) -> str:
@@ -131,15 +164,33 @@ class StrategySignal(Base):
     """
     전략 시그널 모델
     트레이딩 전략에서 생성된 시그널을 기록합니다.
+    created_at 기준 월별 파티션 테이블이라 PK가 (id, created_at)입니다.
+    (session.get(StrategySignal, (id, created_at))처럼 두 값을 모두 넘겨야 함)
     """
     
     __tablename__ = "strategy_signals"
+    __table_args__ = (
+        # payload 키/값 포함(@>) 조회용
+        Index("ix_signal_payload_gin", "payload", postgresql_using="gin"),
+        # 스케줄러의 미실행 시그널 폴링용 부분 인덱스 (실행 완료된 대다수 행 제외)
+        Index(
+            "ix_signal_pending",
+            "rule_id",
+            "created_at",
+            postgresql_where=text(
+                f"executed = false AND signal_type IN "
+                f"({SIGNAL_TYPE_CODES[SignalType.ENTRY]}, {SIGNAL_TYPE_CODES[SignalType.EXIT]})"
+            )
+        ),
+        # 월 단위 RANGE 파티션 (파티션 키는 PK에 포함되어야 함)
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
     
     # 기본 키
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         nullable=False
     )
     
@@ -153,7 +204,7 @@ class StrategySignal(Base):
     
     # 시그널 정보
     signal_type: Mapped[SignalType] = mapped_column(
-        SQLEnum(SignalType),
+        SmallIntEnum(SignalType, SIGNAL_TYPE_CODES),
         nullable=False,
         index=True
     )
@@ -176,8 +227,8 @@ class StrategySignal(Base):
     )
     
     # 시그널 데이터
-    payload: Mapped[Optional[str]] = mapped_column(
-        Text,
+    payload: Mapped[Optional[dict]] = mapped_column(
+        JSONB,
         nullable=True,
         comment="시그널 상세 데이터 (JSON)"
     )
@@ -193,8 +244,8 @@ class StrategySignal(Base):
         DateTime(timezone=True),
         nullable=True
     )
-    execution_result: Mapped[Optional[str]] = mapped_column(
-        Text,
+    execution_result: Mapped[Optional[dict]] = mapped_column(
+        JSONB,
         nullable=True,
         comment="실행 결과 (JSON)"
     )
@@ -202,7 +253,8 @@ class StrategySignal(Base):
     # 타임스탬프
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
+        primary_key=True,
+        server_default=func.now(),
         nullable=False,
         index=True
     )
@@ -220,3 +272,15 @@ class StrategySignal(Base):
     def is_actionable(self) -> bool:
         """실행 가능한 시그널 여부"""
         return self.signal_type in [SignalType.ENTRY, SignalType.EXIT] and not self.executed
+
+
+# metadata.create_all()로 만든 테이블(개발/테스트)에도 DEFAULT 파티션을 둔다
+# (운영 스키마의 월별 파티션은 supabase_init.sql/마이그레이션 및 maintain_partitions가 관리)
+for _table in (ExecutionLog.__table__, StrategySignal.__table__):
+    event.listen(
+        _table,
+        "after_create",
+        DDL(f"CREATE TABLE IF NOT EXISTS {_table.name}_default PARTITION OF {_table.name} DEFAULT").execute_if(
+            dialect="postgresql"
+        ),
+    )
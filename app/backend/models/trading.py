@@ -3,16 +3,17 @@
 """
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, String, Boolean, Text, Integer, Numeric
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Computed, DateTime, Enum as SQLEnum, Float, ForeignKey, Index, String, Boolean, Text, Integer, Numeric, func, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.backend.core.database import Base
+from app.backend.core.database import Base, SmallIntEnum, uuid7
 
 if TYPE_CHECKING:
     from .account import BrokerageAccount
@@ -36,6 +37,20 @@ class OrderStatus(str, Enum):
     FAILED = "failed"  # 실패
 
 
+# DB 저장 코드 (미체결 상태가 앞쪽: SQL에서 status <= 3 이면 진행 중 주문)
+# ORM 필터는 코드 대신 OrderStatus 멤버와 비교해야 함 (예: Order.status <= OrderStatus.PARTIALLY_FILLED)
+# SmallIntEnum이 바인딩 값을 OrderStatus로 변환하므로 정수 리터럴(Order.status <= 3)은 컴파일 오류
+ORDER_STATUS_CODES = {
+    OrderStatus.PENDING: 1,
+    OrderStatus.PLACED: 2,
+    OrderStatus.PARTIALLY_FILLED: 3,
+    OrderStatus.FILLED: 4,
+    OrderStatus.CANCELLED: 5,
+    OrderStatus.REJECTED: 6,
+    OrderStatus.FAILED: 7,
+}
+
+
 class TradeRule(Base):
     """
     트레이딩 규칙 모델
@@ -48,7 +63,7 @@ class TradeRule(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         nullable=False
     )
     
@@ -136,13 +151,13 @@ class TradeRule(Base):
     # 타임스탬프
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
     
@@ -165,13 +180,22 @@ class TradeRule(Base):
     def __repr__(self) -> str:
         return f"<TradeRule(id={self.id}, name={self.name}, symbol={self.symbol})>"
     
-    @property
+    @hybrid_property
     def is_in_cooldown(self) -> bool:
         """쿨다운 상태 확인"""
         if not self.last_triggered_at:
             return False
-        elapsed = (datetime.utcnow() - self.last_triggered_at).total_seconds()
+        elapsed = (datetime.now(timezone.utc) - self.last_triggered_at).total_seconds()
         return elapsed < self.cooldown_seconds
+    
+    @is_in_cooldown.inplace.expression
+    @classmethod
+    def _is_in_cooldown_expression(cls):
+        # now()에 의존하므로 생성 컬럼으로 저장할 수 없어 쿼리 시점에 계산
+        return func.coalesce(
+            cls.last_triggered_at + cls.cooldown_seconds * text("interval '1 second'") > func.now(),
+            False
+        )
 
 
 class Order(Base):
@@ -181,21 +205,33 @@ class Order(Base):
     """
     
     __tablename__ = "orders"
+    __table_args__ = (
+        # 계좌별 상태 필터 + 최신순 조회
+        Index("ix_orders_acct_status_created", "account_id", "status", text("created_at DESC")),
+        # 계좌별 종목 주문 조회
+        Index("ix_orders_acct_symbol_status", "account_id", "symbol", "status"),
+        # 진행 중 주문 폴링용 부분 인덱스 (Order.status <= OrderStatus.PARTIALLY_FILLED 또는
+        # Order.status.in_([PENDING, PLACED, PARTIALLY_FILLED]) 조건이 이 인덱스를 사용)
+        Index(
+            "ix_orders_open",
+            "account_id",
+            postgresql_where=text(f"status <= {ORDER_STATUS_CODES[OrderStatus.PARTIALLY_FILLED]}")
+        ),
+    )
     
     # 기본 키
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         nullable=False
     )
     
-    # 외래 키
+    # 외래 키 (account_id 단독 조회는 복합 인덱스가 처리)
     account_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("brokerage_accounts.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     rule_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
@@ -226,7 +262,7 @@ class Order(Base):
     
     # 상태
     status: Mapped[OrderStatus] = mapped_column(
-        SQLEnum(OrderStatus),
+        SmallIntEnum(OrderStatus, ORDER_STATUS_CODES),
         default=OrderStatus.PENDING,
         nullable=False,
         index=True
@@ -244,6 +280,11 @@ class Order(Base):
         default=0,
         nullable=False
     )
+    fill_rate: Mapped[float] = mapped_column(
+        Float,
+        Computed("COALESCE(filled_quantity::float8 / NULLIF(quantity, 0), 0)", persisted=True),
+        comment="체결률 (DB 생성 컬럼)"
+    )
     avg_fill_price: Mapped[Optional[Decimal]] = mapped_column(
         Numeric(12, 4),
         nullable=True
@@ -254,8 +295,8 @@ class Order(Base):
     )
     
     # 원본 응답
-    raw_response: Mapped[Optional[str]] = mapped_column(
-        Text,
+    raw_response: Mapped[Optional[dict]] = mapped_column(
+        JSONB,
         nullable=True,
         comment="브로커 API 원본 응답 (JSON)"
     )
@@ -275,13 +316,13 @@ class Order(Base):
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
     
@@ -292,7 +333,8 @@ class Order(Base):
     )
     rule: Mapped[Optional["TradeRule"]] = relationship(
         "TradeRule",
-        back_populates="orders"
+        back_populates="orders",
+        lazy="selectin"
     )
     
     def __repr__(self) -> str:
@@ -302,13 +344,6 @@ class Order(Base):
     def is_complete(self) -> bool:
         """주문 완료 여부"""
         return self.status in [OrderStatus.FILLED, OrderStatus.CANCELLED, OrderStatus.REJECTED, OrderStatus.FAILED]
-    
-    @property
-    def fill_rate(self) -> float:
-        """체결률"""
-        if self.quantity == 0:
-            return 0.0
-        return self.filled_quantity / self.quantity
 
 
 class Position(Base):
@@ -323,7 +358,7 @@ class Position(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         nullable=False
     )
     
@@ -357,6 +392,19 @@ class Position(Base):
         nullable=True,
         comment="현재가"
     )
+    
+    # 평가 정보 (DB 생성 컬럼)
+    market_value: Mapped[Decimal] = mapped_column(
+        Numeric(18, 4),
+        Computed("quantity * COALESCE(current_price, avg_price)", persisted=True),
+        index=True,
+        comment="시장가치"
+    )
+    cost_basis: Mapped[Decimal] = mapped_column(
+        Numeric(18, 4),
+        Computed("quantity * avg_price", persisted=True),
+        comment="매입원가"
+    )
     unrealized_pnl: Mapped[Optional[Decimal]] = mapped_column(
         Numeric(12, 2),
         nullable=True,
@@ -371,13 +419,13 @@ class Position(Base):
     # 타임스탬프
     opened_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
     
@@ -389,15 +437,3 @@ class Position(Base):
     
     def __repr__(self) -> str:
         return f"<Position(id={self.id}, symbol={self.symbol}, quantity={self.quantity})>"
-    
-    @property
-    def market_value(self) -> Decimal:
-        """시장가치"""
-        if self.current_price:
-            return self.quantity * self.current_price
-        return self.quantity * self.avg_price
-    
-    @property
-    def cost_basis(self) -> Decimal:
-        """매입원가"""
-        return self.quantity * self.avg_price
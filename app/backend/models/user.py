@@ -7,11 +7,11 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import DateTime, Enum as SQLEnum, String, Boolean
+from sqlalchemy import DateTime, Enum as SQLEnum, String, Boolean, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.backend.core.database import Base
+from app.backend.core.database import Base, uuid7
 
 if TYPE_CHECKING:
     from .account import BrokerageAccount
@@ -36,7 +36,7 @@ class User(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         nullable=False
     )
     
@@ -78,13 +78,13 @@ class User(Base):
     # 타임스탬프
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
     last_login_at: Mapped[datetime] = mapped_column(
@@ -10,9 +10,10 @@ from typing import Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.backend.core.database import uuid7
 from app.backend.core.security import (
-    get_password_hash,
-    verify_password,
+    aget_password_hash,
+    averify_password,
     create_access_token,
     verify_token,
     validate_password_strength,
@@ -52,10 +53,10 @@ class AuthService:
             raise ValueError(f"비밀번호가 약합니다: {', '.join(password_check['errors'])}")
         
         # 새 사용자 생성
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await aget_password_hash(user_data.password)
         
         new_user = User(
-            id=uuid.uuid4(),
+            id=uuid7(),
             email=user_data.email,
             password_hash=hashed_password,
             name=user_data.name,
@@ -89,7 +90,7 @@ class AuthService:
         if not user.is_active:
             return None
         
-        if not verify_password(login_data.password, user.password_hash):
+        if not await averify_password(login_data.password, user.password_hash):
             return None
         
         # 마지막 로그인 시간 업데이트
@@ -139,7 +140,7 @@ class AuthService:
             비밀번호 변경 성공 여부
         """
         # 현재 비밀번호 확인
-        if not verify_password(current_password, user.password_hash):
+        if not await averify_password(current_password, user.password_hash):
             return False
         
         # 새 비밀번호 강도 검증
@@ -148,7 +149,7 @@ class AuthService:
             raise ValueError(f"비밀번호가 약합니다: {', '.join(password_check['errors'])}")
         
         # 비밀번호 해시화 및 업데이트
-        user.password_hash = get_password_hash(new_password)
+        user.password_hash = await aget_password_hash(new_password)
         user.updated_at = datetime.now(timezone.utc)
         
         await self.db.commit()
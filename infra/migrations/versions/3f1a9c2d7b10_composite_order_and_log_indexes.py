@@ -0,0 +1,53 @@
+"""계좌 기준 주문/실행 로그 조회용 복합 인덱스
+
+supabase_init.sql 기준 스키마에서 시작하는 첫 리비전입니다.
+단일 컬럼 인덱스 중 복합 인덱스의 선두 컬럼과 겹치는 것은 제거합니다.
+
+Revision ID: 3f1a9c2d7b10
+Revises:
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1a9c2d7b10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_orders_acct_status_created",
+        "orders",
+        ["account_id", "status", sa.text("created_at DESC")],
+    )
+    op.create_index(
+        "ix_orders_acct_symbol_status",
+        "orders",
+        ["account_id", "symbol", "status"],
+    )
+    op.create_index(
+        "ix_exec_log_acct_created",
+        "execution_logs",
+        ["account_id", sa.text("created_at DESC")],
+        postgresql_include=["level", "category"],
+    )
+
+    # 복합 인덱스 선두 컬럼으로 대체됨
+    op.drop_index("idx_orders_account_id", table_name="orders")
+    op.drop_index("idx_execution_logs_account_id", table_name="execution_logs")
+    op.drop_index("idx_execution_logs_created_at", table_name="execution_logs")
+
+
+def downgrade() -> None:
+    op.create_index("idx_execution_logs_created_at", "execution_logs", ["created_at"])
+    op.create_index("idx_execution_logs_account_id", "execution_logs", ["account_id"])
+    op.create_index("idx_orders_account_id", "orders", ["account_id"])
+
+    op.drop_index("ix_exec_log_acct_created", table_name="execution_logs")
+    op.drop_index("ix_orders_acct_symbol_status", table_name="orders")
+    op.drop_index("ix_orders_acct_status_created", table_name="orders")
@@ -0,0 +1,54 @@
+"""포지션 평가금액/매입원가, 주문 체결률을 DB 생성 컬럼으로 추가
+
+Revision ID: 5e9b1d3c8f42
+Revises: c7d25e9f4a18
+Create Date: 2026-10-15 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e9b1d3c8f42'
+down_revision = 'c7d25e9f4a18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "orders",
+        sa.Column(
+            "fill_rate",
+            sa.Float(),
+            sa.Computed("COALESCE(filled_quantity::float8 / NULLIF(quantity, 0), 0)", persisted=True),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "positions",
+        sa.Column(
+            "market_value",
+            sa.Numeric(18, 4),
+            sa.Computed("quantity * COALESCE(current_price, avg_price)", persisted=True),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "positions",
+        sa.Column(
+            "cost_basis",
+            sa.Numeric(18, 4),
+            sa.Computed("quantity * avg_price", persisted=True),
+            nullable=False,
+        ),
+    )
+    op.create_index("ix_positions_market_value", "positions", ["market_value"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_positions_market_value", table_name="positions")
+    op.drop_column("positions", "cost_basis")
+    op.drop_column("positions", "market_value")
+    op.drop_column("orders", "fill_rate")
@@ -0,0 +1,67 @@
+"""JSON 데이터 컬럼을 TEXT에서 JSONB로 변환
+
+JSON으로 파싱되지 않는 기존 값(평문 오류 메시지 등)은 JSON 문자열로 감싸서 보존합니다.
+
+Revision ID: 8b4e2f6a1c93
+Revises: 3f1a9c2d7b10
+Create Date: 2026-10-15 10:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b4e2f6a1c93'
+down_revision = '3f1a9c2d7b10'
+branch_labels = None
+depends_on = None
+
+
+# (테이블, 컬럼)
+JSONB_COLUMNS = [
+    ("brokerage_accounts", "config"),
+    ("orders", "raw_response"),
+    ("execution_logs", "context"),
+    ("execution_logs", "error_details"),
+    ("strategy_signals", "payload"),
+    ("strategy_signals", "execution_result"),
+]
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE FUNCTION pg_temp.text_to_jsonb(value text) RETURNS jsonb AS $$
+        BEGIN
+            RETURN value::jsonb;
+        EXCEPTION WHEN invalid_text_representation THEN
+            RETURN to_jsonb(value);
+        END;
+        $$ LANGUAGE plpgsql IMMUTABLE
+        """
+    )
+    for table, column in JSONB_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb "
+            f"USING pg_temp.text_to_jsonb({column})"
+        )
+
+    op.create_index(
+        "ix_signal_payload_gin",
+        "strategy_signals",
+        ["payload"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_signal_payload_gin", table_name="strategy_signals")
+
+    for table, column in JSONB_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Text(),
+            postgresql_using=f"{column}::text",
+        )
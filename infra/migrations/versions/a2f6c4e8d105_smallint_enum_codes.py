@@ -0,0 +1,83 @@
+"""주문 상태/로그 레벨/시그널 타입을 Postgres ENUM에서 SMALLINT 코드로 변환
+
+코드 값은 모델의 ORDER_STATUS_CODES, LOG_LEVEL_CODES, SIGNAL_TYPE_CODES와 같습니다.
+(마이그레이션은 모델 변경과 무관하게 재현 가능해야 하므로 값을 복사해 둠)
+
+Revision ID: a2f6c4e8d105
+Revises: 5e9b1d3c8f42
+Create Date: 2026-10-15 10:40:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a2f6c4e8d105'
+down_revision = '5e9b1d3c8f42'
+branch_labels = None
+depends_on = None
+
+
+# (테이블, 컬럼, ENUM 타입, 라벨 → 코드, 기본 라벨)
+ENUM_COLUMNS = [
+    (
+        "orders",
+        "status",
+        "orderstatus",
+        {
+            "PENDING": 1,
+            "PLACED": 2,
+            "PARTIALLY_FILLED": 3,
+            "FILLED": 4,
+            "CANCELLED": 5,
+            "REJECTED": 6,
+            "FAILED": 7,
+        },
+        "PENDING",
+    ),
+    (
+        "execution_logs",
+        "level",
+        "loglevel",
+        {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50},
+        "INFO",
+    ),
+    (
+        "strategy_signals",
+        "signal_type",
+        "signaltype",
+        {"ENTRY": 1, "EXIT": 2, "HOLD": 3, "NEUTRAL": 4},
+        None,
+    ),
+]
+
+
+def upgrade() -> None:
+    for table, column, enum_type, codes, default in ENUM_COLUMNS:
+        cases = " ".join(f"WHEN '{label}' THEN {code}" for label, code in codes.items())
+        if default:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE smallint "
+            f"USING CASE {column} {cases} END"
+        )
+        if default:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT {codes[default]}")
+        op.execute(f"DROP TYPE {enum_type}")
+
+
+def downgrade() -> None:
+    for table, column, enum_type, codes, default in ENUM_COLUMNS:
+        labels = ", ".join(f"'{label}'" for label in codes)
+        cases = " ".join(f"WHEN {code} THEN '{label}'::{enum_type}" for label, code in codes.items())
+        op.execute(f"CREATE TYPE {enum_type} AS ENUM ({labels})")
+        if default:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {enum_type} "
+            f"USING CASE {column} {cases} END"
+        )
+        if default:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'::{enum_type}"
+            )
@@ -0,0 +1,146 @@
+"""execution_logs, strategy_signals를 created_at 기준 월별 RANGE 파티션으로 전환
+
+- 파티션 생성/삭제 함수(create_monthly_partitions, drop_monthly_partitions_before)를 추가합니다.
+  이후 파티션 관리는 Celery beat의 maintain_partitions 작업이 수행합니다.
+- 기존 테이블은 새 파티션 테이블로 복사한 뒤 삭제합니다 (복사 중 쓰기는 잠금으로 대기).
+- 파티션 키는 PK에 포함되어야 하므로 PK는 (id, created_at)이 됩니다.
+
+Revision ID: c7d25e9f4a18
+Revises: 8b4e2f6a1c93
+Create Date: 2026-10-15 10:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7d25e9f4a18'
+down_revision = '8b4e2f6a1c93'
+branch_labels = None
+depends_on = None
+
+
+# 테이블별 외래 키 (이름, 컬럼, 참조 테이블, ON DELETE)
+FOREIGN_KEYS = {
+    "execution_logs": [
+        ("execution_logs_account_id_fkey", "account_id", "brokerage_accounts", "CASCADE"),
+        ("execution_logs_rule_id_fkey", "rule_id", "trade_rules", "SET NULL"),
+    ],
+    "strategy_signals": [
+        ("strategy_signals_rule_id_fkey", "rule_id", "trade_rules", "CASCADE"),
+    ],
+}
+
+# 테이블별 보조 인덱스 (이름, 컬럼, 추가 옵션)
+INDEXES = {
+    "execution_logs": [
+        ("idx_execution_logs_rule_id", ["rule_id"], {}),
+        ("idx_execution_logs_level", ["level"], {}),
+        ("idx_execution_logs_category", ["category"], {}),
+        (
+            "ix_exec_log_acct_created",
+            ["account_id", sa.text("created_at DESC")],
+            {"postgresql_include": ["level", "category"]},
+        ),
+    ],
+    "strategy_signals": [
+        ("idx_strategy_signals_rule_id", ["rule_id"], {}),
+        ("idx_strategy_signals_type", ["signal_type"], {}),
+        ("idx_strategy_signals_symbol", ["symbol"], {}),
+        ("idx_strategy_signals_created_at", ["created_at"], {}),
+        ("ix_signal_payload_gin", ["payload"], {"postgresql_using": "gin"}),
+    ],
+}
+
+# 월 파티션 생성/삭제 함수 (supabase_init.sql과 동일한 정의)
+PARTITION_FUNCTIONS = [
+    """
+CREATE OR REPLACE FUNCTION create_monthly_partitions(parent text, from_month date, to_month date)
+RETURNS void AS $$
+DECLARE
+    bound_from date := date_trunc('month', from_month)::date;
+BEGIN
+    WHILE bound_from <= to_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            parent || '_' || to_char(bound_from, 'YYYYMM'),
+            parent,
+            bound_from,
+            (bound_from + interval '1 month')::date
+        );
+        bound_from := (bound_from + interval '1 month')::date;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql
+""",
+    """
+CREATE OR REPLACE FUNCTION drop_monthly_partitions_before(parent text, cutoff date)
+RETURNS integer AS $$
+DECLARE
+    partition_name text;
+    dropped integer := 0;
+BEGIN
+    FOR partition_name IN
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = parent::regclass
+          AND c.relname ~ ('^' || parent || '_[0-9]{6}$')
+    LOOP
+        IF (to_date(right(partition_name, 6), 'YYYYMM') + interval '1 month')::date <= cutoff THEN
+            EXECUTE format('DROP TABLE %I', partition_name);
+            dropped := dropped + 1;
+        END IF;
+    END LOOP;
+    RETURN dropped;
+END;
+$$ LANGUAGE plpgsql
+""",
+]
+
+
+def _create_constraints_and_indexes(table: str, primary_key: list[str]) -> None:
+    """테이블 복사 후 PK/FK/인덱스 재생성"""
+    op.create_primary_key(f"{table}_pkey", table, primary_key)
+    for name, column, referent, ondelete in FOREIGN_KEYS[table]:
+        op.create_foreign_key(name, table, referent, [column], ["id"], ondelete=ondelete)
+    for name, columns, options in INDEXES[table]:
+        op.create_index(name, table, columns, **options)
+
+
+def upgrade() -> None:
+    for function in PARTITION_FUNCTIONS:
+        op.execute(function)
+
+    for table in FOREIGN_KEYS:
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_unpartitioned")
+        op.execute(
+            f"CREATE TABLE {table} (LIKE {table}_unpartitioned INCLUDING DEFAULTS) "
+            f"PARTITION BY RANGE (created_at)"
+        )
+        # 기존 데이터가 있는 월부터 2개월 뒤까지 파티션 생성
+        op.execute(
+            f"SELECT create_monthly_partitions("
+            f"'{table}', "
+            f"COALESCE((SELECT min(created_at) FROM {table}_unpartitioned), now())::date, "
+            f"(now() + interval '2 months')::date)"
+        )
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+        op.execute(f"INSERT INTO {table} SELECT * FROM {table}_unpartitioned")
+        op.execute(f"DROP TABLE {table}_unpartitioned")
+
+        _create_constraints_and_indexes(table, ["id", "created_at"])
+
+
+def downgrade() -> None:
+    for table in FOREIGN_KEYS:
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_partitioned")
+        op.execute(f"CREATE TABLE {table} (LIKE {table}_partitioned INCLUDING DEFAULTS)")
+        op.execute(f"INSERT INTO {table} SELECT * FROM {table}_partitioned")
+        op.execute(f"DROP TABLE {table}_partitioned")
+
+        _create_constraints_and_indexes(table, ["id"])
+
+    op.execute("DROP FUNCTION drop_monthly_partitions_before(text, date)")
+    op.execute("DROP FUNCTION create_monthly_partitions(text, date, date)")
@@ -0,0 +1,40 @@
+"""미실행 시그널/진행 중 주문 폴링용 부분 인덱스
+
+signal_type, status는 SMALLINT 코드 (a2f6c4e8d105)
+- ENTRY=1, EXIT=2
+- PENDING=1, PLACED=2, PARTIALLY_FILLED=3
+
+Revision ID: d91e7a3b5c64
+Revises: a2f6c4e8d105
+Create Date: 2026-10-15 10:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd91e7a3b5c64'
+down_revision = 'a2f6c4e8d105'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_signal_pending",
+        "strategy_signals",
+        ["rule_id", "created_at"],
+        postgresql_where=sa.text("executed = false AND signal_type IN (1, 2)"),
+    )
+    op.create_index(
+        "ix_orders_open",
+        "orders",
+        ["account_id"],
+        postgresql_where=sa.text("status <= 3"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_orders_open", table_name="orders")
+    op.drop_index("ix_signal_pending", table_name="strategy_signals")
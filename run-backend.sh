@@ -1,4 +1,4 @@
 cd /Users/jasonim/cursor-workspace/alpha-ai
 PYTHONPATH=/Users/jasonim/cursor-workspace/alpha-ai
 lsof -ti:8000 | xargs kill -9
-poetry run uvicorn app.backend.main:app --reload --host 0.0.0.0 --port 8000
\ No newline at end of file
+poetry run uvicorn app.backend.main:app --reload --host 0.0.0.0 --port 8000 --loop uvloop
\ No newline at end of file
@@ -21,14 +21,8 @@ CREATE TYPE accounthealthstatus AS ENUM ('HEALTHY', 'WARNING', 'ERROR', 'INACTIV
 -- 주문 방향
 CREATE TYPE orderside AS ENUM ('BUY', 'SELL');
 
--- 주문 상태
-CREATE TYPE orderstatus AS ENUM ('PENDING', 'PLACED', 'PARTIALLY_FILLED', 'FILLED', 'CANCELLED', 'REJECTED', 'FAILED');
-
--- 로그 레벨
-CREATE TYPE loglevel AS ENUM ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL');
-
--- 시그널 타입
-CREATE TYPE signaltype AS ENUM ('ENTRY', 'EXIT', 'HOLD', 'NEUTRAL');
+-- 주문 상태, 로그 레벨, 시그널 타입은 ENUM 대신 SMALLINT 코드로 저장
+-- (코드 매핑은 모델의 ORDER_STATUS_CODES, LOG_LEVEL_CODES, SIGNAL_TYPE_CODES)
 
 -- 2. 사용자 테이블
 -- =============================================
@@ -56,7 +50,7 @@ CREATE TABLE brokerage_accounts (
     enabled BOOLEAN DEFAULT false NOT NULL,
     health_status accounthealthstatus DEFAULT 'INACTIVE' NOT NULL,
     last_heartbeat TIMESTAMP WITH TIME ZONE,
-    config TEXT, -- JSON 형식의 추가 설정
+    config JSONB, -- 추가 설정
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL
 );
@@ -107,17 +101,19 @@ CREATE TABLE orders (
     side orderside NOT NULL,
     quantity INTEGER NOT NULL,
     price NUMERIC(12, 4), -- 주문가격 (시장가는 NULL)
-    status orderstatus DEFAULT 'PENDING' NOT NULL,
+    status SMALLINT DEFAULT 1 NOT NULL, -- 1 PENDING, 2 PLACED, 3 PARTIALLY_FILLED, 4 FILLED, 5 CANCELLED, 6 REJECTED, 7 FAILED
     broker_order_id VARCHAR(100) UNIQUE, -- 브로커 주문번호
     filled_quantity INTEGER DEFAULT 0 NOT NULL,
     avg_fill_price NUMERIC(12, 4),
     commission NUMERIC(8, 4),
-    raw_response TEXT, -- 브로커 API 원본 응답 (JSON)
+    raw_response JSONB, -- 브로커 API 원본 응답
     placed_at TIMESTAMP WITH TIME ZONE,
     filled_at TIMESTAMP WITH TIME ZONE,
     cancelled_at TIMESTAMP WITH TIME ZONE,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    -- DB 생성 컬럼
+    fill_rate DOUBLE PRECISION GENERATED ALWAYS AS (COALESCE(filled_quantity::float8 / NULLIF(quantity, 0), 0)) STORED NOT NULL -- 체결률
 );
 
 -- 7. 포지션 테이블
@@ -132,39 +128,93 @@ CREATE TABLE positions (
     unrealized_pnl NUMERIC(12, 2), -- 미실현 손익
     unrealized_pnl_percent NUMERIC(8, 4), -- 미실현 손익률 (%)
     opened_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    -- DB 생성 컬럼
+    market_value NUMERIC(18, 4) GENERATED ALWAYS AS (quantity * COALESCE(current_price, avg_price)) STORED NOT NULL, -- 시장가치
+    cost_basis NUMERIC(18, 4) GENERATED ALWAYS AS (quantity * avg_price) STORED NOT NULL -- 매입원가
 );
 
--- 8. 실행 로그 테이블
+-- 8. 실행 로그 테이블 (created_at 기준 월별 파티션, 파티션 키는 PK에 포함)
 -- =============================================
 CREATE TABLE execution_logs (
-    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    id UUID DEFAULT gen_random_uuid(),
     account_id UUID NOT NULL REFERENCES brokerage_accounts(id) ON DELETE CASCADE,
     rule_id UUID REFERENCES trade_rules(id) ON DELETE SET NULL,
-    level loglevel DEFAULT 'INFO' NOT NULL,
+    level SMALLINT DEFAULT 20 NOT NULL, -- 10 DEBUG, 20 INFO, 30 WARNING, 40 ERROR, 50 CRITICAL
     category VARCHAR(50) NOT NULL, -- 로그 카테고리 (order, position, auth, etc)
     message TEXT NOT NULL,
-    context TEXT, -- 추가 컨텍스트 데이터 (JSON)
+    context JSONB, -- 추가 컨텍스트 데이터
     error_code VARCHAR(50),
-    error_details TEXT,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL
-);
+    error_details JSONB,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
 
--- 9. 전략 시그널 테이블
+-- 9. 전략 시그널 테이블 (created_at 기준 월별 파티션, 파티션 키는 PK에 포함)
 -- =============================================
 CREATE TABLE strategy_signals (
-    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    id UUID DEFAULT gen_random_uuid(),
     rule_id UUID NOT NULL REFERENCES trade_rules(id) ON DELETE CASCADE,
-    signal_type signaltype NOT NULL,
+    signal_type SMALLINT NOT NULL, -- 1 ENTRY, 2 EXIT, 3 HOLD, 4 NEUTRAL
     symbol VARCHAR(20) NOT NULL,
     score NUMERIC(5, 4), -- 시그널 강도 (0.0 ~ 1.0)
     confidence NUMERIC(5, 4), -- 신뢰도 (0.0 ~ 1.0)
-    payload TEXT, -- 시그널 상세 데이터 (JSON)
+    payload JSONB, -- 시그널 상세 데이터
     executed BOOLEAN DEFAULT false NOT NULL, -- 시그널 실행 여부
     executed_at TIMESTAMP WITH TIME ZONE,
-    execution_result TEXT, -- 실행 결과 (JSON)
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL
-);
+    execution_result JSONB, -- 실행 결과
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- 9-1. 월별 파티션 관리 함수
+-- =============================================
+-- 이후 파티션 생성/보존 기간 정리는 Celery beat의 maintain_partitions 작업이 수행
+CREATE OR REPLACE FUNCTION create_monthly_partitions(parent text, from_month date, to_month date)
+RETURNS void AS $$
+DECLARE
+    bound_from date := date_trunc('month', from_month)::date;
+BEGIN
+    WHILE bound_from <= to_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            parent || '_' || to_char(bound_from, 'YYYYMM'),
+            parent,
+            bound_from,
+            (bound_from + interval '1 month')::date
+        );
+        bound_from := (bound_from + interval '1 month')::date;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION drop_monthly_partitions_before(parent text, cutoff date)
+RETURNS integer AS $$
+DECLARE
+    partition_name text;
+    dropped integer := 0;
+BEGIN
+    FOR partition_name IN
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = parent::regclass
+          AND c.relname ~ ('^' || parent || '_[0-9]{6}$')
+    LOOP
+        IF (to_date(right(partition_name, 6), 'YYYYMM') + interval '1 month')::date <= cutoff THEN
+            EXECUTE format('DROP TABLE %I', partition_name);
+            dropped := dropped + 1;
+        END IF;
+    END LOOP;
+    RETURN dropped;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 이번 달부터 2개월 뒤까지 파티션 생성, 파티션이 없는 구간은 DEFAULT 파티션에 저장
+SELECT create_monthly_partitions('execution_logs', now()::date, (now() + interval '2 months')::date);
+SELECT create_monthly_partitions('strategy_signals', now()::date, (now() + interval '2 months')::date);
+CREATE TABLE execution_logs_default PARTITION OF execution_logs DEFAULT;
+CREATE TABLE strategy_signals_default PARTITION OF strategy_signals DEFAULT;
 
 -- 10. 인덱스 생성
 -- =============================================
@@ -184,29 +234,33 @@ CREATE INDEX idx_trade_rules_account_id ON trade_rules(account_id);
 CREATE INDEX idx_trade_rules_symbol ON trade_rules(symbol);
 CREATE INDEX idx_trade_rules_enabled ON trade_rules(enabled);
 
--- 주문
-CREATE INDEX idx_orders_account_id ON orders(account_id);
+-- 주문 (account_id 단독 조회는 복합 인덱스가 처리)
 CREATE INDEX idx_orders_rule_id ON orders(rule_id);
 CREATE INDEX idx_orders_symbol ON orders(symbol);
 CREATE INDEX idx_orders_status ON orders(status);
 CREATE INDEX idx_orders_created_at ON orders(created_at);
+CREATE INDEX ix_orders_acct_status_created ON orders(account_id, status, created_at DESC);
+CREATE INDEX ix_orders_acct_symbol_status ON orders(account_id, symbol, status);
+CREATE INDEX ix_orders_open ON orders(account_id) WHERE status <= 3; -- 진행 중 주문 (PENDING, PLACED, PARTIALLY_FILLED)
 
 -- 포지션
 CREATE INDEX idx_positions_account_id ON positions(account_id);
 CREATE INDEX idx_positions_symbol ON positions(symbol);
+CREATE INDEX ix_positions_market_value ON positions(market_value);
 
--- 실행 로그
-CREATE INDEX idx_execution_logs_account_id ON execution_logs(account_id);
+-- 실행 로그 (계좌별 최신 로그 조회는 level/category를 포함한 복합 인덱스로 처리)
 CREATE INDEX idx_execution_logs_rule_id ON execution_logs(rule_id);
 CREATE INDEX idx_execution_logs_level ON execution_logs(level);
 CREATE INDEX idx_execution_logs_category ON execution_logs(category);
-CREATE INDEX idx_execution_logs_created_at ON execution_logs(created_at);
+CREATE INDEX ix_exec_log_acct_created ON execution_logs(account_id, created_at DESC) INCLUDE (level, category);
 
 -- 전략 시그널
 CREATE INDEX idx_strategy_signals_rule_id ON strategy_signals(rule_id);
 CREATE INDEX idx_strategy_signals_type ON strategy_signals(signal_type);
 CREATE INDEX idx_strategy_signals_symbol ON strategy_signals(symbol);
 CREATE INDEX idx_strategy_signals_created_at ON strategy_signals(created_at);
+CREATE INDEX ix_signal_payload_gin ON strategy_signals USING gin (payload); -- payload 포함(@>) 조회용
+CREATE INDEX ix_signal_pending ON strategy_signals(rule_id, created_at) WHERE executed = false AND signal_type IN (1, 2); -- 미실행 ENTRY/EXIT
 
 -- 11. 트리거 함수 (updated_at 자동 업데이트)
 -- =============================================
@@ -226,7 +280,17 @@ CREATE TRIGGER update_trade_rules_updated_at BEFORE UPDATE ON trade_rules FOR EA
 CREATE TRIGGER update_orders_updated_at BEFORE UPDATE ON orders FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_positions_updated_at BEFORE UPDATE ON positions FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
--- 12. 샘플 데이터 (선택적)
+-- 12. 마이그레이션 버전
+-- =============================================
+-- 이 스크립트는 최신 스키마를 생성하므로 alembic 리비전을 head로 기록합니다.
+-- (기존 DB는 이 스크립트 대신 `alembic upgrade head`로 갱신)
+CREATE TABLE IF NOT EXISTS alembic_version (
+    version_num VARCHAR(32) NOT NULL,
+    CONSTRAINT alembic_version_pkc PRIMARY KEY (version_num)
+);
+INSERT INTO alembic_version (version_num) VALUES ('d91e7a3b5c64');
+
+-- 13. 샘플 데이터 (선택적)
 -- =============================================
 -- 관리자 계정 생성 (비밀번호: admin123)
 INSERT INTO users (email, password_hash, name, role, is_active, is_verified) 
@@ -0,0 +1,11 @@
+"""
+테스트 공통 설정
+설정(Settings)은 import 시점에 필수 환경변수를 검증하므로 앱 모듈을 불러오기 전에 더미 값을 지정합니다.
+"""
+
+import os
+
+os.environ.setdefault("KIS_APP_KEY", "test-app-key")
+os.environ.setdefault("KIS_APP_SECRET", "test-app-secret")
+os.environ.setdefault("KIS_ACCOUNT_NO", "12345678-01")
+os.environ.setdefault("DEBUG", "false")
@@ -0,0 +1,140 @@
+"""
+kis.auth 단위 테스트 (토큰 캐시 파일 / mtime 처리)
+"""
+
+import asyncio
+import fcntl
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import orjson
+import pytest
+
+from app.backend.kis import auth
+from app.backend.kis.auth import AccessToken, KISAuthService
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """캐시 디렉토리를 임시 HOME으로 옮기고 프로세스 메모리 캐시를 비움"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    auth._MEM_TOKEN_CACHE.clear()
+    yield tmp_path
+    auth._MEM_TOKEN_CACHE.clear()
+
+
+@pytest.fixture
+def token_server():
+    """발급 요청마다 새 토큰을 돌려주는 KIS 토큰 엔드포인트"""
+    issued = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        issued.append(request)
+        return httpx.Response(200, json={
+            "access_token": f"token-{len(issued)}",
+            "token_type": "Bearer",
+            "expires_in": 86400,
+        })
+
+    return issued, httpx.MockTransport(handler)
+
+
+def _service(transport: httpx.MockTransport) -> KISAuthService:
+    client = httpx.AsyncClient(base_url="https://kis.test", transport=transport)
+    return KISAuthService(app_key="test-app-key", app_secret="test-app-secret", use_sandbox=True, http_client=client)
+
+
+def _token(access_token: str, expires_in: timedelta) -> AccessToken:
+    return AccessToken(
+        access_token=access_token,
+        token_type="Bearer",
+        expires_in=int(expires_in.total_seconds()),
+        expires_at=datetime.now(timezone.utc) + expires_in,
+    )
+
+
+async def test_issued_token_is_written_to_cache_file(token_server):
+    issued, transport = token_server
+    service = _service(transport)
+
+    token = await service.get_access_token()
+
+    data = orjson.loads(service._token_cache_file.read_bytes())
+    assert data["access_token"] == token.access_token == "token-1"
+    assert service._cache_file_mtime == service._token_cache_file.stat().st_mtime_ns
+    assert not service._token_tmp_file.exists()
+
+
+async def test_new_process_loads_token_from_cache_file(token_server):
+    issued, transport = token_server
+    await _service(transport).get_access_token()
+
+    # 다른 프로세스: 메모리 캐시 없이 파일에서 로드
+    auth._MEM_TOKEN_CACHE.clear()
+    token = await _service(transport).get_access_token()
+
+    assert token.access_token == "token-1"
+    assert len(issued) == 1
+
+
+async def test_expired_cache_file_is_removed(token_server):
+    _, transport = token_server
+    service = _service(transport)
+    service._token_cache_file.write_bytes(orjson.dumps(_token("old", timedelta(minutes=-1)).to_dict()))
+
+    assert _service(transport)._current_token is None
+    assert not service._token_cache_file.exists()
+
+
+async def test_corrupted_cache_file_is_removed(token_server):
+    _, transport = token_server
+    service = _service(transport)
+    service._token_cache_file.write_bytes(b"{not json")
+
+    assert _service(transport)._current_token is None
+    assert not service._token_cache_file.exists()
+
+
+async def test_peer_token_is_read_only_when_file_mtime_changes(token_server, monkeypatch):
+    issued, transport = token_server
+    service = _service(transport)
+    first = await service.get_access_token()
+
+    reads = []
+    read_token_file = service._read_token_file
+    monkeypatch.setattr(service, "_read_token_file", lambda: reads.append(1) or read_token_file())
+
+    # 파일이 그대로면 다시 읽지 않음
+    auth._MEM_TOKEN_CACHE.clear()
+    assert service._load_peer_token(first, force_refresh=True) is None
+    assert reads == []
+
+    # 다른 프로세스가 새 토큰을 기록하면 mtime 변화로 감지해 재사용 (발급 요청 없음)
+    other = _service(transport)
+    other._write_token_file(_token("peer", timedelta(hours=1)))
+    token = await service.get_access_token(force_refresh=True)
+
+    assert token.access_token == "peer"
+    assert reads == [1]
+    assert len(issued) == 1
+
+
+async def test_file_lock_wait_does_not_block_event_loop(token_server):
+    _, transport = token_server
+    service = _service(transport)
+
+    # 다른 프로세스가 캐시 파일 잠금을 잡고 있는 상황
+    with open(service._token_lock_file, "a+b") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        task = asyncio.create_task(service.get_access_token())
+
+        ticks = 0
+        while ticks < 5:
+            await asyncio.sleep(0.01)
+            ticks += 1
+        assert not task.done()
+
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    token = await asyncio.wait_for(task, 5)
+    assert orjson.loads(service._token_cache_file.read_bytes())["access_token"] == token.access_token
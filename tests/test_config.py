@@ -0,0 +1,31 @@
+"""
+core.config 단위 테스트 (RuntimeSettings)
+"""
+
+import dataclasses
+from typing import get_type_hints
+
+import pytest
+
+from app.backend.core.config import RuntimeSettings, Settings, settings
+
+
+def test_runtime_settings_mirrors_settings_fields():
+    hints = get_type_hints(RuntimeSettings)
+
+    for name, field in Settings.model_fields.items():
+        assert hints[name] == field.annotation, name
+
+
+def test_runtime_settings_includes_derived_values():
+    source = Settings()
+
+    assert settings.database_url == source.database_url
+    assert settings.kis_base_url == source.kis_base_url
+    assert settings.kis_ws_url == source.kis_ws_url
+    assert settings.cors_origins_set == frozenset(source.cors_origins)
+
+
+def test_runtime_settings_is_frozen():
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        settings.debug = True
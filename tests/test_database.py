@@ -0,0 +1,83 @@
+"""
+core.database 단위 테스트 (uuid7, SmallIntEnum)
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.backend.core.database import SmallIntEnum, uuid7
+from app.backend.models.logging import LOG_LEVEL_CODES, SIGNAL_TYPE_CODES, LogLevel, SignalType
+from app.backend.models.trading import ORDER_STATUS_CODES, Order, OrderStatus
+
+
+def test_uuid7_version_and_variant():
+    value = uuid7()
+
+    assert isinstance(value, uuid.UUID)
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_embeds_millisecond_timestamp(monkeypatch):
+    monkeypatch.setattr("app.backend.core.database.time.time_ns", lambda: 1_700_000_000_123_456_789)
+
+    assert uuid7().int >> 80 == 1_700_000_000_123
+
+
+def test_uuid7_is_time_ordered():
+    values = [uuid7() for _ in range(1000)]
+
+    # 같은 밀리초 안의 순서는 난수 비트라 보장되지 않으므로 타임스탬프 부분만 비교
+    timestamps = [value.int >> 80 for value in values]
+    assert timestamps == sorted(timestamps)
+    assert len(set(values)) == len(values)
+
+
+@pytest.mark.parametrize(
+    ("enum_class", "codes"),
+    [
+        (OrderStatus, ORDER_STATUS_CODES),
+        (LogLevel, LOG_LEVEL_CODES),
+        (SignalType, SIGNAL_TYPE_CODES),
+    ],
+)
+def test_small_int_enum_round_trip(enum_class, codes):
+    column_type = SmallIntEnum(enum_class, codes)
+    dialect = postgresql.dialect()
+
+    # 모든 멤버에 고유한 코드가 있어야 함
+    assert set(codes) == set(enum_class)
+    assert len(set(codes.values())) == len(codes)
+
+    for member in enum_class:
+        code = column_type.process_bind_param(member, dialect)
+        assert code == codes[member]
+        assert column_type.process_result_value(code, dialect) is member
+        # 문자열 값으로 지정해도 같은 코드로 저장
+        assert column_type.process_bind_param(member.value, dialect) == code
+
+
+def test_small_int_enum_passes_none_through():
+    column_type = SmallIntEnum(OrderStatus, ORDER_STATUS_CODES)
+    dialect = postgresql.dialect()
+
+    assert column_type.process_bind_param(None, dialect) is None
+    assert column_type.process_result_value(None, dialect) is None
+
+
+def test_small_int_enum_rejects_unknown_value():
+    column_type = SmallIntEnum(OrderStatus, ORDER_STATUS_CODES)
+
+    with pytest.raises(ValueError):
+        column_type.process_bind_param("UNKNOWN", postgresql.dialect())
+
+
+def test_small_int_enum_orm_filter_compiles_to_code():
+    query = select(Order.id).where(Order.status <= OrderStatus.PARTIALLY_FILLED)
+    compiled = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+
+    # 부분 인덱스 ix_orders_open의 조건(status <= 3)과 같은 형태
+    assert "orders.status <= 3" in str(compiled)
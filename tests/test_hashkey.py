@@ -0,0 +1,63 @@
+"""
+kis.hashkey 단위 테스트 (서명 캐시)
+"""
+
+import base64
+import hashlib
+import hmac
+
+import pytest
+
+from app.backend.kis.hashkey import HashKeyService
+
+ORDER = {
+    "CANO": "12345678",
+    "ACNT_PRDT_CD": "01",
+    "OVRS_EXCG_CD": "NASD",
+    "PDNO": "AAPL",
+    "ORD_QTY": "10",
+    "OVRS_ORD_UNPR": "189.5000",
+    "ORD_SVR_DVSN_CD": "0",
+    "ORD_DVSN": "00",
+}
+
+
+@pytest.fixture
+def service() -> HashKeyService:
+    return HashKeyService(app_key="test-app-key", app_secret="test-app-secret")
+
+
+def test_sign_order_matches_hmac_of_body(service):
+    hashkey, body = service.sign_order(ORDER)
+
+    expected = base64.b64encode(hmac.new(b"test-app-secret", body, hashlib.sha256).digest()).decode()
+    assert hashkey == expected
+
+
+def test_cached_signature_equals_uncached(service):
+    first = service.sign_order(ORDER)
+    second = service.sign_order(dict(ORDER))
+
+    assert second == first
+    assert service._hashkey_for_body.cache_info().hits == 1
+    # 캐시를 거치지 않은 계산과도 같아야 함
+    assert service._compute_hashkey(first[1]) == first[0]
+
+
+def test_different_body_gets_different_signature(service):
+    hashkey, _ = service.sign_order(ORDER)
+    other, _ = service.sign_order({**ORDER, "ORD_QTY": "11"})
+
+    assert other != hashkey
+    assert service._hashkey_for_body.cache_info().misses == 2
+
+
+def test_cache_is_per_secret(service):
+    other_service = HashKeyService(app_key="test-app-key", app_secret="other-secret")
+
+    assert other_service.sign_order(ORDER)[0] != service.sign_order(ORDER)[0]
+
+
+def test_sign_order_requires_fields(service):
+    with pytest.raises(ValueError):
+        service.sign_order({"CANO": "12345678", "ACNT_PRDT_CD": "01"})
@@ -0,0 +1,88 @@
+"""
+main 단위 테스트 (시세 조회 캐시/동시 요청 합치기)
+"""
+
+import asyncio
+
+import pytest
+
+from app.backend import main
+
+
+@pytest.fixture(autouse=True)
+def market_state(monkeypatch):
+    main._market_cache.clear()
+    main._market_inflight.clear()
+    calls = []
+    release = asyncio.Event()
+
+    async def fake_fetch(symbol):
+        calls.append(symbol)
+        await release.wait()
+        return None if symbol == "NONE" else {"symbol": symbol, "call": len(calls)}
+
+    monkeypatch.setattr(main, "_fetch_market_data_from_kis", fake_fetch)
+    yield calls, release
+    main._market_cache.clear()
+    main._market_inflight.clear()
+
+
+async def test_concurrent_lookups_share_one_fetch(market_state):
+    calls, release = market_state
+
+    tasks = [asyncio.create_task(main.get_market_data_from_kis("AAPL")) for _ in range(10)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == ["AAPL"]
+    assert all(result == {"symbol": "AAPL", "call": 1} for result in results)
+    assert not main._market_inflight
+
+
+async def test_cached_result_served_within_ttl(market_state, monkeypatch):
+    calls, release = market_state
+    release.set()
+    now = [100.0]
+    monkeypatch.setattr(main.time, "monotonic", lambda: now[0])
+
+    await main.get_market_data_from_kis("AAPL")
+    now[0] += main.MARKET_CACHE_TTL_SECONDS / 2
+    await main.get_market_data_from_kis("AAPL")
+    assert calls == ["AAPL"]
+
+    now[0] += main.MARKET_CACHE_TTL_SECONDS
+    assert await main.get_market_data_from_kis("AAPL") == {"symbol": "AAPL", "call": 2}
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_fetch(market_state):
+    calls, release = market_state
+
+    first = asyncio.create_task(main.get_market_data_from_kis("AAPL"))
+    second = asyncio.create_task(main.get_market_data_from_kis("AAPL"))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == {"symbol": "AAPL", "call": 1}
+    assert first.cancelled()
+
+
+async def test_failed_lookup_is_not_cached(market_state):
+    calls, release = market_state
+    release.set()
+
+    assert await main.get_market_data_from_kis("NONE") is None
+    assert await main.get_market_data_from_kis("NONE") is None
+    assert calls == ["NONE", "NONE"]
+
+
+async def test_cache_size_is_bounded(market_state, monkeypatch):
+    _, release = market_state
+    release.set()
+    monkeypatch.setattr(main, "MARKET_CACHE_MAXSIZE", 3)
+
+    for symbol in ("A", "B", "C", "D", "E"):
+        await main.get_market_data_from_kis(symbol)
+
+    assert list(main._market_cache) == ["C", "D", "E"]
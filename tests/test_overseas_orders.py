@@ -0,0 +1,233 @@
+"""
+kis.overseas_orders 단위 테스트 (잔고/체결 응답 파싱, 주문 재시도)
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from app.backend.kis.overseas_orders import (
+    _EXECUTIONS_ADAPTER,
+    _POSITIONS_ADAPTER,
+    Execution,
+    OrderSide,
+    OverseasOrderApi,
+    Position,
+    _parse_exec_dt,
+)
+
+POSITION_ITEM = {
+    "ovrs_pdno": "AAPL",
+    "ovrs_item_name": "애플",
+    "ovrs_cblc_qty": "10",
+    "pchs_avg_pric": "150.2500",
+    "now_pric2": "189.123456",
+    "ovrs_stck_evlu_amt": "1891.23",
+    "frcr_evlu_pfls_amt": "388.73",
+    "evlu_pfls_rt": "25.87",
+    "unused_field": "ignored",
+}
+
+EXECUTION_ITEM = {
+    "odno": "0000123456",
+    "pdno": "TSLA",
+    "sll_buy_dvsn_cd": "02",
+    "ft_ccld_qty": "5",
+    "ft_ccld_unpr3": "251.3000",
+    "dmst_ord_dt": "20241015",
+    "ft_ccld_tmd": "223015",
+}
+
+
+def test_position_from_kis_item():
+    position = Position.model_validate(POSITION_ITEM)
+
+    assert position.symbol == "AAPL"
+    assert position.name == "애플"
+    assert position.quantity == 10
+    # 금액은 원문 문자열에서 바로 Decimal 변환 (float 반올림 없음)
+    assert position.avg_price == Decimal("150.2500")
+    assert position.current_price == Decimal("189.123456")
+    assert position.eval_amount == Decimal("1891.23")
+    assert position.profit_loss == Decimal("388.73")
+    assert position.profit_loss_rate == Decimal("25.87")
+
+
+def test_position_missing_field_fails():
+    item = dict(POSITION_ITEM)
+    del item["now_pric2"]
+
+    with pytest.raises(ValidationError):
+        Position.model_validate(item)
+
+
+@pytest.mark.parametrize("value", ["", "N/A", "1.2.3"])
+def test_position_malformed_amount_fails_at_parse_time(value):
+    with pytest.raises(ValidationError):
+        Position.model_validate({**POSITION_ITEM, "now_pric2": value})
+
+
+def test_position_serializes_public_field_names():
+    position = Position.model_validate(POSITION_ITEM)
+
+    assert position.model_dump() == {
+        "symbol": "AAPL",
+        "name": "애플",
+        "quantity": 10,
+        "avg_price": Decimal("150.2500"),
+        "current_price": Decimal("189.123456"),
+        "eval_amount": Decimal("1891.23"),
+        "profit_loss": Decimal("388.73"),
+        "profit_loss_rate": Decimal("25.87"),
+    }
+
+
+def test_position_accepts_field_names():
+    position = Position(
+        symbol="AAPL",
+        name="애플",
+        quantity=1,
+        avg_price=Decimal("1.5"),
+        current_price=Decimal("2"),
+        eval_amount=Decimal("2"),
+        profit_loss=Decimal("0.5"),
+        profit_loss_rate=Decimal("33.33"),
+    )
+
+    assert position == Position.model_validate(position.model_dump(by_alias=True))
+
+
+def test_positions_adapter_validates_list():
+    positions = _POSITIONS_ADAPTER.validate_python([POSITION_ITEM, {**POSITION_ITEM, "ovrs_pdno": "MSFT"}])
+
+    assert [position.symbol for position in positions] == ["AAPL", "MSFT"]
+
+
+@pytest.mark.parametrize(("code", "side"), [("02", OrderSide.BUY), ("01", OrderSide.SELL)])
+def test_execution_from_kis_item(code, side):
+    execution = Execution.model_validate({**EXECUTION_ITEM, "sll_buy_dvsn_cd": code})
+
+    assert execution.order_id == "0000123456"
+    assert execution.symbol == "TSLA"
+    assert execution.side is side
+    assert execution.executed_qty == 5
+    assert execution.executed_price == Decimal("251.3000")
+    assert execution.executed_time == datetime(2024, 10, 15, 22, 30, 15)
+
+
+def test_parse_exec_dt_matches_strptime():
+    parsed = _parse_exec_dt("20241015", "223015")
+
+    assert parsed == datetime.strptime("20241015 223015", "%Y%m%d %H%M%S")
+    assert parsed.tzinfo is None
+    # 같은 체결시각은 캐시된 객체를 재사용
+    assert _parse_exec_dt("20241015", "223015") is parsed
+
+
+def test_execution_from_model_fields():
+    execution = Execution(
+        order_id="1",
+        symbol="AAPL",
+        side=OrderSide.SELL,
+        executed_qty=1,
+        executed_price=Decimal("1.5"),
+        executed_time=datetime(2024, 1, 2, 3, 4, 5),
+    )
+
+    assert execution.executed_price == Decimal("1.5")
+
+
+def test_execution_malformed_price_fails_at_parse_time():
+    with pytest.raises(ValidationError):
+        Execution.model_validate({**EXECUTION_ITEM, "ft_ccld_unpr3": ""})
+
+
+def test_executions_adapter_validates_list():
+    executions = _EXECUTIONS_ADAPTER.validate_python([EXECUTION_ITEM, {**EXECUTION_ITEM, "odno": "0000123457"}])
+
+    assert [execution.order_id for execution in executions] == ["0000123456", "0000123457"]
+
+
+class _FakeAuthService:
+    """토큰 발급 없이 고정 헤더만 돌려주는 인증 서비스"""
+
+    async def ensure_token(self):
+        return None
+
+    def get_headers(self, token):
+        return {}
+
+
+def _api(handler) -> OverseasOrderApi:
+    client = httpx.AsyncClient(base_url="https://kis.test", transport=httpx.MockTransport(handler))
+    return OverseasOrderApi(auth_service=_FakeAuthService(), account_no="12345678-01", http_client=client)
+
+
+async def test_get_positions_skips_zero_quantities():
+    quantities = ["10", "0", "00", "0.0000", "", "3"]
+    output1 = [{**POSITION_ITEM, "ovrs_pdno": f"S{i}", "ovrs_cblc_qty": qty} for i, qty in enumerate(quantities)]
+    api = _api(lambda request: httpx.Response(200, json={"output1": output1}))
+
+    positions = await api.get_positions()
+
+    assert [(position.symbol, position.quantity) for position in positions] == [("S0", 10), ("S5", 3)]
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """재시도 대기 없이 대기 시간만 기록"""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("app.backend.kis.overseas_orders.asyncio.sleep", fake_sleep)
+    return delays
+
+
+@pytest.mark.parametrize("error", [httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout])
+async def test_post_with_retry_retries_connect_errors(error, no_sleep):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) < OverseasOrderApi.ORDER_MAX_ATTEMPTS:
+            raise error("not connected", request=request)
+        return httpx.Response(200, json={})
+
+    response = await _api(handler)._post_with_retry("/order", {}, b"{}")
+
+    assert response.status_code == 200
+    assert len(calls) == OverseasOrderApi.ORDER_MAX_ATTEMPTS
+    assert no_sleep == [2, 4]
+
+
+async def test_post_with_retry_gives_up_after_max_attempts(no_sleep):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ConnectError("not connected", request=request)
+
+    with pytest.raises(httpx.ConnectError):
+        await _api(handler)._post_with_retry("/order", {}, b"{}")
+
+    assert len(calls) == OverseasOrderApi.ORDER_MAX_ATTEMPTS
+
+
+async def test_post_with_retry_never_retries_read_timeout(no_sleep):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        # 요청이 서버에 도달했을 수 있으므로 재전송하면 주문이 중복될 수 있음
+        raise httpx.ReadTimeout("no response", request=request)
+
+    with pytest.raises(httpx.ReadTimeout):
+        await _api(handler)._post_with_retry("/order", {}, b"{}")
+
+    assert len(calls) == 1
+    assert no_sleep == []
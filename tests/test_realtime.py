@@ -0,0 +1,134 @@
+"""
+kis.realtime 단위 테스트 (실시간 데이터 파서, 송신 큐)
+"""
+
+import asyncio
+
+import simdjson
+
+from app.backend.kis.realtime import _REALTIME_PARSERS, RealtimeClient, _parse_quote, _parse_trade
+
+
+def _output(payload: bytes) -> simdjson.Object:
+    return simdjson.Parser().parse(payload)["body"]["output"]
+
+
+def test_parse_quote():
+    data = _parse_quote(_output(
+        b'{"body":{"output":{"symb":"AAPL","bidp":"189.12","bidv":"300","askp":"189.15","askv":"120"}}}'
+    ))
+
+    assert data.symbol == "AAPL"
+    assert data.data_type == "H0STCNT0"
+    assert (data.bid_price, data.bid_size) == (189.12, 300)
+    assert (data.ask_price, data.ask_size) == (189.15, 120)
+    assert data.last_price is None
+
+
+def test_parse_quote_defaults_missing_fields_to_zero():
+    data = _parse_quote(_output(b'{"body":{"output":{"symb":"AAPL","bidp":""}}}'))
+
+    assert (data.bid_price, data.bid_size, data.ask_price, data.ask_size) == (0.0, 0, 0.0, 0)
+
+
+def test_parse_trade():
+    data = _parse_trade(_output(
+        b'{"body":{"output":{"symb":"TSLA","last":"251.30","tvol":"15","cvol":"1200345",'
+        b'"diff":"-3.20","rate":"-1.26"}}}'
+    ))
+
+    assert data.symbol == "TSLA"
+    assert data.data_type == "H0STCNI0"
+    assert (data.last_price, data.last_size, data.volume) == (251.30, 15, 1200345)
+    assert (data.change, data.change_rate) == (-3.20, -1.26)
+    assert data.bid_price is None
+
+
+def test_parsers_registered_by_tr_id():
+    assert _REALTIME_PARSERS == {"H0STCNT0": _parse_quote, "H0STCNI0": _parse_trade}
+
+
+class _FakeWebSocket:
+    """보낸 프레임을 기록하고, fail이 설정되면 send에서 연결 종료 예외를 던지는 소켓"""
+
+    def __init__(self, fail: bool = False):
+        self.sent = []
+        self.fail = fail
+
+    async def send(self, frame):
+        await asyncio.sleep(0)
+        if self.fail:
+            raise ConnectionError("connection closed")
+        self.sent.append(frame)
+
+
+def _connected_client(websocket: _FakeWebSocket) -> RealtimeClient:
+    """connect() 없이 연결된 상태의 클라이언트와 송신 태스크 준비"""
+    client = RealtimeClient(auth_service=object())
+    client._connected = client._running = True
+    client._websocket = websocket
+    client._writer_task = asyncio.create_task(client._writer_loop())
+    return client
+
+
+async def test_subscribe_waits_for_frames_to_be_sent():
+    websocket = _FakeWebSocket()
+    client = _connected_client(websocket)
+
+    assert await client.subscribe("AAPL") is True
+
+    assert len(websocket.sent) == 2
+    assert client._subscriptions == {"H0STCNT0:AAPL", "H0STCNI0:AAPL"}
+    client._writer_task.cancel()
+
+
+async def test_subscribe_reports_send_failure():
+    client = _connected_client(_FakeWebSocket(fail=True))
+
+    assert await client.subscribe("AAPL") is False
+
+    assert client._subscriptions == set()
+    client._writer_task.cancel()
+
+
+async def test_frames_queued_across_reconnect_are_sent_on_new_connection():
+    old = _FakeWebSocket()
+    client = _connected_client(old)
+    client._writer_task.cancel()
+    await asyncio.sleep(0)
+
+    # 송신 태스크가 없는 사이(재연결 중)에 들어온 구독 요청은 큐에 남아 대기
+    pending = asyncio.create_task(client.subscribe("TSLA"))
+    await asyncio.sleep(0.01)
+    assert not pending.done()
+
+    new = _FakeWebSocket()
+    client._websocket = new
+    client._writer_task = asyncio.create_task(client._writer_loop())
+
+    assert await pending is True
+    assert old.sent == []
+    assert len(new.sent) == 2
+    client._writer_task.cancel()
+
+
+async def test_disconnect_fails_pending_frames():
+    client = _connected_client(_FakeWebSocket())
+    client._writer_task.cancel()
+    await asyncio.sleep(0)
+    client._websocket = None
+
+    pending = asyncio.create_task(client.subscribe("NVDA"))
+    await asyncio.sleep(0.01)
+    await client.disconnect()
+
+    assert await pending is False
+    assert client._send_queue.empty()
+
+
+async def test_subscribe_times_out_without_writer(monkeypatch):
+    client = _connected_client(_FakeWebSocket())
+    client._writer_task.cancel()
+    monkeypatch.setattr(RealtimeClient, "SEND_TIMEOUT", 0.01)
+
+    assert await client.subscribe("MSFT") is False
@@ -0,0 +1,49 @@
+"""
+core.security 단위 테스트 (EncryptionService)
+"""
+
+import base64
+
+import pytest
+from cryptography.exceptions import InvalidTag
+
+from app.backend.core.security import EncryptionService
+
+KEY = b"0123456789abcdef0123456789abcdef"
+
+
+@pytest.fixture
+def service() -> EncryptionService:
+    return EncryptionService(KEY)
+
+
+@pytest.mark.parametrize("plaintext", ["", "12345678-01", "계좌 비밀번호 🔐" * 10])
+def test_encrypt_decrypt_round_trip(service, plaintext):
+    token = service.encrypt(plaintext)
+
+    assert token != plaintext
+    assert service.decrypt(token) == plaintext
+
+
+def test_encrypt_uses_unique_nonce(service):
+    tokens = [service.encrypt("same plaintext") for _ in range(1000)]
+    nonces = {base64.b64decode(token)[:EncryptionService.NONCE_SIZE] for token in tokens}
+
+    assert len(nonces) == len(tokens)
+    assert len(set(tokens)) == len(tokens)
+
+
+def test_decrypt_with_other_key_fails(service):
+    token = service.encrypt("secret")
+    other = EncryptionService(b"f" * 32)
+
+    with pytest.raises(InvalidTag):
+        other.decrypt(token)
+
+
+def test_decrypt_rejects_tampered_ciphertext(service):
+    data = bytearray(base64.b64decode(service.encrypt("secret")))
+    data[-1] ^= 0x01
+
+    with pytest.raises(InvalidTag):
+        service.decrypt(base64.b64encode(bytes(data)).decode("ascii"))